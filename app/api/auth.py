@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_async_db
 from app.schemas.auth import SignupRequest, LoginRequest, TokenResponse
 from app.schemas.user import UserResponse
 from app.services.auth_service import signup_user, login_user
@@ -9,11 +9,11 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post("/signup", response_model=UserResponse)
-def signup(data: SignupRequest, db: Session = Depends(get_db)):
-    return signup_user(db, data.name, data.email, data.password)
+async def signup(data: SignupRequest, db: AsyncSession = Depends(get_async_db)):
+    return await signup_user(db, data.name, data.email, data.password)
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(data: LoginRequest, db: Session = Depends(get_db)):
-    token = login_user(db, data.email, data.password)
+async def login(data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+    token = await login_user(db, data.email, data.password)
     return {"access_token": token}
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Dict
 
@@ -6,9 +6,15 @@ from app.db.database import get_db
 from app.models.resume import Resume
 from app.models.job_posting import JobPosting  # Your job model
 from app.models.job_match import JobMatch
-from app.services.job_matcher import match_resume_with_jobs, save_job_matches
+from app.services.job_matcher import (
+    match_job_with_catalog, match_resume_with_catalog, save_job_matches, resume_match_data
+)
+from app.services.resume_embedding_store import load_resume_catalog
+from app.services.job_embedding_store import load_job_catalog
+from app.services.catalog_version import get_catalog_version
+from app.services.match_cache import match_cache, match_cache_key
 from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.services.principal_cache import UserPrincipal
 
 router = APIRouter(
     prefix="/match",
@@ -22,7 +28,7 @@ def match_resume_to_jobs(
     top_n: int = 5,
     threshold: float = 0.6,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
     """
     Match a resume to jobs and save top N matches to the DB.
@@ -37,28 +43,80 @@ def match_resume_to_jobs(
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
 
+    # Results only change when the job catalog does
+    cache_key = match_cache_key(
+        resume_id, get_catalog_version(db), top_n, threshold
+    )
+    cached = match_cache.get(cache_key)
+    if cached is not None:
+        # Identical matches were already saved when this entry was computed
+        return {"matched_jobs": cached, "cached": True}
+
     # Prepare resume data for matching
-    resume_data: Dict = {
-        "skills": resume.skills.split(",") if resume.skills else [],
-        "experience": resume.experience or "",
-        "education": resume.education or ""
-    }
+    resume_data: Dict = resume_match_data(resume.analysis_result)
 
-    # Fetch all jobs from DB
-    jobs: List[JobPosting] = db.query(JobPosting).all()
-    if not jobs:
-        return {"matched_jobs": []}
+    # Stored job vectors as normalized matrices (cached per process)
+    catalog = load_job_catalog(db)
+    if len(catalog) == 0:
+        return {"matched_jobs": [], "cached": False}
 
     # Step 1: Compute weighted matches
-    matched_jobs = match_resume_with_jobs(
+    matched_jobs = match_resume_with_catalog(
+        db=db,
         resume_data=resume_data,
-        jobs=jobs,
+        catalog=catalog,
         top_n=top_n,
         threshold=threshold
     )
 
     # Step 2: Save matches to DB
     save_job_matches(db=db, resume_id=resume_id, matched_jobs=matched_jobs)
+    match_cache.set(cache_key, matched_jobs)
 
     # Return the matches
-    return {"matched_jobs": matched_jobs}
+    return {"matched_jobs": matched_jobs, "cached": False}
+
+
+@router.get("/job/{job_id}")
+def match_job_to_resumes(
+    job_id: int,
+    limit: int = Query(10, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    threshold: float = 0.6,
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """
+    Rank stored resumes for a job (best candidates first). Details are
+    returned only for the caller's own resumes; others are resume_id and
+    score.
+
+    Parameters:
+    - job_id: ID of the job posting
+    - limit / offset: page of the ranking to return
+    - threshold: minimum similarity score to consider
+    """
+    job = db.query(JobPosting).filter(JobPosting.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    # Stored resume vectors as normalized matrices (cached per process)
+    catalog = load_resume_catalog(db)
+
+    candidates, total = match_job_with_catalog(
+        db=db,
+        job=job,
+        catalog=catalog,
+        limit=limit,
+        offset=offset,
+        threshold=threshold,
+        viewer_id=current_user.id
+    )
+
+    return {
+        "job_id": job_id,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "candidates": candidates
+    }
@@ -1,24 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException
+import hashlib
+import io
+from typing import List, Optional
+
+from fastapi import (
+    APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
+)
+from sqlalchemy import and_, func, literal, or_
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
 from app.models.job_posting import JobPosting
-from app.schemas.job import JobCreateRequest, JobResponse
-from app.services.job_matcher import match_resume_with_jobs
-from app.schemas.match import JobMatchRequest, JobMatchResponse
+from app.models.job_match import JobMatch
+from app.models.job_match_history import JobMatchHistory
+from app.schemas.job import JobCreateRequest, JobListItem, JobResponse
+from app.services.job_embedding_store import upsert_job_embedding, record_vectors
+from app.services.ann_index import index_job, unindex_job
+from app.services.match_worker import enqueue_job_matching
+from app.services.job_import import detect_format, import_jobs
+from app.services.catalog_version import bump_catalog_version, get_catalog_state
 from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.utils.http_cache import http_date, is_not_modified
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.services.principal_cache import UserPrincipal
 
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
+
+def _escape_like(value: str) -> str:
+    """Match % and _ in user input literally (escape character: backslash)"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 # CREATE JOB
 
 @router.post("/create", response_model=JobResponse)
 def create_job(
     job: JobCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
     job_entity = JobPosting(
         job_title=job.job_title,
@@ -27,9 +46,18 @@ def create_job(
     )
 
     db.add(job_entity)
+    db.flush()
+
+    # Embed once at write time so matching never re-encodes this job;
+    # the job, its vectors and the new catalog version commit together
+    record = upsert_job_embedding(db, job_entity, commit=False)
+    bump_catalog_version(db)
     db.commit()
     db.refresh(job_entity)
 
+    index_job(job_entity.id, *record_vectors(record))
+    enqueue_job_matching([job_entity.id])
+
     return {
         "id": job_entity.id,
         "job_title": job_entity.job_title,
@@ -38,21 +66,195 @@ def create_job(
         "posted_date": job_entity.posted_date
     }
 
-# LIST ALL JOBS
-
-@router.get("/list", response_model=list[JobResponse])
-def list_jobs(db: Session = Depends(get_db)):
-    jobs = db.query(JobPosting).order_by(JobPosting.posted_date.desc()).all()
-
-    return [
-        {
-            "id": j.id,
-            "job_title": j.job_title,
-            "skills": j.skills.split(","),
-            "description": j.description,
-            "posted_date": j.posted_date
-        }
-        for j in jobs
+# BULK IMPORT (JSON Lines / CSV)
+
+@router.post("/bulk-import")
+def bulk_import_jobs(
+    file: UploadFile = File(...),
+    batch_size: int = Query(None, ge=1, le=5000),
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """
+    Upsert jobs from a .jsonl or .csv feed by external_key.
+    Rows need external_key, job_title, skills and description; CSV skills
+    are separated by ';', '|' or ','. Returns counts, rows per second and
+    the rows that failed.
+    """
+    try:
+        fmt = detect_format(file.filename)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    file.file.seek(0)
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        report = import_jobs(db, stream, fmt, batch_size=batch_size)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Import file must be UTF-8")
+    finally:
+        stream.detach()
+
+    return report.as_dict()
+
+
+# UPDATE JOB
+
+@router.put("/{job_id}", response_model=JobResponse)
+def update_job(
+    job_id: int,
+    job: JobCreateRequest,
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    job_entity = db.query(JobPosting).filter(JobPosting.id == job_id).first()
+    if not job_entity:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    job_entity.job_title = job.job_title
+    job_entity.skills = ",".join(job.skills)
+    job_entity.description = job.description
+    job_entity.matched_at = None
+
+    record = upsert_job_embedding(db, job_entity, commit=False)
+    bump_catalog_version(db)
+    db.commit()
+    db.refresh(job_entity)
+
+    index_job(job_entity.id, *record_vectors(record))
+    enqueue_job_matching([job_entity.id])
+
+    return {
+        "id": job_entity.id,
+        "job_title": job_entity.job_title,
+        "skills": job_entity.skills.split(","),
+        "description": job_entity.description,
+        "posted_date": job_entity.posted_date
+    }
+
+# LIST JOBS
+
+LIST_FIELDS = ("job_title", "skills", "description", "posted_date")
+
+
+@router.get(
+    "/list",
+    response_model=list[JobListItem],
+    response_model_exclude_unset=True
+)
+def list_jobs(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    before: Optional[str] = None,
+    skill: Optional[List[str]] = Query(None),
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Newest jobs first, one keyset page at a time.
+
+    - before: X-Next-Cursor from the previous page
+    - skill: only jobs listing this skill (repeat for all of several)
+    - fields: comma-separated subset of job_title, skills, description,
+      posted_date (id is always returned)
+
+    Responses carry ETag / Last-Modified from the job catalog version, so
+    conditional requests get a 304 until a job is created, edited or deleted.
+    """
+    selected = LIST_FIELDS
+    if fields:
+        selected = tuple(f.strip() for f in fields.split(",") if f.strip())
+        unknown = set(selected) - set(LIST_FIELDS)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+            )
+
+    # Validators first: a 304 never touches JobPostings
+    state = get_catalog_state(db)
+    version = state.version if state else 0
+    last_modified = state.updated_at if state else None
+    query_hash = hashlib.sha1(str(request.url.query).encode("utf-8")).hexdigest()[:16]
+    etag = f'W/"jobs-{version}-{query_hash}"'
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    columns = [JobPosting.id, JobPosting.posted_date] + [
+        getattr(JobPosting, f) for f in selected if f != "posted_date"
     ]
+    query = db.query(*columns)
+
+    for name in skill or []:
+        # skills is stored comma-joined; match whole entries only
+        padded = func.lower(literal(",") + JobPosting.skills + literal(","))
+        query = query.filter(
+            padded.like(f"%,{_escape_like(name.strip().lower())},%", escape="\\")
+        )
+
+    if before:
+        try:
+            posted_date, job_id = decode_cursor(before)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(
+            or_(
+                JobPosting.posted_date < posted_date,
+                and_(JobPosting.posted_date == posted_date, JobPosting.id < job_id)
+            )
+        )
+
+    # Served by ix_job_postings_posted_id; one extra row detects a next page
+    rows = (
+        query
+        .order_by(JobPosting.posted_date.desc(), JobPosting.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = encode_cursor(rows[-1].posted_date, rows[-1].id)
+
+    response.headers.update(headers)
+
+    jobs = []
+    for row in rows:
+        job = {"id": row.id}
+        for name in selected:
+            value = getattr(row, name)
+            job[name] = value.split(",") if name == "skills" else value
+        jobs.append(job)
+
+    return jobs
+
+
+# DELETE / EXPIRE JOB
+
+@router.delete("/{job_id}")
+def delete_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    job_entity = db.query(JobPosting).filter(JobPosting.id == job_id).first()
+    if not job_entity:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    for table in (JobMatch, JobMatchHistory):
+        db.query(table).filter(table.job_id == job_id).delete(
+            synchronize_session=False
+        )
+    db.delete(job_entity)
+    bump_catalog_version(db)
+    db.commit()
 
+    unindex_job(job_id)
 
+    return {"deleted": job_id}
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.core.dependencies import require_metrics_token
+from app.services.embedding_cache import embedding_cache
+from app.services.match_cache import match_cache
+from app.services.principal_cache import principal_cache
+from app.utils.metrics import registry
+
+
+router = APIRouter(tags=["System"])
+
+
+def _cache_metrics():
+    """Hit / miss counters the caches already keep, read at scrape time"""
+    embedding = embedding_cache.stats()
+    match = match_cache.stats()
+    principal = principal_cache.stats()
+
+    yield "skillsync_cache_hits_total", "counter", "Cache hits by cache and tier", [
+        ({"cache": "embedding", "tier": "memory"}, embedding["hits"]),
+        ({"cache": "embedding", "tier": "disk"}, embedding["disk_hits"]),
+        ({"cache": "match", "tier": "memory"}, match["hits"]),
+        ({"cache": "match", "tier": "shared"}, match["shared_hits"]),
+        ({"cache": "principal", "tier": "memory"}, principal["hits"]),
+    ]
+    yield "skillsync_cache_misses_total", "counter", "Cache misses by cache", [
+        ({"cache": "embedding"}, embedding["misses"]),
+        ({"cache": "match"}, match["misses"]),
+        ({"cache": "principal"}, principal["misses"]),
+    ]
+    yield "skillsync_cache_entries", "gauge", "Entries held in memory by cache", [
+        ({"cache": "embedding"}, embedding["entries"]),
+        ({"cache": "match"}, match["entries"]),
+        ({"cache": "principal"}, principal["entries"]),
+    ]
+
+
+registry.add_collector(_cache_metrics)
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+    dependencies=[Depends(require_metrics_token)]
+)
+def metrics():
+    """Prometheus scrape endpoint (text format 0.0.4), see METRICS_TOKEN"""
+    return PlainTextResponse(
+        registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
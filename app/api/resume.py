@@ -1,29 +1,61 @@
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
+import asyncio
 import os
-import shutil
+import time
+from typing import Optional
 
 from app.db.database import get_db
 from app.models.resume import Resume
+from app.models.analysis_job import AnalysisJob
 from app.models.job_posting import JobPosting
-from app.services.resume_parser import parse_resume, extract_text_from_file
-from app.services.job_matcher import match_resume_with_jobs, get_match_history
+from app.services.job_matcher import get_match_history
+from app.services.worker_pool import run_in_pool
+from app.services.analysis_tasks import match_stored_resume, parse_and_match_resume
+from app.services.analysis_queue import (
+    analysis_response, analysis_status, enqueue_analysis, save_analyzed_resume
+)
+from app.services.bulk_ingest import register_import, get_import, start_archive_import
+from app.utils.file_handler import save_resume_file, store_resume_file
+from app.utils.metrics import DOCUMENTS, record_stage_timings
 from app.schemas.resume import ResumeResponse
 from app.core.config import UPLOAD_DIR
 from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.services.principal_cache import UserPrincipal
 
 
 router = APIRouter(prefix="/resume", tags=["Resume Analysis"])
 
 
 # ---------- Upload and Analyze Resume ----------
-@router.post("/upload-analyze", response_model=ResumeResponse)
+def _store_analysis(db: Session, user_id: int, file_path: str, content_hash, result) -> Resume:
+    """Insert the analyzed resume in one threadpool hop; records "persist" timing"""
+    start = time.perf_counter()
+    resume = save_analyzed_resume(db, user_id, file_path, content_hash, result)
+    db.commit()
+    db.refresh(resume)
+    result[2]["persist"] = round((time.perf_counter() - start) * 1000, 2)
+    return resume
+
+
+@router.post(
+    "/upload-analyze",
+    response_model=ResumeResponse,
+    responses={202: {"description": "Queued; poll the returned status_url"}}
+)
 async def upload_and_analyze_resume(
     file: UploadFile = File(...),
+    background: bool = False,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
+    """
+    Store and analyze a resume. With background=true only the file is
+    stored here: the analysis is queued and 202 is returned with a job ID
+    to poll at GET /resume/analysis-jobs/{job_id}.
+    """
     # Validate file type
     if not file.filename.lower().endswith((".pdf", ".docx")):
         raise HTTPException(
@@ -31,62 +63,126 @@ async def upload_and_analyze_resume(
             detail="Only PDF or DOCX files are allowed"
         )
 
-    # Ensure upload directory exists
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
-    file_path = os.path.join(UPLOAD_DIR, file.filename)
+    # Stream the upload to content-addressed storage, hashing it on the way
+    file_path, content_hash = await run_in_threadpool(store_resume_file, file, UPLOAD_DIR)
 
-    # Save file
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    if background:
+        queued = await run_in_threadpool(
+            enqueue_analysis, db, current_user.id, file_path, content_hash,
+            top_n=5, threshold=0.6
+        )
+        return JSONResponse(
+            status_code=202,
+            content={
+                **queued,
+                "status_url": f"/resume/analysis-jobs/{queued['job_id']}"
+            }
+        )
 
-    # Extract resume text
-    resume_text = extract_text_from_file(file_path)
+    # Both paths run in the worker pool, so pdfminer / spaCy / the encoder
+    # and the job catalog stay out of the API process
+    try:
+        # A file seen before reuses its stored parse and section vectors
+        result = await run_in_pool(
+            match_stored_resume, content_hash, top_n=5, threshold=0.6
+        )
 
-    # Parse resume
-    parsed_data = parse_resume(file_path)
+        # Otherwise extract once and parse + match
+        if result is None:
+            result = await run_in_pool(
+                parse_and_match_resume, file_path,
+                top_n=5, threshold=0.6, content_hash=content_hash
+            )
+    except asyncio.TimeoutError:
+        DOCUMENTS.inc(source="upload", outcome="timeout")
+        raise HTTPException(
+            status_code=504,
+            detail="Resume analysis timed out"
+        )
 
-    # Store resume in DB FIXED
-    resume = Resume(
-        user_id=current_user.id,   # JWT-based user
-        file_path=file_path,
-        analysis_result=parsed_data
+    resume = await run_in_threadpool(
+        _store_analysis, db, current_user.id, file_path, content_hash, result
     )
 
-    db.add(resume)
-    db.commit()
-    db.refresh(resume)
+    record_stage_timings(result[2])
+    DOCUMENTS.inc(source="upload", outcome="succeeded")
+
+    return analysis_response(resume, result)
 
-    # AI Job Matching
-    jobs = db.query(JobPosting).all()
-
-    job_matches = match_resume_with_jobs(
-        resume_data={
-            "skills": parsed_data.get("skills", []),
-            "experience": parsed_data.get("experience", ""),
-            "education": parsed_data.get("education", "")
-        },
-        jobs=jobs,
-        top_n=5,
-        threshold=0.6
+
+@router.get("/analysis-jobs/{job_id}")
+def get_analysis_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """Status, current stage and, once succeeded, the analysis result"""
+    job = (
+        db.query(AnalysisJob)
+        .filter(
+            AnalysisJob.id == job_id,
+            AnalysisJob.user_id == current_user.id
+        )
+        .first()
     )
+    if not job:
+        raise HTTPException(status_code=404, detail="Analysis job not found")
+    return analysis_status(job)
 
-    return {
-        "id": resume.id,
-        "file_path": resume.file_path,
-        "upload_date": resume.upload_date,
-        "analysis_result": {
-            **parsed_data,
-            "job_matches": job_matches
-        }
-    }
+
+# ---------- Bulk Import (zip archive) ----------
+@router.post("/bulk-import", status_code=202)
+async def bulk_import_resumes(
+    file: UploadFile = File(...),
+    match: bool = False,
+    top_n: int = 5,
+    threshold: float = 0.6,
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """
+    Import a zip of PDF/DOCX resumes in the background.
+    Poll GET /resume/bulk-import/{import_id} for progress and failures.
+    Job matching, if requested, runs once after all files are stored.
+    """
+    if not file.filename.lower().endswith(".zip"):
+        raise HTTPException(
+            status_code=400,
+            detail="Only ZIP archives are allowed"
+        )
+
+    report = await run_in_threadpool(register_import, current_user.id)
+    dest_dir = os.path.join(UPLOAD_DIR, "bulk", report.import_id)
+    zip_path = await run_in_threadpool(save_resume_file, file, dest_dir, "upload.zip")
+
+    start_archive_import(
+        current_user.id, zip_path, dest_dir, report,
+        match=match, top_n=top_n, threshold=threshold
+    )
+
+    return {"import_id": report.import_id, "status": report.status}
+
+
+@router.get("/bulk-import/{import_id}")
+def get_bulk_import_status(
+    import_id: str,
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    report = get_import(db, import_id)
+    if not report or report.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return report.as_dict()
 
 
 # ---------- Get Resume Match History ----------
 @router.get("/{resume_id}/matches")
 def get_resume_match_history(
     resume_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    before: Optional[str] = None,
+    latest_only: bool = False,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
     resume = (
         db.query(Resume)
@@ -100,9 +196,16 @@ def get_resume_match_history(
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    matches = get_match_history(db, resume_id)
+    # before: next_cursor from the previous page
+    try:
+        matches, next_cursor = get_match_history(
+            db, resume_id, limit=limit, before=before, latest_only=latest_only
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
     return {
         "resume_id": resume_id,
-        "matches": matches
+        "matches": matches,
+        "next_cursor": next_cursor
     }
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends
+
+from app.core.dependencies import get_current_user
+from app.core.security import hash_pool_stats
+from app.db.database import pool_stats
+from app.services.analysis_queue import analysis_queue
+from app.services.embedding_service import get_embedding_stats
+from app.services.embedding_cache import embedding_cache
+from app.services.match_cache import match_cache
+from app.services.match_worker import match_worker
+from app.services.principal_cache import UserPrincipal, principal_cache
+
+
+router = APIRouter(prefix="/system", tags=["System"])
+
+
+@router.get("/stats")
+def system_stats(current_user: UserPrincipal = Depends(get_current_user)):
+    """Runtime statistics for sizing workers and queues"""
+    return {
+        "embedding": get_embedding_stats(),
+        "embedding_cache": embedding_cache.stats(),
+        "match_cache": match_cache.stats(),
+        "match_worker": match_worker.stats(),
+        "analysis_queue": analysis_queue.stats(),
+        "database_pools": pool_stats(),
+        "auth": {
+            "principal_cache": principal_cache.stats(),
+            "password_hashing": hash_pool_stats()
+        }
+    }
@@ -7,16 +7,148 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
 
+    # Database. Any SQLAlchemy URL works, e.g. "sqlite:///./skillsync.db"
+    # as a local stand-in. DATABASE_ASYNC_URL ("" = derived from
+    # DATABASE_URL: aioodbc / aiosqlite / asyncpg) backs get_async_db
+    # (the async auth routes).
+    # Pool sizes are per process: each worker gets DB_POOL_SIZE connections
+    # plus up to DB_MAX_OVERFLOW more, waiting DB_POOL_TIMEOUT seconds.
+    DATABASE_URL: str = (
+        "mssql+pyodbc://Your Database Name"
+        "?driver=ODBC+Driver+17+for+SQL+Server"
+        "&trusted_connection=yes"
+    )
+    DATABASE_ASYNC_URL: str = ""
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Authenticated users are resolved from a per-process cache keyed by
+    # token subject for AUTH_USER_CACHE_TTL_SECONDS (0 disables the cache).
+    # bcrypt runs in a dedicated pool of AUTH_HASH_WORKERS threads; logins
+    # beyond AUTH_HASH_MAX_PENDING queued hashes get 503 (0 = no limit).
+    AUTH_USER_CACHE_SIZE: int = 10000
+    AUTH_USER_CACHE_TTL_SECONDS: float = 60.0
+    AUTH_HASH_WORKERS: int = 4
+    AUTH_HASH_MAX_PENDING: int = 64
+
+    # Prometheus scrapes GET /metrics with "Authorization: Bearer
+    # <METRICS_TOKEN>"; with no token set the endpoint is disabled (404)
+    METRICS_TOKEN: str = ""
+
+    # Sentence embedding model used for resume / job matching
+    EMBEDDING_MODEL_NAME: str = "all-MiniLM-L6-v2"
+
+    # Shared encoder: concurrent single-text requests are coalesced into
+    # batches of up to EMBEDDING_MAX_BATCH_SIZE, waiting at most
+    # EMBEDDING_MAX_WAIT_MS for the batch to fill. Callers give up after
+    # EMBEDDING_RESULT_TIMEOUT_SECONDS
+    EMBEDDING_BATCHING_ENABLED: bool = True
+    EMBEDDING_MAX_BATCH_SIZE: int = 64
+    EMBEDDING_MAX_WAIT_MS: float = 5.0
+    EMBEDDING_RESULT_TIMEOUT_SECONDS: float = 60.0
+
+    # Content-addressed embedding cache: in-memory LRU entries (0 disables)
+    # and an optional SQLite file that survives restarts ("" disables)
+    EMBEDDING_CACHE_SIZE: int = 10000
+    EMBEDDING_CACHE_PATH: str = ""
+
+    # Match results per (resume, parameters, job catalog version):
+    # in-process LRU entries (0 disables) plus an optional shared Redis tier
+    MATCH_CACHE_SIZE: int = 5000
+    MATCH_CACHE_REDIS_URL: str = ""
+    MATCH_CACHE_TTL_SECONDS: int = 3600
+
+    # Keep every score written to JobMatches in the append-only
+    # JobMatchHistory table (JobMatches itself holds only the latest)
+    MATCH_HISTORY_ENABLED: bool = True
+
+    # Background matching of new / changed jobs against stored resumes.
+    # Job IDs wait in a bounded queue; on overflow or restart, jobs with
+    # matched_at = NULL are replayed from the database.
+    MATCH_WORKER_ENABLED: bool = True
+    MATCH_WORKER_QUEUE_SIZE: int = 1000
+    MATCH_WORKER_BATCH_SIZE: int = 64
+    MATCH_WORKER_THRESHOLD: float = 0.6
+
+    # Skill taxonomy JSON ("" = bundled app/data/skill_taxonomy.json)
+    SKILL_TAXONOMY_PATH: str = ""
+
+    # PDF text extraction: "pdfminer" or "pymupdf" (optional, faster).
+    # Pages are read one at a time and extraction stops at the first limit
+    # hit (0 disables a limit). PDF_TIME_BUDGET_SECONDS is checked between
+    # pages only: a single pathological page can overrun it. The hard bound
+    # on request latency is PARSER_TASK_TIMEOUT_SECONDS, after which the
+    # caller gets a timeout while the worker finishes that page.
+    # PDF_FAST_LAYOUT skips pdfminer's reading-order analysis.
+    PDF_BACKEND: str = "pdfminer"
+    PDF_MAX_PAGES: int = 15
+    PDF_MAX_CHARS: int = 100000
+    PDF_TIME_BUDGET_SECONDS: float = 10.0
+    PDF_FAST_LAYOUT: bool = False
+
+    # spaCy NER (job titles / organizations)
+    SPACY_MODEL: str = "en_core_web_sm"
+    NER_BATCH_SIZE: int = 32
+    NER_N_PROCESS: int = 1
+    NER_MAX_CHUNK_CHARS: int = 5000
+
+    # Process pool for CPU-bound resume parsing / matching (0 = thread pool)
+    PARSER_POOL_SIZE: int = 2
+    PARSER_TASK_TIMEOUT_SECONDS: float = 60.0
+    PARSER_MAX_TASKS_PER_CHILD: int = 200
+
+    # Bulk job import (JSON Lines / CSV): rows per transaction
+    JOB_IMPORT_BATCH_SIZE: int = 500
+
+    # Bulk resume import (zip upload / CLI). Parsing, NER, embedding and
+    # matching run in chunks on the parser pool (PARSER_POOL_SIZE).
+    # Imports that renew no progress for BULK_INGEST_LEASE_SECONDS are
+    # marked failed (their process was restarted or killed).
+    BULK_INGEST_BATCH_SIZE: int = 100
+    BULK_INGEST_LEASE_SECONDS: float = 600.0
+    # Zip archive limits, checked against the declared sizes before
+    # extraction and against the bytes actually written during it
+    BULK_INGEST_MAX_FILES: int = 10000
+    BULK_INGEST_MAX_FILE_BYTES: int = 20 * 1024 * 1024
+    BULK_INGEST_MAX_TOTAL_BYTES: int = 2 * 1024 * 1024 * 1024
+
+    # Background resume analysis (upload-analyze?background=true): jobs are
+    # persisted in AnalysisJobs and consumed by ANALYSIS_QUEUE_WORKERS
+    # threads per process (0 = no consumer in this process). Failed runs
+    # are retried with exponential backoff up to ANALYSIS_QUEUE_MAX_ATTEMPTS.
+    ANALYSIS_QUEUE_WORKERS: int = 2
+    ANALYSIS_QUEUE_MAX_ATTEMPTS: int = 3
+    ANALYSIS_QUEUE_RETRY_BASE_SECONDS: float = 5.0
+    ANALYSIS_QUEUE_RETRY_MAX_SECONDS: float = 300.0
+    ANALYSIS_QUEUE_LEASE_SECONDS: float = 600.0
+    ANALYSIS_QUEUE_POLL_SECONDS: float = 1.0
+
+    # Job retrieval: "exact" scans the whole catalog, "hnsw" uses an
+    # approximate index (needs hnswlib) followed by exact rescoring
+    MATCH_INDEX_MODE: str = "exact"
+    ANN_M: int = 16
+    ANN_EF_CONSTRUCTION: int = 200
+    ANN_EF_SEARCH: int = 128
+    ANN_CANDIDATES: int = 200
+
+    # Job catalog storage per process: "float32", "float16" (half the
+    # memory, but slower scans: NumPy converts float16 slowly) or "int8" (a
+    # quarter, one scale per row, faster scans). Quantized catalogs rank
+    # approximately; the best CATALOG_RESCORE_CANDIDATES jobs are then
+    # rescored with the float32 vectors from JobEmbeddings (0 = no rescoring).
+    # Measure with app/scripts/evaluate_catalog_storage.py
+    CATALOG_STORAGE: str = "float32"
+    CATALOG_RESCORE_CANDIDATES: int = 50
+
     class Config:
         env_file = ".env"
 
 
 settings = Settings()
 
-DATABASE_URL = (
-    "mssql+pyodbc://Your Database Name"
-    "?driver=ODBC+Driver+17+for+SQL+Server"
-    "&trusted_connection=yes"
-)
+DATABASE_URL = settings.DATABASE_URL
 
 UPLOAD_DIR = "uploads"
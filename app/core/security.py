@@ -1,4 +1,8 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from fastapi import HTTPException, status
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
@@ -18,6 +22,55 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+# ---------- Off-loop Hashing ----------
+# bcrypt is deliberately slow (~100 ms); it runs in its own small pool so a
+# burst of logins can neither block the event loop nor take every thread of
+# the shared threadpool that sync routes and dependencies run in.
+_hash_pool = ThreadPoolExecutor(
+    max_workers=max(1, settings.AUTH_HASH_WORKERS),
+    thread_name_prefix="bcrypt"
+)
+_pending = 0
+_pending_lock = threading.Lock()
+
+
+async def _run_hash(fn, *args):
+    global _pending
+    with _pending_lock:
+        if 0 < settings.AUTH_HASH_MAX_PENDING <= _pending:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many authentication requests, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        _pending += 1
+
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_pool, fn, *args)
+    finally:
+        with _pending_lock:
+            _pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hash(hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await _run_hash(verify_password, plain, hashed)
+
+
+def hash_pool_stats() -> dict:
+    with _pending_lock:
+        pending = _pending
+    return {
+        "workers": _hash_pool._max_workers,
+        "pending": pending,
+        "max_pending": settings.AUTH_HASH_MAX_PENDING
+    }
+
+
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
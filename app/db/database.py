@@ -1,11 +1,113 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from app.core.config import DATABASE_URL
+from sqlalchemy.pool import StaticPool
+from app.core.config import DATABASE_URL, settings
+from app.db.pool_monitor import MonitoredAsyncQueuePool, MonitoredQueuePool, PoolMonitor
+from app.utils.metrics import DB_COMMIT_SECONDS, DB_QUERY_SECONDS
+
+try:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+except ImportError:  # needs greenlet; used by get_async_db
+    create_async_engine = None
+
+
+# ---------- Engine Setup ----------
+# Async drivers for the sync URLs this app is deployed with
+_ASYNC_DRIVERS = {
+    "mssql": "mssql+aioodbc",
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg"
+}
+
+
+def _is_memory_sqlite(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def _engine_options(url, poolclass) -> Dict:
+    """Pool settings from Settings; in-memory SQLite needs one shared connection"""
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        if _is_memory_sqlite(url):
+            options["poolclass"] = StaticPool
+            return options
+
+    options.update(
+        poolclass=poolclass,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS
+    )
+    return options
+
+
+def async_database_url() -> str:
+    if settings.DATABASE_ASYNC_URL:
+        return settings.DATABASE_ASYNC_URL
+
+    url = make_url(DATABASE_URL)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise RuntimeError(
+            f"No async driver known for {url.get_backend_name()}; set DATABASE_ASYNC_URL"
+        )
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+_sync_url = make_url(DATABASE_URL)
+engine = create_engine(_sync_url, **_engine_options(_sync_url, MonitoredQueuePool))
+engine.pool.monitor = PoolMonitor("sync")
 
-engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+# ---------- Query / Commit Timing ----------
+_OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE", "MERGE")
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _record_query_time(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    DB_QUERY_SECONDS.observe(
+        time.perf_counter() - started,
+        operation=verb.lower() if verb in _OPERATIONS else "other"
+    )
+
+
+@event.listens_for(engine, "handle_error")
+def _drop_query_timer(context):
+    # Failed statements never reach after_cursor_execute
+    if context.connection is not None and context.connection.info.get("query_started"):
+        context.connection.info["query_started"].pop()
+
+
+@event.listens_for(Session, "before_commit")
+def _start_commit_timer(session):
+    session.info["commit_started"] = time.perf_counter()
+
+
+@event.listens_for(Session, "after_commit")
+def _record_commit_time(session):
+    started = session.info.pop("commit_started", None)
+    if started is not None:
+        DB_COMMIT_SECONDS.observe(time.perf_counter() - started)
+
+
 Base = declarative_base()
 
 
@@ -15,4 +117,60 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# ---------- Async Sessions ----------
+_async_lock = threading.Lock()
+_async = {"engine": None, "sessionmaker": None}
+
+
+def get_async_engine():
+    """Created on first use, so the async driver is only needed by code that uses it"""
+    with _async_lock:
+        if _async["engine"] is None:
+            if create_async_engine is None:
+                raise RuntimeError("Async sessions require SQLAlchemy's asyncio extension (greenlet)")
+
+            url = make_url(async_database_url())
+            try:
+                async_engine = create_async_engine(
+                    url, **_engine_options(url, MonitoredAsyncQueuePool)
+                )
+            except ImportError as exc:
+                raise RuntimeError(
+                    f"The async driver for {url.drivername} is not installed ({exc})"
+                ) from exc
+            async_engine.sync_engine.pool.monitor = PoolMonitor("async")
+
+            _async["engine"] = async_engine
+            _async["sessionmaker"] = async_sessionmaker(
+                async_engine, expire_on_commit=False, autoflush=False
+            )
+        return _async["engine"]
+
+
+async def get_async_db():
+    """Like get_db, but yields an AsyncSession for async def routes"""
+    get_async_engine()
+    async with _async["sessionmaker"]() as db:
+        yield db
+
+
+async def dispose_async_engine():
+    with _async_lock:
+        async_engine, _async["engine"] = _async["engine"], None
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+def pool_stats() -> Dict:
+    """Checkout waits and utilization of this process's connection pools"""
+    stats = {}
+    for name, current in (("sync", engine), ("async", _async["engine"])):
+        if current is None:
+            continue
+        pool = current.pool if name == "sync" else current.sync_engine.pool
+        monitor = getattr(pool, "monitor", None) or PoolMonitor(name)
+        stats[name] = monitor.stats(pool)
+    return stats
@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import numpy as np
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+
+# ---------- Checkout Statistics ----------
+class PoolMonitor:
+    """Checkout wait times of one connection pool (recent window + totals)"""
+
+    def __init__(self, name: str, window: int = 1000):
+        self.name = name
+        self._waits = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            self._waits.append(seconds)
+
+    def stats(self, pool) -> Dict:
+        with self._lock:
+            waits = np.asarray(self._waits, dtype=np.float64) * 1000
+            result = {
+                "pool": type(pool).__name__,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": round(self.total_wait * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_ms_p50": round(float(np.percentile(waits, 50)), 3) if len(waits) else 0.0,
+                "wait_ms_p95": round(float(np.percentile(waits, 95)), 3) if len(waits) else 0.0,
+                "wait_ms_max": round(self.max_wait * 1000, 3)
+            }
+
+        if isinstance(pool, QueuePool):
+            capacity = pool.size() + max(pool._max_overflow, 0)
+            result.update({
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "utilization": round(pool.checkedout() / capacity, 4) if capacity else None
+            })
+        return result
+
+
+# ---------- Instrumented Pools ----------
+class _MonitoredPoolMixin:
+    """Times every checkout from the queue, including waits for a free slot"""
+
+    monitor: Optional[PoolMonitor] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self.monitor is not None:
+                self.monitor.record(time.perf_counter() - started, timed_out=True)
+            raise
+        if self.monitor is not None:
+            self.monitor.record(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep counting into the same monitor
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        return pool
+
+
+class MonitoredQueuePool(_MonitoredPoolMixin, QueuePool):
+    pass
+
+
+class MonitoredAsyncQueuePool(_MonitoredPoolMixin, AsyncAdaptedQueuePool):
+    pass
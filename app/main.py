@@ -1,15 +1,30 @@
-from fastapi import FastAPI
+import time
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.db.database import engine
+from app.db.database import SessionLocal, dispose_async_engine, engine
 from app.db.base import Base
-from app.models import user, resume, job_posting, job_match
+from app.models import (
+    user, resume, job_posting, job_match, job_embedding, parsed_resume,
+    job_catalog_state, resume_embedding, job_match_history, analysis_job,
+    bulk_import
+)
 
 # Import routers correctly
 from app.api.auth import router as auth_router
 from app.api.jobs import router as jobs_router
 from app.api.resume import router as resume_router
 from app.api.job_matching_api import router as job_matching_router
+from app.api.system import router as system_router
+from app.api.metrics import router as metrics_router
+from app.services.worker_pool import shutdown_pool
+from app.services.match_worker import match_worker
+from app.services.analysis_queue import analysis_queue
+from app.services.bulk_ingest import fail_stale_imports
+from app.services.catalog_version import ensure_catalog_state
+from app.core.config import settings
+from app.utils.metrics import HTTP_REQUESTS, HTTP_SECONDS
 
 
 # Create DB tables
@@ -24,10 +39,76 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified", "X-Next-Cursor"],
 )
 
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Latency and count per route template (/resume/{resume_id}/matches, ...)"""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Set by the router once matched; templates keep label cardinality bounded
+        route = request.scope.get("route")
+        template = getattr(route, "path", None) or "<unmatched>"
+        HTTP_SECONDS.observe(time.perf_counter() - start, method=request.method, route=template)
+        HTTP_REQUESTS.inc(method=request.method, route=template, status=str(status))
+
+
+@app.on_event("startup")
+def seed_catalog_state():
+    # Job writes then only UPDATE the row, never race to INSERT it
+    db = SessionLocal()
+    try:
+        ensure_catalog_state(db)
+    finally:
+        db.close()
+
+
+@app.on_event("startup")
+def recover_bulk_imports():
+    # Imports whose process died would otherwise stay "running" forever
+    db = SessionLocal()
+    try:
+        fail_stale_imports(db)
+    finally:
+        db.close()
+
+
+@app.on_event("startup")
+def start_match_worker():
+    # Also replays jobs left unmatched by downtime or queue overflow
+    if settings.MATCH_WORKER_ENABLED:
+        match_worker.start(replay=True)
+
+
+@app.on_event("startup")
+def start_analysis_queue():
+    # Picks up jobs queued before a restart as well
+    analysis_queue.start()
+
+
+@app.on_event("shutdown")
+def stop_worker_pool():
+    match_worker.stop()
+    analysis_queue.stop()
+    shutdown_pool()
+
+
+@app.on_event("shutdown")
+async def close_async_engine():
+    await dispose_async_engine()
+
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(resume_router)
 app.include_router(jobs_router)
 app.include_router(job_matching_router)
+app.include_router(system_router)
+app.include_router(metrics_router)
@@ -0,0 +1,45 @@
+from sqlalchemy import Column, Integer, Float, String, Text, DateTime, ForeignKey, JSON, Index
+from datetime import datetime
+from app.db.base import Base
+
+
+class AnalysisJob(Base):
+    """
+    Queued resume analysis (POST /resume/upload-analyze?background=true),
+    consumed by analysis_queue workers. Status: queued | running |
+    succeeded | failed; stage tracks progress within a run.
+    """
+    __tablename__ = "AnalysisJobs"
+    __table_args__ = (
+        # Claiming: next due queued job
+        Index("ix_analysis_jobs_status_next", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    user_id = Column(Integer, ForeignKey("Users.id"), nullable=False, index=True)
+
+    file_path = Column(String(255), nullable=False)
+    content_hash = Column(String(64), nullable=True)
+
+    top_n = Column(Integer, nullable=False, default=5)
+    threshold = Column(Float, nullable=False, default=0.6)
+
+    status = Column(String(20), nullable=False, default="queued")
+    stage = Column(String(30), nullable=False, default="queued")
+
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow)
+    # Set while running; a lease older than ANALYSIS_QUEUE_LEASE_SECONDS
+    # means the worker died and the job can be claimed again
+    locked_at = Column(DateTime, nullable=True)
+    error = Column(Text, nullable=True)
+
+    timings_ms = Column(JSON, nullable=True)
+    resume_id = Column(Integer, ForeignKey("Resumes.id"), nullable=True)
+    # Same body upload-analyze returns synchronously
+    result = Column(JSON, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
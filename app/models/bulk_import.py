@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, Float, String, Text, DateTime, ForeignKey, JSON
+from datetime import datetime
+from app.db.base import Base
+
+
+class BulkImport(Base):
+    """
+    Progress report of a bulk resume import (POST /resume/bulk-import or
+    the CLI), written by the importing process after every batch so any
+    API worker can answer GET /resume/bulk-import/{import_id}.
+    Status: pending | running | completed | failed.
+    """
+    __tablename__ = "BulkImports"
+
+    id = Column(String(32), primary_key=True)
+
+    user_id = Column(Integer, ForeignKey("Users.id"), nullable=False, index=True)
+
+    status = Column(String(20), nullable=False, default="pending")
+    total = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    succeeded = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    matched = Column(Integer, nullable=False, default=0)
+    # [{"file": ..., "error": ...}, ...]
+    failures = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+
+    elapsed_seconds = Column(Float, nullable=False, default=0.0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    # Renewed with every report write; a running import that stops
+    # renewing it has lost its process
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
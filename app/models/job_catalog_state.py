@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, BigInteger, DateTime
+from datetime import datetime
+from app.db.base import Base
+
+
+class JobCatalogState(Base):
+    """Single-row counter bumped on every JobPosting create / update / delete"""
+    __tablename__ = "JobCatalogState"
+
+    id = Column(Integer, primary_key=True)
+
+    version = Column(BigInteger, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,30 @@
+from sqlalchemy import (
+    Column, Integer, String, DateTime, ForeignKey, LargeBinary, UniqueConstraint
+)
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.db.base import Base
+
+
+class JobEmbedding(Base):
+    __tablename__ = "JobEmbeddings"
+    __table_args__ = (
+        UniqueConstraint("job_id", "model_name", name="uq_job_embedding_model"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    job_id = Column(Integer, ForeignKey("JobPostings.id"), nullable=False, index=True)
+
+    # Vectors are only valid for the model and content they were computed from
+    model_name = Column(String(100), nullable=False)
+    content_hash = Column(String(64), nullable=False)
+    dimension = Column(Integer, nullable=False)
+
+    # float32 bytes; NULL when the source text was empty
+    skills_vector = Column(LargeBinary, nullable=True)
+    description_vector = Column(LargeBinary, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    job = relationship("JobPosting", back_populates="embeddings")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, Float, ForeignKey, DateTime, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
@@ -6,6 +6,12 @@ from app.db.base import Base
 
 class JobMatch(Base):
     __tablename__ = "JobMatches"
+    __table_args__ = (
+        # One current score per resume / job; older scores live in JobMatchHistory
+        UniqueConstraint("resume_id", "job_id", name="uq_job_match_resume_job"),
+        # Match history: newest first per resume
+        Index("ix_job_matches_resume_created", "resume_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -14,6 +20,7 @@ class JobMatch(Base):
 
     similarity_score = Column(Float, nullable=False)
 
+    # Time of the latest (re)match
     created_at = Column(DateTime, default=datetime.utcnow)
 
     resume = relationship("Resume", back_populates="matches")
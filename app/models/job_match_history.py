@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey, DateTime, Index
+from datetime import datetime
+from app.db.base import Base
+
+
+class JobMatchHistory(Base):
+    """Append-only trail of every score written to JobMatches"""
+    __tablename__ = "JobMatchHistory"
+    __table_args__ = (
+        Index("ix_job_match_history_resume_created", "resume_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    resume_id = Column(Integer, ForeignKey("Resumes.id"), nullable=False)
+    job_id = Column(Integer, ForeignKey("JobPostings.id"), nullable=False, index=True)
+
+    similarity_score = Column(Float, nullable=False)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
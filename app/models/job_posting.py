@@ -1,13 +1,38 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index, text
+from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
 
 
 class JobPosting(Base):
     __tablename__ = "JobPostings"
+    __table_args__ = (
+        # Job listing: keyset pages, newest first
+        Index("ix_job_postings_posted_id", "posted_date", "id"),
+        # Unique among keyed jobs only; jobs created one by one have none
+        Index(
+            "ux_job_postings_external_key",
+            "external_key",
+            unique=True,
+            mssql_where=text("external_key IS NOT NULL"),
+            sqlite_where=text("external_key IS NOT NULL"),
+            postgresql_where=text("external_key IS NOT NULL")
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     job_title = Column(String(150), nullable=False)
     skills = Column(Text, nullable=False)
     description = Column(Text, nullable=False)
+    # Job ID in the source ATS feed; bulk imports upsert on it
+    external_key = Column(String(255), nullable=True)
     posted_date = Column(DateTime, default=datetime.utcnow)
+    # Last time this job was matched against stored resumes; NULL means the
+    # job is new or changed and still waiting for the background matcher
+    matched_at = Column(DateTime, nullable=True, index=True)
+
+    embeddings = relationship(
+        "JobEmbedding",
+        back_populates="job",
+        cascade="all, delete-orphan"
+    )
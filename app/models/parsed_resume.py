@@ -0,0 +1,32 @@
+from sqlalchemy import (
+    Column, Integer, String, DateTime, JSON, LargeBinary, UniqueConstraint
+)
+from datetime import datetime
+from app.db.base import Base
+
+
+class ParsedResume(Base):
+    """Parse result and section embeddings of one resume file, by content hash"""
+    __tablename__ = "ParsedResumes"
+    __table_args__ = (
+        UniqueConstraint("content_hash", "parser_version", name="uq_parsed_resume_version"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # SHA-256 of the uploaded bytes
+    content_hash = Column(String(64), nullable=False, index=True)
+
+    # Entries from an older parser are ignored and re-parsed
+    parser_version = Column(String(20), nullable=False)
+
+    analysis_result = Column(JSON, nullable=False)
+
+    # float32 bytes of the skills / experience / education embeddings;
+    # only valid for model_name, NULL when the section text was empty
+    model_name = Column(String(100), nullable=True)
+    skills_vector = Column(LargeBinary, nullable=True)
+    experience_vector = Column(LargeBinary, nullable=True)
+    education_vector = Column(LargeBinary, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
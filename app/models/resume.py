@@ -13,6 +13,9 @@ class Resume(Base):
 
     file_path = Column(String(255), nullable=False)
 
+    # SHA-256 of the file bytes (see ParsedResume)
+    content_hash = Column(String(64), nullable=True, index=True)
+
     upload_date = Column(DateTime, default=datetime.utcnow)
 
     analysis_result = Column(JSON, nullable=False)
@@ -24,3 +27,8 @@ class Resume(Base):
         back_populates="resume",
         cascade="all, delete-orphan"
     )
+    embeddings = relationship(
+        "ResumeEmbedding",
+        back_populates="resume",
+        cascade="all, delete-orphan"
+    )
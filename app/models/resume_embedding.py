@@ -0,0 +1,29 @@
+from sqlalchemy import (
+    Column, Integer, String, DateTime, ForeignKey, LargeBinary, UniqueConstraint
+)
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.db.base import Base
+
+
+class ResumeEmbedding(Base):
+    __tablename__ = "ResumeEmbeddings"
+    __table_args__ = (
+        UniqueConstraint("resume_id", "model_name", name="uq_resume_embedding_model"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    resume_id = Column(Integer, ForeignKey("Resumes.id"), nullable=False, index=True)
+
+    model_name = Column(String(100), nullable=False)
+    dimension = Column(Integer, nullable=False)
+
+    # float32 bytes; NULL when the section text was empty
+    skills_vector = Column(LargeBinary, nullable=True)
+    experience_vector = Column(LargeBinary, nullable=True)
+    education_vector = Column(LargeBinary, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    resume = relationship("Resume", back_populates="embeddings")
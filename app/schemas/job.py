@@ -1,13 +1,18 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 class JobCreateRequest(BaseModel):    #DTO for creating a job posting
     job_title: str
     skills: List[str]
     description: str
 
-  
+
+class JobImportRow(JobCreateRequest):  #One row of a bulk import, keyed by the ATS job ID
+    external_key: str = Field(min_length=1, max_length=255)
+    job_title: str = Field(min_length=1, max_length=150)
+
+
 class JobResponse(BaseModel):         #DTO for job posting response
     id: int
     job_title: str
@@ -17,3 +22,11 @@ class JobResponse(BaseModel):         #DTO for job posting response
 
     class Config:
         from_attributes = True
+
+
+class JobListItem(BaseModel):         #DTO for /jobs/list rows (fields are projectable)
+    id: int
+    job_title: Optional[str] = None
+    skills: Optional[List[str]] = None
+    description: Optional[str] = None
+    posted_date: Optional[datetime] = None
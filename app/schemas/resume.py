@@ -1,12 +1,13 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 class ResumeResponse(BaseModel):           #DTO for resume data
     id: int
     file_path: str
     upload_date: datetime
     analysis_result: Dict[str, Any]
+    timings_ms: Optional[Dict[str, float]] = None   #Per-stage pipeline timings
 
     class Config:
         from_attributes = True
@@ -0,0 +1,43 @@
+"""
+Compute stored skill/description embeddings for every job posting.
+
+Usage:
+    python -m app.scripts.backfill_job_embeddings [--batch-size 200] [--force]
+"""
+import argparse
+
+from app.db.database import SessionLocal, engine
+from app.db.base import Base
+from app.models import (
+    user, resume, job_posting, job_match, job_embedding, parsed_resume,
+    job_catalog_state, resume_embedding, job_match_history, analysis_job,
+    bulk_import
+)
+from app.services.job_embedding_store import backfill_job_embeddings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill job embeddings")
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-embed every job even if its stored vectors are current"
+    )
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        stats = backfill_job_embeddings(
+            db, batch_size=args.batch_size, force=args.force
+        )
+    finally:
+        db.close()
+
+    print(f"Scanned {stats['scanned']} jobs, embedded {stats['embedded']}")
+
+
+if __name__ == "__main__":
+    main()
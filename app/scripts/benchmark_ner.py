@@ -0,0 +1,114 @@
+"""
+Per-document NER latency and memory: full en_core_web_sm pipeline on the
+whole text (previous behaviour) vs the trimmed, section-chunked pipeline
+and its batched nlp.pipe mode.
+
+Usage:
+    python -m app.scripts.benchmark_ner [--dir resumes/] [--docs 200]
+        [--batch-size 32] [--n-process 1]
+
+Each mode runs in a fresh interpreter so peak RSS is comparable.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+
+def _peak_rss_mib() -> float:
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def load_texts(directory: str, docs: int):
+    if directory:
+        from app.services.resume_parser import extract_text_from_file
+        files = sorted(
+            os.path.join(directory, f) for f in os.listdir(directory)
+            if f.lower().endswith((".pdf", ".docx"))
+        )[:docs]
+        return [extract_text_from_file(f) for f in files]
+
+    rng = random.Random(3)
+    companies = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries",
+                 "Wayne Enterprises", "Hooli", "Pied Piper", "Vandelay Industries"]
+    texts = []
+    for _ in range(docs):
+        lines = ["SUMMARY", "Backend engineer focused on APIs and data pipelines."]
+        lines.append("EXPERIENCE")
+        for _ in range(rng.randint(3, 8)):
+            lines += [rng.choice(companies), f"Software Engineer 20{rng.randint(10, 18)} - 20{rng.randint(19, 24)}",
+                      "Built services with Python, FastAPI and SQL Server for internal teams. " * rng.randint(1, 6)]
+        lines += ["EDUCATION", "Bachelor of Science in Computer Science", "State University 2012"]
+        texts.append("\n".join(lines))
+    return texts
+
+
+def run_mode(mode: str, args) -> dict:
+    texts = load_texts(args.dir, args.docs)
+    rss_before = _peak_rss_mib()
+
+    start = time.perf_counter()
+    if mode == "full":
+        import spacy
+        from app.core.config import settings
+        nlp = spacy.load(settings.SPACY_MODEL)
+        run = lambda t: [e.text for e in nlp(t).ents if e.label_ == "ORG"]
+    else:
+        from app.services.resume_parser import extract_job_titles, extract_job_titles_batch
+        run = extract_job_titles
+    load_s = time.perf_counter() - start
+
+    latencies = []
+    if mode == "batched":
+        start = time.perf_counter()
+        extract_job_titles_batch(texts, batch_size=args.batch_size, n_process=args.n_process)
+        latencies = [(time.perf_counter() - start) / len(texts)] * len(texts)
+    else:
+        for text in texts:
+            start = time.perf_counter()
+            run(text)
+            latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "docs": len(texts),
+        "load_s": round(load_s, 2),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 2),
+        "model_rss_mib": round(_peak_rss_mib() - rss_before, 1),
+        "peak_rss_mib": round(_peak_rss_mib(), 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resume NER")
+    parser.add_argument("--dir", default="", help="Directory of PDF/DOCX resumes")
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--n-process", type=int, default=1)
+    parser.add_argument("--mode", choices=["full", "trimmed", "batched"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args)))
+        return
+
+    for mode in ("full", "trimmed", "batched"):
+        out = subprocess.run(
+            [sys.executable, "-m", "app.scripts.benchmark_ner", "--mode", mode,
+             "--dir", args.dir, "--docs", str(args.docs),
+             "--batch-size", str(args.batch_size), "--n-process", str(args.n_process)],
+            capture_output=True, text=True, check=True
+        )
+        print(out.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,492 @@
+"""
+End-to-end latency benchmark for the resume pipeline against a local
+SQLite database, on synthetic PDF/DOCX resumes and job catalogs.
+
+Timed operations:
+    documents:  extract_text_from_file (pdf, docx), every parse_document
+                stage, section embedding
+    per size:   match_resume_with_jobs, match_resume_with_catalog,
+                save_job_matches, get_match_history
+
+Usage:
+    python -m app.scripts.benchmark_pipeline [--sizes 100,10000,100000]
+        [--docs 40] [--iterations 50] [--slow-iterations 5] [--output bench.json]
+        [--baseline baseline.json] [--tolerance 0.2] [--no-ner] [--keep]
+
+Every phase runs in a fresh interpreter on its own SQLite file, so peak
+RSS is per phase and comparable between runs. Data is generated from
+--seed, so two runs on the same machine time identical work. With
+--baseline, p95 latencies and peak RSS are compared and the exit status
+is 1 when any of them regressed by more than --tolerance.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from datetime import datetime
+from xml.sax.saxutils import escape
+
+
+def _peak_rss_mib() -> float:
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# ---------- Synthetic Documents ----------
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries",
+             "Wayne Enterprises", "Hooli", "Pied Piper", "Vandelay Industries"]
+TITLES = ["Software Engineer", "Backend Developer", "Data Engineer",
+          "Machine Learning Engineer", "DevOps Engineer", "Frontend Developer"]
+SKILLS = ["python", "java", "sql", "fastapi", "django", "react", "docker",
+          "kubernetes", "aws", "azure", "pandas", "spark", "c#", "typescript",
+          "postgresql", "redis", "terraform", "git", "linux", "tensorflow"]
+DEGREES = ["Bachelor of Science in Computer Science", "Master of Science in Data Science",
+           "Bachelor of Engineering in Information Technology", "MBA"]
+
+
+def resume_lines(rng: random.Random):
+    lines = [f"Candidate {rng.randint(1000, 9999)}",
+             "SKILLS", ", ".join(rng.sample(SKILLS, rng.randint(4, 10))),
+             "EXPERIENCE"]
+    for _ in range(rng.randint(2, 6)):
+        start = rng.randint(2008, 2020)
+        lines += [rng.choice(COMPANIES),
+                  f"{rng.choice(TITLES)} {start} - {start + rng.randint(1, 4)}",
+                  f"Built services with {', '.join(rng.sample(SKILLS, 3))} for internal teams."]
+    lines += ["EDUCATION", rng.choice(DEGREES), f"State University {rng.randint(2004, 2018)}"]
+    return lines
+
+
+def write_docx(path: str, lines):
+    """Smallest DOCX docx2txt reads: content types + document.xml"""
+    body = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
+        for line in lines
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" ContentType='
+        '"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", content_types)
+        archive.writestr("word/document.xml", document)
+
+
+def write_pdf(path: str, lines, lines_per_page: int = 45):
+    """Plain single-font PDF written by hand, so no PDF library is needed"""
+    def pdf_string(text):
+        return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    # 1 catalog, 2 page tree, 3 font, then (page, content) per page
+    objects = {3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    for i, page_lines in enumerate(pages):
+        page_id, content_id = 4 + 2 * i, 5 + 2 * i
+        kids.append(f"{page_id} 0 R")
+        text = "BT /F1 11 Tf 14 TL 50 790 Td " + " ".join(
+            f"({pdf_string(line)}) Tj T*" for line in page_lines
+        ) + " ET"
+        stream = text.encode("latin-1", "replace")
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode()
+        objects[content_id] = (
+            f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream"
+        )
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += f"{obj_id} 0 obj\n".encode() + objects[obj_id] + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for obj_id in sorted(objects):
+        out += f"{offsets[obj_id]:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def write_documents(directory: str, docs: int, seed: int):
+    """docs synthetic resumes, alternating PDF and DOCX"""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(docs):
+        lines = resume_lines(rng)
+        if i % 2 == 0:
+            path = os.path.join(directory, f"resume_{i:04d}.pdf")
+            write_pdf(path, lines)
+        else:
+            path = os.path.join(directory, f"resume_{i:04d}.docx")
+            write_docx(path, lines)
+        paths.append(path)
+    return paths
+
+
+def job_templates(rng: random.Random, count: int):
+    """(title, skills, description) variants the catalog is drawn from"""
+    templates = []
+    for _ in range(count):
+        skills = rng.sample(SKILLS, rng.randint(3, 7))
+        title = rng.choice(TITLES)
+        description = (
+            f"{title} at {rng.choice(COMPANIES)} working with {', '.join(skills)}. "
+            f"{rng.randint(2, 8)}+ years of experience building production systems."
+        )
+        templates.append((title, ",".join(skills), description))
+    return templates
+
+
+# ---------- Measurement ----------
+class Timer:
+    """Collects per-call latencies of named operations"""
+
+    def __init__(self):
+        self.samples = {}
+
+    def time(self, name: str, fn, *args, **kwargs):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        self.add(name, time.perf_counter() - start)
+        return result
+
+    def add(self, name: str, seconds: float):
+        self.samples.setdefault(name, []).append(seconds)
+
+    def summary(self):
+        import numpy as np
+
+        results = {}
+        for name, samples in self.samples.items():
+            ms = np.asarray(samples) * 1000
+            total = float(np.sum(samples))
+            results[name] = {
+                "count": len(samples),
+                "throughput_per_s": round(len(samples) / total, 2) if total else None,
+                "mean_ms": round(float(ms.mean()), 3),
+                "p50_ms": round(float(np.percentile(ms, 50)), 3),
+                "p95_ms": round(float(np.percentile(ms, 95)), 3),
+                "p99_ms": round(float(np.percentile(ms, 99)), 3),
+                "max_ms": round(float(ms.max()), 3)
+            }
+        return results
+
+
+def _open_database(path: str):
+    """Point the app at a fresh SQLite file; must run before app imports"""
+    if os.path.exists(path):
+        os.remove(path)
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+
+    from app.db.base import Base
+    from app.db.database import SessionLocal, engine
+    from app.models import (
+        user, resume, job_posting, job_match, job_embedding, parsed_resume,
+        job_catalog_state, resume_embedding, job_match_history, analysis_job,
+        bulk_import
+    )
+
+    Base.metadata.create_all(bind=engine)
+    return SessionLocal()
+
+
+# ---------- Phases ----------
+def run_documents(args, workdir: str) -> dict:
+    """Extraction, parse stages and embedding on synthetic files"""
+    _open_database(os.path.join(workdir, "bench.db"))
+
+    from app.services.embedding_service import get_model
+    from app.services.job_matcher import embed_resume_sections, resume_match_data
+    from app.services.resume_parser import ResumeDocument, extract_text_from_file, parse_document
+
+    paths = write_documents(workdir, args.docs, args.seed)
+
+    start = time.perf_counter()
+    get_model()
+    if not args.no_ner:
+        parse_document(ResumeDocument(text="warm up"))
+    load_s = time.perf_counter() - start
+
+    timer = Timer()
+    for path in paths:
+        kind = "pdf" if path.endswith(".pdf") else "docx"
+        text = timer.time(f"extract_text_from_file[{kind}]", extract_text_from_file, path)
+
+        document = ResumeDocument(text=text, source=path)
+        parsed = parse_document(document, ner=not args.no_ner)
+        for stage, ms in document.timings_ms.items():
+            timer.add(f"parse_resume.{stage}", ms / 1000)
+
+        timer.time("embed_resume_sections", embed_resume_sections, resume_match_data(parsed))
+
+    return {"load_s": round(load_s, 2), "operations": timer.summary()}
+
+
+def _build_catalog(db, size: int, seed: int) -> float:
+    """size jobs with stored vectors, inserted in bulk; returns seconds taken"""
+    from types import SimpleNamespace
+
+    import numpy as np
+    from sqlalchemy import insert
+
+    from app.core.config import settings
+    from app.models.job_embedding import JobEmbedding
+    from app.models.job_posting import JobPosting
+    from app.services.embedding_service import embed_many
+    from app.services.job_embedding_store import encode_vector, job_content_hash
+
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    noise = np.random.default_rng(seed)
+
+    # Real encoder vectors for a few hundred templates; jobs add jitter so
+    # scores are not all tied
+    templates = job_templates(rng, min(size, 300))
+    flat = embed_many([text for _, skills, description in templates for text in (skills, description)])
+    template_vectors = [(flat[2 * i], flat[2 * i + 1]) for i in range(len(templates))]
+
+    chunk = 5000
+    for first in range(1, size + 1, chunk):
+        ids = range(first, min(first + chunk, size + 1))
+        jobs, embeddings = [], []
+        for job_id in ids:
+            t = rng.randrange(len(templates))
+            title, skills, description = templates[t]
+            description = f"{description} Ref {job_id}."
+            jobs.append({"id": job_id, "job_title": title, "skills": skills,
+                         "description": description})
+
+            skills_vec, description_vec = template_vectors[t]
+            embeddings.append({
+                "job_id": job_id,
+                "model_name": settings.EMBEDDING_MODEL_NAME,
+                "content_hash": job_content_hash(SimpleNamespace(skills=skills, description=description)),
+                "dimension": len(skills_vec),
+                "skills_vector": encode_vector(skills_vec + noise.normal(0, 0.01, len(skills_vec))),
+                "description_vector": encode_vector(description_vec + noise.normal(0, 0.01, len(description_vec)))
+            })
+        db.execute(insert(JobPosting), jobs)
+        db.execute(insert(JobEmbedding), embeddings)
+        db.commit()
+
+    return time.perf_counter() - start
+
+
+def run_catalog(args, size: int, workdir: str) -> dict:
+    """Matching, saving and history reads against a catalog of size jobs"""
+    db = _open_database(os.path.join(workdir, "bench.db"))
+
+    from app.models.job_posting import JobPosting
+    from app.models.resume import Resume
+    from app.models.user import User
+    from app.services.job_embedding_store import load_job_catalog, load_job_vectors
+    from app.services.job_matcher import (
+        embed_resume_sections, get_match_history, match_resume_with_catalog,
+        match_resume_with_jobs, resume_match_data, save_job_matches
+    )
+    from app.services.resume_parser import ResumeDocument, parse_document
+
+    setup_s = _build_catalog(db, size, args.seed)
+
+    start = time.perf_counter()
+    user = User(name="bench", email="bench@example.com", password="-")
+    db.add(user)
+    db.flush()
+    rng = random.Random(args.seed + 1)
+    resumes = []
+    for _ in range(min(args.iterations, 20)):
+        parsed = parse_document(ResumeDocument(text="\n".join(resume_lines(rng))), ner=False)
+        resume = Resume(user_id=user.id, file_path="synthetic", analysis_result=parsed)
+        db.add(resume)
+        resumes.append(resume)
+    db.commit()
+    resume_data = [
+        (resume.id, resume_match_data(resume.analysis_result)) for resume in resumes
+    ]
+    vectors = {resume_id: embed_resume_sections(data) for resume_id, data in resume_data}
+
+    jobs = db.query(JobPosting).all()
+    job_vectors = load_job_vectors(db, jobs)
+    catalog = load_job_catalog(db)
+    setup_s += time.perf_counter() - start
+
+    timer = Timer()
+    for i in range(args.iterations):
+        resume_id, data = resume_data[i % len(resume_data)]
+
+        # Rebuilds its matrices from Job objects on every call: seconds at 100k
+        if i < args.slow_iterations:
+            timer.time(
+                "match_resume_with_jobs", match_resume_with_jobs,
+                data, jobs, top_n=args.top_n, threshold=args.threshold, job_vectors=job_vectors
+            )
+        matches = timer.time(
+            "match_resume_with_catalog", match_resume_with_catalog,
+            db, data, catalog, top_n=args.top_n, threshold=args.threshold,
+            resume_vectors=vectors[resume_id]
+        )
+        timer.time("save_job_matches", save_job_matches, db, resume_id, matches)
+        timer.time("get_match_history", get_match_history, db, resume_id, limit=50)
+
+    return {"setup_s": round(setup_s, 2), "operations": timer.summary()}
+
+
+# ---------- Baseline Comparison ----------
+def compare(current: dict, baseline: dict, tolerance: float, min_delta: float = 1.0):
+    """
+    (rows, regressed): p95 and peak RSS per phase.operation vs baseline.
+    A change is a regression when it exceeds both the relative tolerance
+    and min_delta (ms or MiB), so sub-millisecond jitter does not fail runs.
+    """
+    rows, regressed = [], False
+    for phase, result in current["phases"].items():
+        base = baseline.get("phases", {}).get(phase)
+        if base is None:
+            continue
+
+        checks = [(f"{phase}.peak_rss_mib", base.get("peak_rss_mib"), result["peak_rss_mib"])]
+        for op, stats in result["operations"].items():
+            base_op = base.get("operations", {}).get(op)
+            if base_op:
+                checks.append((f"{phase}.{op}.p95_ms", base_op["p95_ms"], stats["p95_ms"]))
+
+        for name, before, after in checks:
+            if not before:
+                continue
+            ratio = after / before
+            worse = ratio > 1 + tolerance and after - before > min_delta
+            regressed = regressed or worse
+            rows.append((name, before, after, ratio, worse))
+    return rows, regressed
+
+
+# ---------- CLI ----------
+def _run_phase(args) -> dict:
+    # Generated files and the SQLite database (large at 100k jobs) are
+    # removed afterwards unless --keep is given
+    workdir = tempfile.mkdtemp(prefix=f"bench_{args.phase}_")
+    try:
+        if args.phase == "documents":
+            result = run_documents(args, workdir)
+        else:
+            result = run_catalog(args, int(args.phase.split("_", 1)[1]), workdir)
+    finally:
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+    result["peak_rss_mib"] = round(_peak_rss_mib(), 1)
+    if args.keep:
+        result["workdir"] = workdir
+    return result
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parse, embed and match")
+    parser.add_argument("--sizes", default="100,10000,100000", help="Job catalog sizes")
+    parser.add_argument("--docs", type=int, default=40, help="Synthetic resumes (half PDF, half DOCX)")
+    parser.add_argument("--iterations", type=int, default=50, help="Match / save / history calls per size")
+    parser.add_argument("--slow-iterations", type=int, default=5,
+                        help="Calls of the uncached match_resume_with_jobs per size")
+    parser.add_argument("--top-n", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--no-ner", action="store_true", help="Skip the spaCy job title stage")
+    parser.add_argument("--output", default="", help="Write results JSON here")
+    parser.add_argument("--baseline", default="", help="Results JSON of an earlier run")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown, 0.2 = 20%%")
+    parser.add_argument("--min-delta", type=float, default=1.0,
+                        help="Ignore regressions smaller than this many ms (MiB for RSS)")
+    parser.add_argument("--keep", action="store_true", help="Keep each phase's files and database")
+    parser.add_argument("--phase", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.phase:
+        print(json.dumps(_run_phase(args)))
+        return
+
+    from app.core.config import settings
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    phases = ["documents"] + [f"catalog_{size}" for size in sizes]
+    shared = ["--docs", str(args.docs), "--iterations", str(args.iterations),
+              "--slow-iterations", str(args.slow_iterations),
+              "--top-n", str(args.top_n), "--threshold", str(args.threshold),
+              "--seed", str(args.seed)] + (["--no-ner"] if args.no_ner else []) \
+        + (["--keep"] if args.keep else [])
+
+    results = {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "embedding_model": settings.EMBEDDING_MODEL_NAME,
+            "args": {k: v for k, v in vars(args).items() if k not in ("phase", "output", "baseline", "tolerance", "min_delta", "keep")}
+        },
+        "phases": {}
+    }
+
+    for phase in phases:
+        out = subprocess.run(
+            [sys.executable, "-m", "app.scripts.benchmark_pipeline", "--phase", phase] + shared,
+            capture_output=True, text=True, check=True
+        )
+        results["phases"][phase] = json.loads(out.stdout.strip().splitlines()[-1])
+
+        print(f"== {phase} (peak RSS {results['phases'][phase]['peak_rss_mib']} MiB)")
+        for op, stats in results["phases"][phase]["operations"].items():
+            print(f"  {op:40s} n={stats['count']:<5d} p50={stats['p50_ms']:>9.3f}ms "
+                  f"p95={stats['p95_ms']:>9.3f}ms p99={stats['p99_ms']:>9.3f}ms "
+                  f"{stats['throughput_per_s'] or 0:>9.1f}/s")
+        if args.keep:
+            print(f"  kept {results['phases'][phase]['workdir']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows, regressed = compare(results, baseline, args.tolerance, args.min_delta)
+        print(f"== vs baseline {baseline.get('meta', {}).get('git_commit', '')}")
+        for name, before, after, ratio, worse in rows:
+            print(f"  {'REGRESSED' if worse else 'ok':9s} {name:60s} {before:>10.3f} -> {after:>10.3f} ({ratio:.2f}x)")
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
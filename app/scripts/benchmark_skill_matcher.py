@@ -0,0 +1,93 @@
+"""
+Throughput of the taxonomy skill matcher as the taxonomy grows, compared
+with the previous one-regex-per-skill scan.
+
+Usage:
+    python -m app.scripts.benchmark_skill_matcher [--sizes 100,1000,10000,50000]
+        [--regex-limit 2000] [--repeat 20]
+"""
+import argparse
+import random
+import re
+import string
+import time
+
+from app.services.skill_matcher import (
+    SkillMatcher, get_skill_matcher, load_taxonomy, DEFAULT_TAXONOMY_PATH
+)
+
+
+def synthetic_taxonomy(size: int, seed: int = 7):
+    """Bundled taxonomy padded with random multi-word skills and aliases"""
+    rng = random.Random(seed)
+    taxonomy = dict(load_taxonomy(DEFAULT_TAXONOMY_PATH))
+    while len(taxonomy) < size:
+        words = [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+            for _ in range(rng.randint(1, 3))
+        ]
+        taxonomy[" ".join(words)] = ["-".join(words)]
+    return taxonomy
+
+
+def sample_resume(seed: int = 11) -> str:
+    rng = random.Random(seed)
+    skills = list(load_taxonomy(DEFAULT_TAXONOMY_PATH))
+    lines = []
+    for _ in range(120):
+        filler = " ".join(
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10)))
+            for _ in range(rng.randint(4, 12))
+        )
+        lines.append(f"{filler} {rng.choice(skills)}, {rng.choice(skills)}.")
+    return "\n".join(lines)
+
+
+def regex_scan(terms, text: str):
+    """The previous implementation: one compiled search per keyword"""
+    text_lower = text.lower()
+    return {t for t in terms if re.search(rf"\b{re.escape(t)}\b", text_lower)}
+
+
+def time_per_doc(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill extraction")
+    parser.add_argument("--sizes", default="100,1000,10000,50000")
+    parser.add_argument("--regex-limit", type=int, default=2000,
+                        help="Skip the regex baseline above this taxonomy size")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    text = sample_resume()
+    kb = len(text.encode("utf-8")) / 1024
+    print(f"Resume size: {kb:.1f} KiB, bundled taxonomy: {get_skill_matcher().size} terms")
+    print(f"{'skills':>8} {'terms':>8} {'build s':>8} {'matcher ms':>11} "
+          f"{'MiB/s':>7} {'regex ms':>9}")
+
+    for size in (int(s) for s in args.sizes.split(",") if s):
+        taxonomy = synthetic_taxonomy(size)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(taxonomy)
+        build_s = time.perf_counter() - start
+
+        per_doc = time_per_doc(lambda: matcher.find(text), args.repeat)
+        throughput = kb / 1024 / per_doc
+
+        regex_ms = "-"
+        if size <= args.regex_limit:
+            terms = [t.lower() for name, aliases in taxonomy.items() for t in (name, *aliases)]
+            regex_ms = f"{time_per_doc(lambda: regex_scan(terms, text), max(args.repeat // 5, 1)) * 1000:.2f}"
+
+        print(f"{size:>8} {matcher.size:>8} {build_s:>8.2f} {per_doc * 1000:>11.2f} "
+              f"{throughput:>7.2f} {regex_ms:>9}")
+
+
+if __name__ == "__main__":
+    main()
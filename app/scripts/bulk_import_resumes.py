@@ -0,0 +1,71 @@
+"""
+Bulk-load resumes from a directory or zip archive.
+
+Usage:
+    python -m app.scripts.bulk_import_resumes --user-id 1 --dir resumes/
+    python -m app.scripts.bulk_import_resumes --user-id 1 --zip resumes.zip --match
+"""
+import argparse
+import json
+import os
+
+from app.core.config import UPLOAD_DIR, settings
+from app.db.database import engine
+from app.db.base import Base
+from app.models import (
+    user, resume, job_posting, job_match, job_embedding, parsed_resume,
+    job_catalog_state, resume_embedding, job_match_history, analysis_job,
+    bulk_import
+)
+from app.services.bulk_ingest import (
+    extract_archive, list_directory, register_import, run_bulk_import
+)
+
+
+def print_progress(report):
+    print(f"[{report.status}] {report.processed}/{report.total} files, "
+          f"{report.succeeded} stored, {report.failed} failed, "
+          f"{report.matched} matched, {report.elapsed_seconds:.1f}s", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import resumes")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--dir", help="Directory of PDF/DOCX files (read in place)")
+    source.add_argument("--zip", help="Zip archive of PDF/DOCX files")
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default PARSER_POOL_SIZE)")
+    parser.add_argument("--match", action="store_true", help="Match every resume once at the end")
+    parser.add_argument("--top-n", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.6)
+    args = parser.parse_args()
+
+    if args.workers is not None:
+        # Read when the pool is first used
+        settings.PARSER_POOL_SIZE = args.workers
+
+    Base.metadata.create_all(bind=engine)
+
+    report = register_import(args.user_id)
+    if args.dir:
+        paths = [os.path.abspath(p) for p in list_directory(args.dir)]
+    else:
+        dest_dir = os.path.join(UPLOAD_DIR, "bulk", report.import_id)
+        paths = extract_archive(args.zip, dest_dir)
+
+    run_bulk_import(
+        args.user_id, paths, report,
+        batch_size=args.batch_size,
+        match=args.match,
+        top_n=args.top_n,
+        threshold=args.threshold,
+        progress=print_progress
+    )
+
+    print(json.dumps(report.as_dict(), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
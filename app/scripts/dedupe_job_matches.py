@@ -0,0 +1,71 @@
+"""
+One-off migration for databases created before JobMatches kept one row per
+resume / job pair: copy every existing match into JobMatchHistory, then
+delete all but the newest row of each pair so uq_job_match_resume_job can
+be added.
+
+Usage:
+    python -m app.scripts.dedupe_job_matches [--skip-history]
+
+Afterwards add the constraint by hand (create_all does not alter tables):
+    ALTER TABLE JobMatches ADD CONSTRAINT uq_job_match_resume_job
+        UNIQUE (resume_id, job_id);
+"""
+import argparse
+
+from sqlalchemy import delete, func, insert, select
+
+from app.db.database import SessionLocal, engine
+from app.db.base import Base
+from app.models import (
+    user, resume, job_posting, job_match, job_embedding, parsed_resume,
+    job_catalog_state, resume_embedding, job_match_history, analysis_job,
+    bulk_import
+)
+from app.models.job_match import JobMatch
+from app.models.job_match_history import JobMatchHistory
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collapse duplicate job matches")
+    parser.add_argument(
+        "--skip-history",
+        action="store_true",
+        help="Do not copy existing matches into JobMatchHistory"
+    )
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+
+    columns = ("resume_id", "job_id", "similarity_score", "created_at")
+
+    db = SessionLocal()
+    try:
+        copied = 0
+        if not args.skip_history:
+            copied = db.execute(
+                insert(JobMatchHistory).from_select(
+                    columns,
+                    select(*(getattr(JobMatch, c) for c in columns))
+                )
+            ).rowcount
+
+        # Ids grow with created_at, so the highest id per pair is the latest
+        latest = (
+            select(func.max(JobMatch.id))
+            .group_by(JobMatch.resume_id, JobMatch.job_id)
+            .scalar_subquery()
+        )
+        removed = db.execute(
+            delete(JobMatch).where(JobMatch.id.not_in(latest))
+        ).rowcount
+
+        db.commit()
+    finally:
+        db.close()
+
+    print(f"Copied {copied} matches to history, removed {removed} duplicates")
+
+
+if __name__ == "__main__":
+    main()
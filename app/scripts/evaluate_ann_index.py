@@ -0,0 +1,101 @@
+"""
+Measure ANN recall against brute-force matching to tune index parameters.
+
+Usage:
+    python -m app.scripts.evaluate_ann_index [--k 10] [--queries 200]
+        [--m 16] [--ef-construction 200] [--ef-search 64,128,256]
+        [--candidates 100,200] [--synthetic 100000]
+
+Without --synthetic the job catalog is loaded from the database.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.ann_index import build_ann_index, evaluate_recall
+from app.services.job_catalog import build_job_catalog
+
+
+def _int_list(value: str):
+    return [int(v) for v in value.split(",") if v]
+
+
+def load_catalog(synthetic: int, dimension: int, seed: int):
+    if synthetic:
+        rng = np.random.default_rng(seed)
+        return build_job_catalog(
+            job_ids=np.arange(1, synthetic + 1),
+            skills_vectors=rng.normal(size=(synthetic, dimension)).astype(np.float32),
+            description_vectors=rng.normal(size=(synthetic, dimension)).astype(np.float32)
+        )
+
+    from app.db.database import SessionLocal
+    from app.models import (
+        user, resume, job_posting, job_match, job_embedding, parsed_resume,
+        job_catalog_state, resume_embedding, job_match_history, analysis_job,
+        bulk_import
+    )
+    from app.services.job_embedding_store import load_job_catalog
+
+    db = SessionLocal()
+    try:
+        return load_job_catalog(db)
+    finally:
+        db.close()
+
+
+def sample_queries(catalog, count: int, seed: int, noise: float = 0.5):
+    """Resume-like queries: perturbed job vectors from random catalog rows"""
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, len(catalog), size=(count, 2))
+    queries = []
+    for skill_row, description_row in rows:
+        jitter = rng.normal(scale=noise / np.sqrt(catalog.dimension), size=(3, catalog.dimension))
+        queries.append((
+            catalog.skills_matrix[skill_row] + jitter[0],
+            catalog.description_matrix[description_row] + jitter[1],
+            catalog.description_matrix[skill_row] + jitter[2]
+        ))
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate ANN job index recall")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--m", type=int, default=settings.ANN_M)
+    parser.add_argument("--ef-construction", type=int, default=settings.ANN_EF_CONSTRUCTION)
+    parser.add_argument("--ef-search", type=_int_list, default=[settings.ANN_EF_SEARCH])
+    parser.add_argument("--candidates", type=_int_list, default=[settings.ANN_CANDIDATES])
+    parser.add_argument("--synthetic", type=int, default=0, help="Random catalog size")
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    catalog = load_catalog(args.synthetic, args.dimension, args.seed)
+    if len(catalog) == 0:
+        print("Job catalog is empty")
+        return
+
+    queries = sample_queries(catalog, args.queries, args.seed)
+
+    start = time.perf_counter()
+    index = build_ann_index(catalog, m=args.m, ef_construction=args.ef_construction)
+    build_s = time.perf_counter() - start
+    print(f"Catalog: {len(catalog)} jobs, M={args.m}, "
+          f"ef_construction={args.ef_construction}, build {build_s:.1f}s")
+
+    print(f"{'ef_search':>10} {'candidates':>11} {'recall@' + str(args.k):>10} "
+          f"{'exact ms':>9} {'ann ms':>8}")
+    for ef_search in args.ef_search:
+        index.ef_search = ef_search
+        for candidates in args.candidates:
+            result = evaluate_recall(catalog, index, queries, k=args.k, candidates=candidates)
+            print(f"{ef_search:>10} {candidates:>11} {result['recall_at_k']:>10.4f} "
+                  f"{result['exact_ms']:>9.2f} {result['ann_ms']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Report memory, scan speed and ranking agreement of quantized job catalog
+storage (CATALOG_STORAGE) against the float32 baseline.
+
+Usage:
+    python -m app.scripts.evaluate_catalog_storage [--k 10] [--queries 200]
+        [--storage float16,int8] [--rescore 0,50,200] [--synthetic 100000]
+
+Without --synthetic the job catalog is loaded from the database and rescoring
+reads float32 vectors back from JobEmbeddings, as the API does; with it,
+rescoring reads the in-memory float32 reference.
+"""
+import argparse
+
+import numpy as np
+
+from app.scripts.evaluate_ann_index import sample_queries
+from app.services.job_catalog import JobCatalog, build_job_catalog, evaluate_storage
+
+
+def _str_list(value: str):
+    return [v for v in value.split(",") if v]
+
+
+def _int_list(value: str):
+    return [int(v) for v in value.split(",") if v]
+
+
+def load_reference(synthetic: int, dimension: int, seed: int) -> JobCatalog:
+    """float32 catalog, whatever CATALOG_STORAGE is set to"""
+    if synthetic:
+        rng = np.random.default_rng(seed)
+        return build_job_catalog(
+            job_ids=np.arange(1, synthetic + 1),
+            skills_vectors=rng.normal(size=(synthetic, dimension)).astype(np.float32),
+            description_vectors=rng.normal(size=(synthetic, dimension)).astype(np.float32)
+        )
+
+    from app.core.config import settings
+    from app.db.database import SessionLocal
+    from app.models import (
+        user, resume, job_posting, job_match, job_embedding, parsed_resume,
+        job_catalog_state, resume_embedding, job_match_history, analysis_job,
+        bulk_import
+    )
+    from app.models.job_embedding import JobEmbedding
+    from app.services.job_embedding_store import decode_vector
+
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(
+                JobEmbedding.job_id,
+                JobEmbedding.skills_vector,
+                JobEmbedding.description_vector
+            )
+            .filter(JobEmbedding.model_name == settings.EMBEDDING_MODEL_NAME)
+            .order_by(JobEmbedding.job_id)
+            .all()
+        )
+    finally:
+        db.close()
+
+    return build_job_catalog(
+        job_ids=[r.job_id for r in rows],
+        skills_vectors=[decode_vector(r.skills_vector) for r in rows],
+        description_vectors=[decode_vector(r.description_vector) for r in rows]
+    )
+
+
+def memory_source(reference: JobCatalog):
+    def exact_vectors(job_ids):
+        rows = reference.rows_for(job_ids)
+        return reference.skills_matrix[rows], reference.description_matrix[rows]
+    return exact_vectors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate quantized job catalog storage")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--storage", type=_str_list, default=["float16", "int8"])
+    parser.add_argument(
+        "--rescore",
+        type=_int_list,
+        default=[0, 50],
+        help="Rescore candidate counts to try (0 = approximate scores only)"
+    )
+    parser.add_argument("--synthetic", type=int, default=0, help="Random catalog size")
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--workers", type=int, default=1, help="Processes holding a catalog")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    reference = load_reference(args.synthetic, args.dimension, args.seed)
+    if len(reference) == 0:
+        print("Job catalog is empty")
+        return
+
+    if args.synthetic:
+        exact_source = memory_source(reference)
+    else:
+        from app.services.job_embedding_store import fetch_exact_vectors
+        exact_source = fetch_exact_vectors
+
+    queries = sample_queries(reference, args.queries, args.seed)
+    baseline_mb = reference.nbytes * args.workers / 2 ** 20
+    print(f"Catalog: {len(reference)} jobs x {reference.dimension} dims, "
+          f"{args.workers} worker(s), float32 {baseline_mb:.1f} MB")
+
+    print(f"{'storage':>8} {'rescore':>8} {'MB':>8} {'saved':>6} {'scan ms':>8} "
+          f"{'speed-up':>8} {'top-k ms':>9} {'recall@' + str(args.k):>10} "
+          f"{'top-1':>6} {'max err':>8}")
+    for storage in args.storage:
+        for rescore in args.rescore:
+            catalog = JobCatalog(
+                reference.job_ids,
+                reference.skills_matrix,
+                reference.description_matrix,
+                storage=storage,
+                exact_source=exact_source,
+                rescore_candidates=rescore
+            )
+            result = evaluate_storage(reference, catalog, queries, k=args.k)
+            mb = catalog.nbytes * args.workers / 2 ** 20
+            print(f"{storage:>8} {rescore:>8} {mb:>8.1f} {1 - mb / baseline_mb:>6.0%} "
+                  f"{result['scan_ms']:>8.2f} "
+                  f"{result['reference_scan_ms'] / result['scan_ms']:>7.2f}x "
+                  f"{result['ms']:>9.2f} {result['recall_at_k']:>10.4f} "
+                  f"{result['top1_agreement']:>6.2f} {result['max_score_error']:>8.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Bulk-load job postings from an ATS feed, upserting by external_key.
+
+Usage:
+    python -m app.scripts.import_jobs --file jobs.jsonl
+    python -m app.scripts.import_jobs --file jobs.csv --batch-size 1000
+"""
+import argparse
+import json
+
+from app.db.database import SessionLocal, engine
+from app.db.base import Base
+from app.models import (
+    user, resume, job_posting, job_match, job_embedding, parsed_resume,
+    job_catalog_state, resume_embedding, job_match_history, analysis_job,
+    bulk_import
+)
+from app.services.job_import import IMPORT_FORMATS, detect_format, import_jobs
+
+
+def print_progress(report):
+    print(f"{report.rows} rows: {report.inserted} inserted, {report.updated} updated, "
+          f"{report.unchanged} unchanged, {report.failed} failed, "
+          f"{report.elapsed_seconds:.1f}s", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import job postings")
+    parser.add_argument("--file", required=True, help=".jsonl or .csv feed")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, default=None,
+                        help="Override the format implied by the file extension")
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+
+    fmt = args.format or detect_format(args.file)
+    db = SessionLocal()
+    try:
+        with open(args.file, encoding="utf-8-sig", newline="") as stream:
+            report = import_jobs(
+                db, stream, fmt,
+                batch_size=args.batch_size,
+                progress=print_progress
+            )
+    finally:
+        db.close()
+
+    print(json.dumps(report.as_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Match every job that is still waiting for background matching
+(matched_at IS NULL), e.g. after downtime or with the worker disabled.
+
+Usage:
+    python -m app.scripts.match_pending_jobs
+    python -m app.scripts.match_pending_jobs --all --threshold 0.5
+"""
+import argparse
+
+from app.core.config import settings
+from app.db.database import SessionLocal, engine
+from app.db.base import Base
+from app.models import (
+    user, resume, job_posting, job_match, job_embedding, parsed_resume,
+    job_catalog_state, resume_embedding, job_match_history, analysis_job,
+    bulk_import
+)
+from app.models.job_posting import JobPosting
+from app.services.match_worker import match_pending_jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay background job matching")
+    parser.add_argument("--all", action="store_true", help="Re-match every job, not only pending ones")
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--threshold", type=float, default=settings.MATCH_WORKER_THRESHOLD)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        if args.all:
+            db.query(JobPosting).update({JobPosting.matched_at: None}, synchronize_session=False)
+            db.commit()
+        stats = match_pending_jobs(
+            db, batch_size=args.batch_size, threshold=args.threshold
+        )
+    finally:
+        db.close()
+
+    print(f"Matched {stats['jobs']} jobs, {stats['matches']} matches written")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, func, or_, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.analysis_job import AnalysisJob
+from app.models.resume import Resume
+from app.services.analysis_tasks import (
+    AnalysisResult, match_stored_resume, parse_and_match_resume
+)
+from app.services.resume_embedding_store import add_resume_embedding
+from app.services.worker_pool import call_in_pool
+from app.utils.metrics import DOCUMENTS, record_stage_timings
+
+
+# Bad input: another attempt would fail the same way
+PERMANENT_ERRORS = (ValueError, FileNotFoundError)
+
+
+# ---------- Storing Results ----------
+def save_analyzed_resume(
+    db: Session,
+    user_id: int,
+    file_path: str,
+    content_hash: Optional[str],
+    result: AnalysisResult
+) -> Resume:
+    """Add the Resume and its section vectors; the caller commits"""
+    parsed_data, _, _, vectors = result
+
+    resume = Resume(
+        user_id=user_id,
+        file_path=file_path,
+        content_hash=content_hash,
+        analysis_result=parsed_data
+    )
+    db.add(resume)
+    db.flush()
+
+    # Keep the section vectors for job -> candidates matching
+    add_resume_embedding(db, resume.id, vectors)
+    return resume
+
+
+def analysis_response(resume: Resume, result: AnalysisResult) -> Dict:
+    """Body of a finished upload-analyze, synchronous or queued"""
+    parsed_data, job_matches, timings_ms, _ = result
+    return {
+        "id": resume.id,
+        "file_path": resume.file_path,
+        "upload_date": resume.upload_date,
+        "analysis_result": {
+            **parsed_data,
+            "job_matches": job_matches
+        },
+        "timings_ms": timings_ms
+    }
+
+
+# ---------- Queue ----------
+def enqueue_analysis(
+    db: Session,
+    user_id: int,
+    file_path: str,
+    content_hash: Optional[str],
+    top_n: int = 5,
+    threshold: float = 0.6
+) -> Dict:
+    """
+    Queue an analysis and return {"job_id": ..., "status": ...}. Plain
+    values are returned so callers on the event loop never touch the
+    expired ORM instance.
+    """
+    job = AnalysisJob(
+        user_id=user_id,
+        file_path=file_path,
+        content_hash=content_hash,
+        top_n=top_n,
+        threshold=threshold
+    )
+    db.add(job)
+    db.commit()
+    queued = {"job_id": job.id, "status": job.status}
+
+    if settings.ANALYSIS_QUEUE_WORKERS > 0:
+        analysis_queue.start()
+        analysis_queue.wake()
+    return queued
+
+
+def analysis_status(job: AnalysisJob) -> Dict:
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "stage": job.stage,
+        "attempts": job.attempts,
+        "error": job.error,
+        "next_attempt_at": job.next_attempt_at if job.status == "queued" else None,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "timings_ms": job.timings_ms,
+        "resume_id": job.resume_id,
+        "result": job.result
+    }
+
+
+def _claimable(now: datetime):
+    lease_expired = now - timedelta(seconds=settings.ANALYSIS_QUEUE_LEASE_SECONDS)
+    return or_(
+        and_(AnalysisJob.status == "queued", AnalysisJob.next_attempt_at <= now),
+        # The worker running it died (process killed, host restarted)
+        and_(AnalysisJob.status == "running", AnalysisJob.locked_at < lease_expired)
+    )
+
+
+def claim_next_job(db: Session) -> Optional[int]:
+    """
+    Atomically take the oldest due job. The conditional UPDATE makes the
+    claim safe across threads and processes sharing the database.
+    """
+    now = datetime.utcnow()
+    candidates = [
+        job_id for (job_id,) in (
+            db.query(AnalysisJob.id)
+            .filter(_claimable(now))
+            .order_by(AnalysisJob.id)
+            .limit(5)
+        )
+    ]
+
+    for job_id in candidates:
+        claimed = db.execute(
+            update(AnalysisJob)
+            .where(AnalysisJob.id == job_id, _claimable(now))
+            .values(
+                status="running",
+                stage="starting",
+                attempts=AnalysisJob.attempts + 1,
+                locked_at=now,
+                started_at=func.coalesce(AnalysisJob.started_at, now)
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        if claimed:
+            return job_id
+
+    return None
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff: base, 2 * base, 4 * base, ... capped"""
+    return min(
+        settings.ANALYSIS_QUEUE_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0),
+        settings.ANALYSIS_QUEUE_RETRY_MAX_SECONDS
+    )
+
+
+def _set_stage(db: Session, job: AnalysisJob, stage: str):
+    # Committed so pollers see progress; also renews the lease
+    job.stage = stage
+    job.locked_at = datetime.utcnow()
+    db.commit()
+
+
+def run_analysis_job(db: Session, job_id: int) -> str:
+    """
+    Run one claimed job. The Resume insert and the job's success are
+    committed together, so a retried job never stores its resume twice.
+    Returns the job's new status.
+    """
+    job = db.get(AnalysisJob, job_id)
+    if job.attempts > settings.ANALYSIS_QUEUE_MAX_ATTEMPTS:
+        # Reclaimed after its worker died once too often
+        job.status = "failed"
+        job.error = job.error or "Worker lost while running this job"
+        job.finished_at = datetime.utcnow()
+        job.locked_at = None
+        db.commit()
+        return job.status
+
+    queue_wait_ms = round((job.started_at - job.created_at).total_seconds() * 1000, 2)
+
+    try:
+        result = None
+        if job.content_hash:
+            _set_stage(db, job, "lookup")
+            result = call_in_pool(
+                match_stored_resume, job.content_hash,
+                top_n=job.top_n, threshold=job.threshold
+            )
+
+        if result is None:
+            _set_stage(db, job, "analyzing")
+            result = call_in_pool(
+                parse_and_match_resume, job.file_path,
+                top_n=job.top_n, threshold=job.threshold, content_hash=job.content_hash
+            )
+
+        _set_stage(db, job, "saving")
+        start = time.perf_counter()
+        resume = save_analyzed_resume(
+            db, job.user_id, job.file_path, job.content_hash, result
+        )
+        result[2]["persist"] = round((time.perf_counter() - start) * 1000, 2)
+
+        job.status = "succeeded"
+        job.stage = "done"
+        job.resume_id = resume.id
+        job.result = jsonable_encoder(analysis_response(resume, result))
+        timings_ms = {"queue_wait": queue_wait_ms, **result[2]}
+        job.timings_ms = timings_ms
+        job.error = None
+        job.locked_at = None
+        job.finished_at = datetime.utcnow()
+        db.commit()
+
+        record_stage_timings(timings_ms)
+        DOCUMENTS.inc(source="queue", outcome="succeeded")
+        return "succeeded"
+
+    except Exception as exc:
+        db.rollback()
+        job = db.get(AnalysisJob, job_id)
+        job.error = f"{type(exc).__name__}: {exc}"
+        job.locked_at = None
+
+        if isinstance(exc, PERMANENT_ERRORS) or job.attempts >= settings.ANALYSIS_QUEUE_MAX_ATTEMPTS:
+            job.status = "failed"
+            job.finished_at = datetime.utcnow()
+        else:
+            job.status = "queued"
+            job.stage = "retry_wait"
+            job.next_attempt_at = datetime.utcnow() + timedelta(seconds=retry_delay(job.attempts))
+        db.commit()
+
+        outcome = "retried" if job.status == "queued" else job.status
+        DOCUMENTS.inc(source="queue", outcome=outcome)
+        return outcome
+
+
+# ---------- Workers ----------
+class AnalysisQueue:
+    """
+    Worker threads consuming AnalysisJobs. Workers poll the table every
+    poll_seconds and are woken early by enqueue_analysis, so jobs queued
+    by other processes (or left over from a restart) are picked up too.
+    """
+
+    def __init__(self, workers: int, poll_seconds: float):
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        self._threads = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+        self.succeeded = 0
+        self.failed = 0
+        self.retried = 0
+        self.errors = 0
+        self.last_error = None
+
+    def start(self):
+        with self._lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            if self._threads or self.workers <= 0:
+                return
+            self._stop.clear()
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._run, name=f"analysis-worker-{i}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def wake(self):
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            db = SessionLocal()
+            try:
+                job_id = claim_next_job(db)
+                if job_id is not None:
+                    outcome = run_analysis_job(db, job_id)
+                    with self._lock:
+                        if outcome == "succeeded":
+                            self.succeeded += 1
+                        elif outcome == "retried":
+                            self.retried += 1
+                        else:
+                            self.failed += 1
+            except Exception as exc:
+                # Database trouble while claiming / recording: back off a poll
+                db.rollback()
+                job_id = None
+                with self._lock:
+                    self.errors += 1
+                    self.last_error = f"{type(exc).__name__}: {exc}"
+            finally:
+                db.close()
+
+            if job_id is None:
+                self._wake.wait(self.poll_seconds)
+                self._wake.clear()
+
+    def stats(self) -> Dict:
+        db = SessionLocal()
+        try:
+            depth = dict(
+                db.query(AnalysisJob.status, func.count(AnalysisJob.id))
+                .filter(AnalysisJob.status.in_(("queued", "running")))
+                .group_by(AnalysisJob.status)
+                .all()
+            )
+        finally:
+            db.close()
+
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "running_threads": sum(1 for t in self._threads if t.is_alive()),
+                "queued": depth.get("queued", 0),
+                "running": depth.get("running", 0),
+                "succeeded": self.succeeded,
+                "retried": self.retried,
+                "failed": self.failed,
+                "errors": self.errors,
+                "last_error": self.last_error
+            }
+
+
+analysis_queue = AnalysisQueue(
+    workers=settings.ANALYSIS_QUEUE_WORKERS,
+    poll_seconds=settings.ANALYSIS_QUEUE_POLL_SECONDS
+)
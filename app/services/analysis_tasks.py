@@ -0,0 +1,203 @@
+"""
+Picklable entry points executed inside worker processes (see worker_pool).
+Each worker opens its own DB session and keeps its own model instances.
+resume_parser (spaCy) is imported where used, so API processes that only
+submit these tasks never load it.
+"""
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.db.database import SessionLocal
+from app.models import (
+    user, resume, job_posting, job_match, job_embedding, parsed_resume,
+    job_catalog_state, resume_embedding, job_match_history, analysis_job,
+    bulk_import
+)
+from app.services.embedding_service import embed_many
+from app.services.job_matcher import (
+    embed_resume_sections, match_resume_with_catalog, rank_catalog,
+    resume_match_data, resume_section_texts, save_job_matches
+)
+from app.services.job_embedding_store import load_job_catalog
+from app.services.parsed_resume_store import (
+    find_parsed_resume, parsed_vectors, save_parsed_resume, set_parsed_vectors
+)
+
+
+# (parsed_data, job_matches, timings_ms, section vectors)
+AnalysisResult = Tuple[Dict, List[Dict], Dict[str, float], Tuple]
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def parse_and_match_resume(
+    file_path: str,
+    top_n: int = 5,
+    threshold: float = 0.6,
+    content_hash: Optional[str] = None
+) -> AnalysisResult:
+    """
+    Parse a stored resume file and match it against the job catalog.
+    The file is extracted once; returns an AnalysisResult.
+    With content_hash the parse and section vectors are saved for reuse
+    by match_stored_resume.
+    """
+    from app.services.resume_parser import load_document, parse_document
+
+    document = load_document(file_path)
+    parsed_data = parse_document(document)
+    resume_data = resume_match_data(parsed_data)
+
+    start = time.perf_counter()
+    vectors = embed_resume_sections(resume_data)
+    document.timings_ms["embed"] = _elapsed_ms(start)
+
+    start = time.perf_counter()
+
+    db = SessionLocal()
+    try:
+        if content_hash:
+            save_parsed_resume(db, content_hash, parsed_data, vectors)
+
+        catalog = load_job_catalog(db)
+        job_matches = match_resume_with_catalog(
+            db=db,
+            resume_data=resume_data,
+            catalog=catalog,
+            top_n=top_n,
+            threshold=threshold,
+            resume_vectors=vectors
+        )
+    finally:
+        db.close()
+    document.timings_ms["match"] = _elapsed_ms(start)
+
+    return parsed_data, job_matches, document.timings_ms, vectors
+
+
+def match_stored_resume(
+    content_hash: str,
+    top_n: int = 5,
+    threshold: float = 0.6
+) -> Optional[AnalysisResult]:
+    """
+    Fast path for a file that was parsed before: match its stored parse and
+    vectors without touching the file. Returns None when nothing is stored
+    for the current parser version. Still run in the pool: it loads the
+    job catalog and may need the encoder.
+    """
+    timings_ms = {}
+    start = time.perf_counter()
+
+    db = SessionLocal()
+    try:
+        record = find_parsed_resume(db, content_hash)
+        if record is None:
+            return None
+
+        parsed_data = record.analysis_result
+        resume_data = resume_match_data(parsed_data)
+
+        vectors = parsed_vectors(record)
+        if vectors is None:
+            # Stored under another embedding model: re-embed, keep the parse
+            vectors = embed_resume_sections(resume_data)
+            set_parsed_vectors(record, vectors)
+            db.commit()
+        timings_ms["lookup"] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        catalog = load_job_catalog(db)
+        job_matches = match_resume_with_catalog(
+            db=db,
+            resume_data=resume_data,
+            catalog=catalog,
+            top_n=top_n,
+            threshold=threshold,
+            resume_vectors=vectors
+        )
+        timings_ms["match"] = _elapsed_ms(start)
+    finally:
+        db.close()
+
+    return parsed_data, job_matches, timings_ms, vectors
+
+
+def _job_titles(texts: List[str]) -> List[List[str]]:
+    from app.services.resume_parser import extract_job_titles, extract_job_titles_batch
+
+    try:
+        return extract_job_titles_batch(texts)
+    except Exception:
+        # Fall back to one document at a time so a single bad text
+        # does not cost the whole chunk its titles
+        titles = []
+        for text in texts:
+            try:
+                titles.append(extract_job_titles(text))
+            except Exception:
+                titles.append([])
+        return titles
+
+
+def prepare_resumes(
+    paths: Sequence[str]
+) -> Tuple[List[Tuple[str, Dict, Tuple]], List[Tuple[str, str]]]:
+    """
+    Bulk import chunk: extract and parse each file, then NER and section
+    embedding for the whole chunk in batches.
+    Returns ([(path, parsed, vectors), ...], [(path, error), ...]).
+    """
+    from app.services.resume_parser import load_document, parse_document
+
+    parsed_files, texts, failures = [], [], []
+    for path in paths:
+        try:
+            document = load_document(path)
+            parsed_files.append((path, parse_document(document, ner=False)))
+            texts.append(document.text)
+        except Exception as exc:
+            failures.append((path, f"{type(exc).__name__}: {exc}"))
+
+    if not parsed_files:
+        return [], failures
+
+    for (_, parsed), job_titles in zip(parsed_files, _job_titles(texts)):
+        parsed["job_titles"] = job_titles
+
+    # Section vectors are kept for matching in both directions
+    flat = embed_many([
+        text
+        for _, parsed in parsed_files
+        for text in resume_section_texts(resume_match_data(parsed))
+    ])
+    vectors = [tuple(flat[i:i + 3]) for i in range(0, len(flat), 3)]
+    return [
+        (path, parsed, resume_vectors)
+        for (path, parsed), resume_vectors in zip(parsed_files, vectors)
+    ], failures
+
+
+def match_resumes(
+    resumes: Sequence[Tuple[int, Tuple]],
+    top_n: int = 5,
+    threshold: float = 0.6
+) -> int:
+    """Bulk import: match stored resumes against one catalog load"""
+    db = SessionLocal()
+    try:
+        catalog = load_job_catalog(db)
+        for resume_id, resume_vectors in resumes:
+            winners = rank_catalog(catalog, resume_vectors, top_n=top_n, threshold=threshold)
+            save_job_matches(
+                db,
+                resume_id,
+                [{"job_id": job_id, "similarity_score": round(score, 4)} for job_id, score in winners],
+                commit=False
+            )
+        db.commit()
+    finally:
+        db.close()
+    return len(resumes)
@@ -0,0 +1,282 @@
+import hashlib
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.job_catalog import JobCatalog, normalize_vector
+
+try:
+    import hnswlib
+except ImportError:  # optional dependency, only needed for MATCH_INDEX_MODE="hnsw"
+    hnswlib = None
+
+
+# Catalog rows digested per step when syncing (bounds the float32 copy of
+# quantized catalogs)
+SYNC_CHUNK_ROWS = 4096
+
+
+def _row_digest(skills_row: np.ndarray, description_row: np.ndarray) -> bytes:
+    """Identifies the vectors a job was indexed with"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(skills_row, dtype=np.float32).tobytes())
+    digest.update(np.ascontiguousarray(description_row, dtype=np.float32).tobytes())
+    return digest.digest()
+
+
+# ---------- HNSW Job Index ----------
+class JobAnnIndex:
+    """
+    Approximate nearest-neighbour index over job skill and description vectors.
+
+    Two HNSW graphs (inner product over normalized vectors) return a
+    candidate shortlist; final ranking is always an exact weighted rescore
+    against the JobCatalog.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        max_elements: int = 1024,
+        m: int = settings.ANN_M,
+        ef_construction: int = settings.ANN_EF_CONSTRUCTION,
+        ef_search: int = settings.ANN_EF_SEARCH
+    ):
+        if hnswlib is None:
+            raise RuntimeError(
+                "MATCH_INDEX_MODE='hnsw' requires the hnswlib package "
+                "(pip install hnswlib)"
+            )
+
+        self.dimension = dimension
+        self.ef_search = ef_search
+        self.job_ids = set()
+        # job_id -> digest of the rows it was indexed with
+        self.digests: Dict[int, bytes] = {}
+        self.synced_catalog = None
+        self._lock = threading.Lock()
+
+        self.skills_index = self._new_index(max_elements, m, ef_construction)
+        self.description_index = self._new_index(max_elements, m, ef_construction)
+
+    def _new_index(self, max_elements: int, m: int, ef_construction: int):
+        index = hnswlib.Index(space="ip", dim=self.dimension)
+        index.init_index(
+            max_elements=max(max_elements, 1),
+            M=m,
+            ef_construction=ef_construction,
+            allow_replace_deleted=True
+        )
+        index.set_ef(self.ef_search)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def _ensure_capacity(self, extra: int):
+        needed = self.skills_index.get_current_count() + extra
+        capacity = self.skills_index.get_max_elements()
+        if needed > capacity:
+            new_capacity = max(needed, capacity * 2)
+            self.skills_index.resize_index(new_capacity)
+            self.description_index.resize_index(new_capacity)
+
+    def add_jobs(
+        self,
+        job_ids: Sequence[int],
+        skills_matrix: np.ndarray,
+        description_matrix: np.ndarray
+    ):
+        """Insert (or replace) jobs; rows must be L2-normalized"""
+        if len(job_ids) == 0:
+            return
+
+        labels = np.asarray(job_ids, dtype=np.int64)
+        with self._lock:
+            self._ensure_capacity(len(labels))
+            for index, matrix in (
+                (self.skills_index, skills_matrix),
+                (self.description_index, description_matrix)
+            ):
+                for label in labels:
+                    # Re-adding a deleted label must un-delete it first
+                    if int(label) not in self.job_ids:
+                        try:
+                            index.unmark_deleted(int(label))
+                        except RuntimeError:
+                            pass
+                index.add_items(
+                    np.asarray(matrix, dtype=np.float32), labels, replace_deleted=True
+                )
+            self.job_ids.update(int(label) for label in labels)
+            for i, label in enumerate(labels):
+                self.digests[int(label)] = _row_digest(skills_matrix[i], description_matrix[i])
+
+    def add_job(self, job_id: int, skills_vec, description_vec):
+        """Insert one job from raw (unnormalized) embeddings"""
+        self.add_jobs(
+            [job_id],
+            normalize_vector(skills_vec, self.dimension)[None, :],
+            normalize_vector(description_vec, self.dimension)[None, :]
+        )
+
+    def remove_job(self, job_id: int):
+        """Hide a job from future searches (its slot is reused by later inserts)"""
+        with self._lock:
+            if job_id not in self.job_ids:
+                return
+            self.skills_index.mark_deleted(job_id)
+            self.description_index.mark_deleted(job_id)
+            self.job_ids.discard(job_id)
+            self.digests.pop(job_id, None)
+
+    def candidates(
+        self,
+        skill_query: np.ndarray,
+        description_query: np.ndarray,
+        k: int
+    ) -> List[int]:
+        """Union of the k nearest jobs by skills and by description"""
+        found = set()
+        # job_ids changes under index_job / unindex_job; k must fit the
+        # live element count at query time
+        with self._lock:
+            if not self.job_ids:
+                return []
+            k = min(k, len(self.job_ids))
+            for index, query in (
+                (self.skills_index, skill_query),
+                (self.description_index, description_query)
+            ):
+                if not np.any(query):
+                    continue
+                index.set_ef(max(self.ef_search, k))
+                labels, _ = index.knn_query(
+                    np.asarray(query, dtype=np.float32)[None, :], k=k
+                )
+                found.update(int(label) for label in labels[0])
+
+        return list(found)
+
+    def sync(self, catalog: JobCatalog):
+        """
+        Bring the index in line with a (re)built catalog: drop removed jobs,
+        add new ones and re-add jobs whose vectors changed. Edits made in
+        another process only reach this index through the catalog, so
+        every catalog row is checked against the digest it was indexed with.
+        """
+        if self.synced_catalog is catalog:
+            return
+
+        catalog_ids = set(int(job_id) for job_id in catalog.job_ids)
+        for job_id in list(self.job_ids - catalog_ids):
+            self.remove_job(job_id)
+
+        for start in range(0, len(catalog), SYNC_CHUNK_ROWS):
+            job_ids = catalog.job_ids[start:start + SYNC_CHUNK_ROWS]
+            skills_rows = catalog.skills_matrix[start:start + SYNC_CHUNK_ROWS]
+            description_rows = catalog.description_matrix[start:start + SYNC_CHUNK_ROWS]
+
+            stale = [
+                i for i, job_id in enumerate(job_ids)
+                if self.digests.get(int(job_id)) != _row_digest(skills_rows[i], description_rows[i])
+            ]
+            if stale:
+                self.add_jobs(job_ids[stale], skills_rows[stale], description_rows[stale])
+
+        self.synced_catalog = catalog
+
+
+def build_ann_index(catalog: JobCatalog, **params) -> JobAnnIndex:
+    """Build an index holding every job in the catalog"""
+    index = JobAnnIndex(
+        dimension=catalog.dimension,
+        max_elements=len(catalog),
+        **params
+    )
+    index.add_jobs(catalog.job_ids, catalog.skills_matrix, catalog.description_matrix)
+    index.synced_catalog = catalog
+    return index
+
+
+# ---------- Process-wide Index ----------
+_index_lock = threading.Lock()
+_index: Optional[JobAnnIndex] = None
+
+
+def ann_enabled() -> bool:
+    return settings.MATCH_INDEX_MODE == "hnsw"
+
+
+def get_ann_index(catalog: JobCatalog) -> JobAnnIndex:
+    """Return the shared index, building it on first use"""
+    global _index
+    with _index_lock:
+        if _index is None or _index.dimension != catalog.dimension:
+            _index = build_ann_index(catalog)
+        else:
+            _index.sync(catalog)
+        return _index
+
+
+def index_job(job_id: int, skills_vec, description_vec):
+    """Incremental insert hook for newly created or edited jobs"""
+    if ann_enabled() and _index is not None:
+        _index.add_job(job_id, skills_vec, description_vec)
+
+
+def unindex_job(job_id: int):
+    """Incremental delete hook for removed or expired jobs"""
+    if ann_enabled() and _index is not None:
+        _index.remove_job(job_id)
+
+
+# ---------- Recall Evaluation ----------
+def evaluate_recall(
+    catalog: JobCatalog,
+    index: JobAnnIndex,
+    queries: Sequence[Sequence],
+    k: int = 10,
+    candidates: int = settings.ANN_CANDIDATES
+) -> Dict[str, float]:
+    """
+    Compare ANN + exact rescoring against brute force.
+
+    queries: iterable of (skill_vec, experience_vec, education_vec)
+    Returns recall@k and mean latency of both paths in milliseconds.
+    """
+    hits, total = 0, 0
+    exact_ms, ann_ms = 0.0, 0.0
+
+    for skill_vec, experience_vec, education_vec in queries:
+        start = time.perf_counter()
+        exact = catalog.top_matches(
+            skill_vec, experience_vec, education_vec,
+            top_n=k, threshold=-np.inf
+        )
+        exact_ms += (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        skill_query, description_query = catalog.queries(
+            skill_vec, experience_vec, education_vec
+        )
+        shortlist = index.candidates(skill_query, description_query, candidates)
+        approx = catalog.top_matches(
+            skill_vec, experience_vec, education_vec,
+            top_n=k, threshold=-np.inf, candidate_ids=shortlist
+        )
+        ann_ms += (time.perf_counter() - start) * 1000
+
+        exact_ids = {job_id for job_id, _ in exact}
+        hits += len(exact_ids & {job_id for job_id, _ in approx})
+        total += len(exact_ids)
+
+    n = max(len(queries), 1)
+    return {
+        "recall_at_k": hits / total if total else 1.0,
+        "exact_ms": exact_ms / n,
+        "ann_ms": ann_ms / n
+    }
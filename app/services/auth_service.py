@@ -1,27 +1,43 @@
-from sqlalchemy.orm import Session
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import hash_password_async, verify_password_async, create_access_token
+from app.services.principal_cache import principal_cache
 from fastapi import HTTPException, status
 
-def signup_user(db: Session, name: str, email: str, password: str):
-    existing = db.query(User).filter(User.email == email).first()
+
+# ---------- Database Access ----------
+# AsyncSession (get_async_db): the routes only ever await, the database
+# on the async driver and bcrypt in its own pool
+async def _find_user(db: AsyncSession, email: str) -> Optional[User]:
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalars().first()
+
+
+async def signup_user(db: AsyncSession, name: str, email: str, password: str):
+    existing = await _find_user(db, email)
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     user = User(
         name=name,
         email=email,
-        password=hash_password(password)
+        password=await hash_password_async(password)
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+
+    # A re-created account must not resolve to a cached principal
+    principal_cache.invalidate(email)
     return user
 
 
-def login_user(db: Session, email: str, password: str):
-    user = db.query(User).filter(User.email == email).first()
-    if not user or not verify_password(password, user.password):
+async def login_user(db: AsyncSession, email: str, password: str):
+    user = await _find_user(db, email)
+    if not user or not await verify_password_async(password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
@@ -0,0 +1,378 @@
+import os
+import threading
+import time
+import uuid
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Union
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.bulk_import import BulkImport
+from app.models.resume import Resume
+from app.services.analysis_tasks import match_resumes, prepare_resumes
+from app.services.resume_embedding_store import add_resume_embedding
+from app.services.worker_pool import submit_to_pool
+from app.utils.metrics import DOCUMENTS
+
+
+RESUME_EXTENSIONS = (".pdf", ".docx")
+
+
+# ---------- Progress Report ----------
+@dataclass
+class BulkImportReport:
+    import_id: str
+    user_id: Optional[int] = None
+    status: str = "pending"          # pending | running | completed | failed
+    total: int = 0
+    processed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    matched: int = 0
+    failures: List[Dict[str, str]] = field(default_factory=list)
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    elapsed_seconds: float = 0.0
+
+    def add_failure(self, path: str, error: Union[str, Exception]):
+        self.failed += 1
+        self.failures.append({
+            "file": os.path.basename(path),
+            "error": error if isinstance(error, str) else _describe(error)
+        })
+
+    def as_dict(self) -> Dict:
+        return {
+            "import_id": self.import_id,
+            "status": self.status,
+            "total": self.total,
+            "processed": self.processed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "matched": self.matched,
+            "files_per_second": (
+                round(self.processed / self.elapsed_seconds, 2)
+                if self.elapsed_seconds else 0.0
+            ),
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "failures": self.failures
+        }
+
+
+def _describe(exc: Exception) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+# ---------- Report Storage ----------
+# Reports live in BulkImports so any API worker can serve the status
+# endpoint; the importing thread writes them after every batch
+_REPORT_FIELDS = (
+    "user_id", "status", "total", "processed", "succeeded", "failed",
+    "matched", "failures", "error", "started_at", "finished_at", "elapsed_seconds"
+)
+
+
+def save_report(report: BulkImportReport):
+    """Write the report to its BulkImports row, in a session of its own"""
+    db = SessionLocal()
+    try:
+        row = db.get(BulkImport, report.import_id) or BulkImport(id=report.import_id)
+        for name in _REPORT_FIELDS:
+            value = getattr(report, name)
+            setattr(row, name, list(value) if name == "failures" else value)
+        row.updated_at = datetime.utcnow()
+        db.add(row)
+        db.commit()
+    finally:
+        db.close()
+
+
+def register_import(user_id: int) -> BulkImportReport:
+    report = BulkImportReport(import_id=uuid.uuid4().hex, user_id=user_id)
+    save_report(report)
+    return report
+
+
+def _lease_expired() -> datetime:
+    return datetime.utcnow() - timedelta(seconds=settings.BULK_INGEST_LEASE_SECONDS)
+
+
+def fail_stale_imports(db: Session) -> int:
+    """
+    Mark imports whose process is gone (no report write within
+    BULK_INGEST_LEASE_SECONDS) as failed. Run at startup and when such an
+    import is polled.
+    """
+    now = datetime.utcnow()
+    count = (
+        db.query(BulkImport)
+        .filter(
+            BulkImport.status.in_(("pending", "running")),
+            BulkImport.updated_at < _lease_expired()
+        )
+        .update(
+            {
+                "status": "failed",
+                "error": "Interrupted: the importing process was restarted or killed",
+                "finished_at": now,
+                "updated_at": now
+            },
+            synchronize_session=False
+        )
+    )
+    db.commit()
+    return count
+
+
+def get_import(db: Session, import_id: str) -> Optional[BulkImportReport]:
+    row = db.get(BulkImport, import_id)
+    if row is None:
+        return None
+    if row.status in ("pending", "running") and row.updated_at < _lease_expired():
+        fail_stale_imports(db)
+        db.refresh(row)
+    report = BulkImportReport(import_id=row.id)
+    for name in _REPORT_FIELDS:
+        setattr(report, name, getattr(row, name))
+    report.failures = list(report.failures or [])
+    return report
+
+
+# ---------- Sources ----------
+def list_directory(directory: str) -> List[str]:
+    """Every PDF/DOCX under a directory, in a stable order"""
+    paths = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.lower().endswith(RESUME_EXTENSIONS):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+def _copy_limited(src, dst, limit: int) -> int:
+    """Copy at most limit bytes; declared zip sizes can lie"""
+    written = 0
+    while True:
+        chunk = src.read(1024 * 1024)
+        if not chunk:
+            return written
+        written += len(chunk)
+        if written > limit:
+            raise ValueError(f"Archive member exceeds {limit} bytes")
+        dst.write(chunk)
+
+
+def extract_archive(zip_path: str, dest_dir: str) -> List[str]:
+    """
+    Stream each PDF/DOCX member of a zip to dest_dir.
+    Member paths are flattened, so entries cannot escape dest_dir.
+    Archives over the BULK_INGEST_MAX_* limits are rejected with
+    ValueError and anything already extracted is removed.
+    """
+    os.makedirs(dest_dir, exist_ok=True)
+    paths = []
+    with zipfile.ZipFile(zip_path) as archive:
+        members = [
+            (i, info) for i, info in enumerate(archive.infolist())
+            if not info.is_dir()
+            and os.path.basename(info.filename).lower().endswith(RESUME_EXTENSIONS)
+        ]
+        if len(members) > settings.BULK_INGEST_MAX_FILES:
+            raise ValueError(
+                f"Archive holds {len(members)} resumes; the limit is {settings.BULK_INGEST_MAX_FILES}"
+            )
+
+        total = 0
+        try:
+            for i, info in members:
+                if info.file_size > settings.BULK_INGEST_MAX_FILE_BYTES:
+                    raise ValueError(
+                        f"{info.filename} is {info.file_size} bytes; "
+                        f"the limit is {settings.BULK_INGEST_MAX_FILE_BYTES}"
+                    )
+                if total + info.file_size > settings.BULK_INGEST_MAX_TOTAL_BYTES:
+                    raise ValueError(
+                        f"Archive exceeds {settings.BULK_INGEST_MAX_TOTAL_BYTES} bytes uncompressed"
+                    )
+
+                name = os.path.basename(info.filename)
+                path = os.path.join(dest_dir, f"{i:06d}_{name}")
+                paths.append(path)
+                with archive.open(info) as src, open(path, "wb") as dst:
+                    total += _copy_limited(
+                        src, dst,
+                        min(
+                            settings.BULK_INGEST_MAX_FILE_BYTES,
+                            settings.BULK_INGEST_MAX_TOTAL_BYTES - total
+                        )
+                    )
+        except Exception:
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+            raise
+    return paths
+
+
+# ---------- Worker Pool ----------
+def _in_pool(fn, items: List, *args):
+    """
+    Split items into one chunk per pool worker, run fn on every chunk at
+    once and yield (chunk, result, error) in order. The wait scales with
+    the chunk, as PARSER_TASK_TIMEOUT_SECONDS is a per-file budget.
+    """
+    size = -(-len(items) // max(settings.PARSER_POOL_SIZE, 1))
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    futures = [submit_to_pool(fn, chunk, *args) for chunk in chunks]
+    for chunk, future in zip(chunks, futures):
+        try:
+            yield chunk, future.result(timeout=settings.PARSER_TASK_TIMEOUT_SECONDS * len(chunk)), None
+        except Exception as exc:
+            yield chunk, None, exc
+
+
+# ---------- Pipeline ----------
+def ingest_files(
+    db: Session,
+    user_id: int,
+    paths: List[str],
+    report: BulkImportReport,
+    batch_size: int = None,
+    match: bool = False,
+    top_n: int = 5,
+    threshold: float = 0.6,
+    progress: Optional[Callable[[BulkImportReport], None]] = None
+) -> BulkImportReport:
+    """
+    Ingest resume files in batches. Extraction, NER and section embedding
+    run in chunks on the shared parser pool, so spaCy and the encoder stay
+    out of this process; each batch's resumes and vectors are stored in
+    one transaction. A file that fails is recorded in the report and the
+    batch carries on. Matching, if requested, runs at the end, also on
+    the pool.
+    """
+    batch_size = batch_size or settings.BULK_INGEST_BATCH_SIZE
+    report.total = len(paths)
+    report.status = "running"
+    report.started_at = datetime.utcnow()
+    started = time.perf_counter()
+    save_report(report)
+
+    to_match = []
+
+    for offset in range(0, len(paths), batch_size):
+        batch = paths[offset:offset + batch_size]
+
+        prepared = []
+        for chunk, result, error in _in_pool(prepare_resumes, batch):
+            if error is not None:
+                for path in chunk:
+                    report.add_failure(path, error)
+                continue
+            chunk_prepared, failures = result
+            prepared.extend(chunk_prepared)
+            for path, message in failures:
+                report.add_failure(path, message)
+
+        if prepared:
+            resumes = [
+                Resume(user_id=user_id, file_path=path, analysis_result=parsed)
+                for path, parsed, _ in prepared
+            ]
+            try:
+                db.add_all(resumes)
+                db.flush()
+                for resume, (_, _, resume_vectors) in zip(resumes, prepared):
+                    add_resume_embedding(db, resume.id, resume_vectors)
+                db.commit()
+                report.succeeded += len(resumes)
+                if match:
+                    to_match.extend(
+                        (resume.id, resume_vectors)
+                        for resume, (_, _, resume_vectors) in zip(resumes, prepared)
+                    )
+            except Exception as exc:
+                db.rollback()
+                for path, _, _ in prepared:
+                    report.add_failure(path, exc)
+
+        report.processed += len(batch)
+        report.elapsed_seconds = time.perf_counter() - started
+        save_report(report)
+        if progress:
+            progress(report)
+
+    for offset in range(0, len(to_match), batch_size):
+        for _, matched, error in _in_pool(
+            match_resumes, to_match[offset:offset + batch_size], top_n, threshold
+        ):
+            if error is not None:
+                raise error
+            report.matched += matched
+        save_report(report)
+
+    DOCUMENTS.inc(report.succeeded, source="bulk", outcome="succeeded")
+    DOCUMENTS.inc(report.failed, source="bulk", outcome="failed")
+
+    report.status = "completed"
+    report.finished_at = datetime.utcnow()
+    report.elapsed_seconds = time.perf_counter() - started
+    save_report(report)
+    if progress:
+        progress(report)
+    return report
+
+
+def run_bulk_import(
+    user_id: int,
+    paths: List[str],
+    report: BulkImportReport,
+    **options
+) -> BulkImportReport:
+    """Run a whole import with its own DB session"""
+    db = SessionLocal()
+    try:
+        ingest_files(db, user_id, paths, report, **options)
+    except Exception as exc:
+        report.status = "failed"
+        report.error = _describe(exc)
+        report.finished_at = datetime.utcnow()
+        save_report(report)
+    finally:
+        db.close()
+    return report
+
+
+def start_archive_import(
+    user_id: int,
+    zip_path: str,
+    dest_dir: str,
+    report: BulkImportReport,
+    **options
+) -> threading.Thread:
+    """
+    Unpack and ingest an uploaded archive on a background thread; the
+    heavy stages run on the parser pool, not in this thread.
+    """
+    def run():
+        try:
+            paths = extract_archive(zip_path, dest_dir)
+        except Exception as exc:
+            report.status = "failed"
+            report.error = _describe(exc)
+            report.finished_at = datetime.utcnow()
+            save_report(report)
+            return
+        run_bulk_import(user_id, paths, report, **options)
+
+    thread = threading.Thread(target=run, name=f"bulk-import-{report.import_id}", daemon=True)
+    thread.start()
+    return thread
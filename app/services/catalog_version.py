@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.job_catalog_state import JobCatalogState
+
+
+CATALOG_STATE_ID = 1
+
+
+def get_catalog_state(db: Session) -> Optional[JobCatalogState]:
+    return db.query(JobCatalogState).filter(JobCatalogState.id == CATALOG_STATE_ID).first()
+
+
+def get_catalog_version(db: Session) -> int:
+    """Current job catalog version (0 before the first job write)"""
+    version = (
+        db.query(JobCatalogState.version)
+        .filter(JobCatalogState.id == CATALOG_STATE_ID)
+        .scalar()
+    )
+    return version or 0
+
+
+def _advance(db: Session) -> int:
+    return (
+        db.query(JobCatalogState)
+        .filter(JobCatalogState.id == CATALOG_STATE_ID)
+        .update(
+            {
+                JobCatalogState.version: JobCatalogState.version + 1,
+                JobCatalogState.updated_at: datetime.utcnow()
+            },
+            synchronize_session=False
+        )
+    )
+
+
+def ensure_catalog_state(db: Session):
+    """Create the state row once (at startup) so job writes only ever UPDATE it"""
+    if get_catalog_state(db) is not None:
+        return
+    try:
+        db.add(JobCatalogState(id=CATALOG_STATE_ID, version=0, updated_at=datetime.utcnow()))
+        db.commit()
+    except IntegrityError:
+        # Another process seeded it first
+        db.rollback()
+
+
+def bump_catalog_version(db: Session):
+    """
+    Advance the catalog version inside the caller's transaction, so the
+    new version becomes visible together with the job change itself.
+    """
+    if _advance(db):
+        return
+
+    # No row yet (not seeded): insert it in a savepoint, so losing the race
+    # to a concurrent first write does not roll back the caller's job change
+    try:
+        with db.begin_nested():
+            db.add(JobCatalogState(
+                id=CATALOG_STATE_ID, version=1, updated_at=datetime.utcnow()
+            ))
+    except IntegrityError:
+        _advance(db)
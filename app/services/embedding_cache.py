@@ -0,0 +1,176 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical form used for cache keys: NFC, trimmed, single spaces.
+    Case is kept, since not every embedding model is uncased.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(text: str, model_name: str = None) -> str:
+    """Content address of an embedding: sha256(model name + normalized text)"""
+    model_name = model_name or settings.EMBEDDING_MODEL_NAME
+    payload = f"{model_name}\x00{normalize_text(text)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ---------- Disk Tier ----------
+class SQLiteVectorStore:
+    """Persistent key -> float32 vector table that survives restarts"""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key TEXT PRIMARY KEY,"
+            " vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vector FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+        return np.frombuffer(row[0], dtype=np.float32) if row else None
+
+    def put_many(self, items: Iterable[Tuple[str, np.ndarray]]):
+        rows = [
+            (key, np.asarray(vec, dtype=np.float32).tobytes())
+            for key, vec in items
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
+# ---------- Two-tier Cache ----------
+class EmbeddingCache:
+    """
+    Bounded in-memory LRU in front of an optional SQLite tier.
+    Disk hits are promoted into memory.
+    """
+
+    def __init__(self, max_entries: int, disk_path: str = ""):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.disk = SQLiteVectorStore(disk_path) if disk_path else None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 or self.disk is not None
+
+    def _remember(self, key: str, vec: np.ndarray):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = vec
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        key = cache_key(text)
+        with self._lock:
+            vec = self._entries.get(key)
+            if vec is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return vec
+
+        vec = self.disk.get(key) if self.disk is not None else None
+        with self._lock:
+            if vec is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, vec)
+        return vec
+
+    def put_many(self, items: Iterable[Tuple[str, np.ndarray]]):
+        entries = []
+        for text, vec in items:
+            vec = np.array(vec, dtype=np.float32)
+            vec.flags.writeable = False
+            entries.append((cache_key(text), vec))
+
+        with self._lock:
+            for key, vec in entries:
+                self._remember(key, vec)
+
+        if self.disk is not None:
+            self.disk.put_many(entries)
+
+    def put(self, text: str, vec: np.ndarray):
+        self.put_many([(text, vec)])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "disk_enabled": self.disk is not None
+            }
+
+
+embedding_cache = EmbeddingCache(
+    max_entries=settings.EMBEDDING_CACHE_SIZE,
+    disk_path=settings.EMBEDDING_CACHE_PATH
+)
+
+
+def lookup_many(texts: List[str]) -> Tuple[List[Optional[np.ndarray]], List[int]]:
+    """Cached vectors for texts (None where missing) and the indices to compute"""
+    if not embedding_cache.enabled:
+        return [None] * len(texts), [i for i, text in enumerate(texts) if text]
+
+    vectors, missing = [], []
+    for i, text in enumerate(texts):
+        vec = embedding_cache.get(text) if text else None
+        vectors.append(vec)
+        if text and vec is None:
+            missing.append(i)
+    return vectors, missing
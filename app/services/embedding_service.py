@@ -1,6 +1,236 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
-model = SentenceTransformer("all-MiniLM-L6-v2")
+from app.core.config import settings
+from app.services.embedding_cache import embedding_cache, lookup_many
+from app.utils.metrics import ENCODER_SECONDS, ENCODER_TEXTS
+
+
+# ---------- Shared Model ----------
+_model = None
+_model_lock = threading.Lock()
+
+
+def get_model() -> SentenceTransformer:
+    """Process-wide SentenceTransformer, loaded on first use"""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                _model = SentenceTransformer(settings.EMBEDDING_MODEL_NAME)
+    return _model
+
+
+def encode_batch(texts: Sequence[str]) -> np.ndarray:
+    """Encode texts in one forward pass per EMBEDDING_MAX_BATCH_SIZE chunk"""
+    with ENCODER_SECONDS.time():
+        vectors = get_model().encode(
+            list(texts),
+            batch_size=settings.EMBEDDING_MAX_BATCH_SIZE
+        )
+    ENCODER_TEXTS.inc(len(texts))
+    return vectors
+
+
+# ---------- Micro-batching Queue ----------
+class EmbeddingBatcher:
+    """
+    Coalesces single-text embedding requests from concurrent callers into
+    batched model.encode calls.
+
+    A background thread drains the queue, waiting at most max_wait_ms after
+    the first request for more texts, up to max_batch_size. Callers get a
+    concurrent.futures.Future: threads wait on .result(), async code
+    awaits it through aembed(), so both share one queue.
+    """
+
+    def __init__(self, max_batch_size: int, max_wait_ms: float):
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.texts = 0
+        self.max_batch_seen = 0
+        self.last_batch_size = 0
+        self.encode_seconds = 0.0
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="embedding-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, text: str) -> Future:
+        future = Future()
+        self._ensure_started()
+        self._queue.put((text, future))
+        return future
+
+    def _collect(self) -> List:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            # Drops futures whose caller already gave up (cancelled)
+            batch = [
+                (text, future) for text, future in self._collect()
+                if future.set_running_or_notify_cancel()
+            ]
+            if not batch:
+                continue
+
+            try:
+                self._encode(batch)
+            except Exception as exc:
+                # Never let one bad batch kill the thread or strand its callers
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+
+    def _encode(self, batch: List):
+        # Identical texts in one batch are encoded once
+        unique_texts = list(dict.fromkeys(text for text, _ in batch))
+
+        start = time.perf_counter()
+        vectors = encode_batch(unique_texts)
+        elapsed = time.perf_counter() - start
+
+        by_text = dict(zip(unique_texts, vectors))
+        for text, future in batch:
+            future.set_result(by_text[text])
+
+        with self._stats_lock:
+            self.batches += 1
+            self.texts += len(batch)
+            self.last_batch_size = len(batch)
+            self.max_batch_seen = max(self.max_batch_seen, len(batch))
+            self.encode_seconds += elapsed
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "batches": self.batches,
+                "texts": self.texts,
+                "avg_batch_size": round(self.texts / self.batches, 2) if self.batches else 0.0,
+                "max_batch_size_seen": self.max_batch_seen,
+                "last_batch_size": self.last_batch_size,
+                "encode_seconds": round(self.encode_seconds, 4),
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait_ms
+            }
+
+
+batcher = EmbeddingBatcher(
+    max_batch_size=settings.EMBEDDING_MAX_BATCH_SIZE,
+    max_wait_ms=settings.EMBEDDING_MAX_WAIT_MS
+)
+
+
+# ---------- Public API ----------
+def _resolve(texts: Sequence[str], batched: bool) -> List[Optional[np.ndarray]]:
+    """Serve texts from the embedding cache, encoding and caching the misses"""
+    vectors, missing = lookup_many(list(texts))
+    if not missing:
+        return vectors
+
+    if batched and settings.EMBEDDING_BATCHING_ENABLED:
+        futures = [batcher.submit(texts[i]) for i in missing]
+        timeout = settings.EMBEDDING_RESULT_TIMEOUT_SECONDS
+        computed = [future.result(timeout=timeout) for future in futures]
+    else:
+        computed = encode_batch([texts[i] for i in missing])
+
+    for i, vec in zip(missing, computed):
+        vectors[i] = vec
+    embedding_cache.put_many((texts[i], vectors[i]) for i in missing)
+    return vectors
+
 
 def generate_embedding(text: str):
-    return model.encode(text)
+    """Embed one text, sharing a batch with any concurrent callers"""
+    if not text:
+        return encode_batch([text])[0]
+    return _resolve([text], batched=True)[0]
+
+
+def embed(text: str):
+    """Generate vector embedding for a given text (None for empty text)"""
+    if not text:
+        return None
+    return generate_embedding(text)
+
+
+async def aembed(text: str):
+    """
+    Awaitable variant of embed() for async routes: the event loop is free
+    while the text waits for its batch. Raises asyncio.TimeoutError after
+    EMBEDDING_RESULT_TIMEOUT_SECONDS; the request is then cancelled and
+    dropped from its batch.
+    """
+    if not text:
+        return None
+
+    vectors, missing = lookup_many([text])
+    if not missing:
+        return vectors[0]
+
+    if settings.EMBEDDING_BATCHING_ENABLED:
+        pending = asyncio.wrap_future(batcher.submit(text))
+    else:
+        pending = asyncio.get_running_loop().run_in_executor(
+            None, lambda: encode_batch([text])[0]
+        )
+    vec = await asyncio.wait_for(pending, settings.EMBEDDING_RESULT_TIMEOUT_SECONDS)
+    embedding_cache.put(text, vec)
+    return vec
+
+
+def embed_texts(texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+    """
+    Embed a few related texts (e.g. resume sections) as one request:
+    all are queued before waiting, so they land in the same batch.
+    Empty texts map to None, like embed().
+    """
+    return _resolve(texts, batched=True)
+
+
+def embed_many(texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+    """
+    Embed a list of texts directly in large batches (bulk jobs).
+    Empty texts map to None, like embed().
+    """
+    return _resolve(texts, batched=False)
+
+
+def get_embedding_stats() -> Dict:
+    return {
+        "model": settings.EMBEDDING_MODEL_NAME,
+        "batching_enabled": settings.EMBEDDING_BATCHING_ENABLED,
+        **batcher.stats()
+    }
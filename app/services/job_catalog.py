@@ -0,0 +1,385 @@
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# ---------- Scoring Weights ----------
+DEFAULT_WEIGHTS = {
+    "skills": 0.5,
+    "experience": 0.3,
+    "education": 0.2
+}
+
+
+# ---------- Storage ----------
+STORAGE_DTYPES = ("float32", "float16", "int8")
+
+# Rows converted back to float32 per scan step: 256 x 384 float32 stays in
+# L2, which is what makes an int8 scan faster than a float32 one
+SCAN_BLOCK_ROWS = 256
+
+# job_ids -> (raw skills rows, raw description rows) as float32, for rescoring
+ExactSource = Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]
+
+
+# ---------- Vector Helpers ----------
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row; all-zero rows stay zero"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def normalize_vector(vec, dimension: int) -> np.ndarray:
+    """L2-normalize a single embedding; None becomes a zero vector"""
+    if vec is None:
+        return np.zeros(dimension, dtype=np.float32)
+    vec = np.asarray(vec, dtype=np.float32)
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+
+def stack_vectors(vectors: Sequence, dimension: int) -> np.ndarray:
+    """Stack optional embeddings into a matrix, using zero rows for None"""
+    matrix = np.zeros((len(vectors), dimension), dtype=np.float32)
+    for i, vec in enumerate(vectors):
+        if vec is not None:
+            matrix[i] = vec
+    return matrix
+
+
+def select_top_n(
+    scores: np.ndarray,
+    top_n: int,
+    threshold: float
+) -> np.ndarray:
+    """
+    Indices of the top N scores at or above threshold, best first.
+    Uses a partial selection so only the winners get sorted.
+    """
+    candidates = np.flatnonzero(scores >= threshold)
+    if top_n <= 0 or candidates.size == 0:
+        return candidates[:0]
+
+    if candidates.size > top_n:
+        part = np.argpartition(-scores[candidates], top_n - 1)[:top_n]
+        candidates = candidates[part]
+
+    # Best score first; ties keep catalog order
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order]
+
+
+# ---------- Quantized Matrix ----------
+class QuantizedMatrix:
+    """
+    Normalized rows stored as float16, or as int8 with one float32 scale per
+    row (x ~ scale * q, scale = max|x| / 127). Scans dequantize a block at a
+    time, so no full float32 copy is ever materialized.
+    """
+
+    def __init__(self, matrix: np.ndarray, storage: str):
+        if storage not in ("float16", "int8"):
+            raise ValueError(f"Unsupported quantized storage: {storage}")
+
+        matrix = np.asarray(matrix, dtype=np.float32)
+        self.storage = storage
+        self.scales = None
+        if storage == "float16":
+            self.data = matrix.astype(np.float16)
+        else:
+            peak = np.abs(matrix).max(axis=1) if len(matrix) else np.zeros(0, dtype=np.float32)
+            self.scales = np.where(peak > 0, peak / 127.0, 1.0).astype(np.float32)
+            self.data = np.rint(matrix / self.scales[:, None]).astype(np.int8)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.data.shape
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes + (0 if self.scales is None else self.scales.nbytes)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def _dequantize(self, data: np.ndarray, scales: Optional[np.ndarray]) -> np.ndarray:
+        out = data.astype(np.float32)
+        if scales is not None:
+            out *= scales[..., None]
+        return out
+
+    def __getitem__(self, rows) -> np.ndarray:
+        """Approximate float32 rows (e.g. to feed the ANN index)"""
+        return self._dequantize(self.data[rows], None if self.scales is None else self.scales[rows])
+
+    def __array__(self, dtype=None, copy=None):
+        out = self[:]
+        return out if dtype is None else out.astype(dtype)
+
+    def dot(self, query: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Approximate rows @ query over all rows, or only the given ones"""
+        data = self.data if rows is None else self.data[rows]
+        scales = self.scales if rows is None or self.scales is None else self.scales[rows]
+        query = np.asarray(query, dtype=np.float32)
+
+        out = np.empty(len(data), dtype=np.float32)
+        for start in range(0, len(data), SCAN_BLOCK_ROWS):
+            stop = start + SCAN_BLOCK_ROWS
+            # int8: (scale * q) . query == scale * (q . query)
+            out[start:stop] = data[start:stop].astype(np.float32) @ query
+        if scales is not None:
+            out *= scales
+        return out
+
+
+def _matvec(matrix, query: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+    if isinstance(matrix, QuantizedMatrix):
+        return matrix.dot(query, rows)
+    if rows is not None:
+        matrix = matrix[rows]
+    return matrix @ query
+
+
+# ---------- Job Catalog ----------
+class JobCatalog:
+    """
+    In-memory job embedding catalog.
+
+    Rows of skills_matrix / description_matrix are L2-normalized, so cosine
+    similarity against a normalized query is a single matrix-vector product.
+
+    With storage "float16" or "int8" the matrices are QuantizedMatrix and
+    scores are approximate. If exact_source is given, the best
+    rescore_candidates jobs are then rescored against their float32 vectors.
+    """
+
+    def __init__(
+        self,
+        job_ids: np.ndarray,
+        skills_matrix: np.ndarray,
+        description_matrix: np.ndarray,
+        storage: str = "float32",
+        exact_source: Optional[ExactSource] = None,
+        rescore_candidates: int = 0
+    ):
+        if storage not in STORAGE_DTYPES:
+            raise ValueError(f"Unknown catalog storage {storage!r}; expected one of {STORAGE_DTYPES}")
+
+        self.job_ids = np.asarray(job_ids, dtype=np.int64)
+        self.storage = storage
+        self.skills_matrix = normalize_rows(skills_matrix)
+        self.description_matrix = normalize_rows(description_matrix)
+        self.dimension = self.skills_matrix.shape[1]
+        if storage != "float32":
+            self.skills_matrix = QuantizedMatrix(self.skills_matrix, storage)
+            self.description_matrix = QuantizedMatrix(self.description_matrix, storage)
+
+        self.exact_source = exact_source
+        self.rescore_candidates = rescore_candidates
+        self._row_of = None
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the vector matrices"""
+        return self.skills_matrix.nbytes + self.description_matrix.nbytes
+
+    @property
+    def rescoring(self) -> bool:
+        return (
+            self.storage != "float32"
+            and self.exact_source is not None
+            and self.rescore_candidates > 0
+        )
+
+    def rows_for(self, job_ids: Sequence[int]) -> np.ndarray:
+        """Catalog row indices for the given job ids (unknown ids are skipped)"""
+        if self._row_of is None:
+            self._row_of = {int(job_id): i for i, job_id in enumerate(self.job_ids)}
+        return np.asarray(
+            [self._row_of[j] for j in job_ids if j in self._row_of],
+            dtype=np.int64
+        )
+
+    def queries(
+        self,
+        skill_vec,
+        experience_vec,
+        education_vec,
+        weights: Optional[Dict[str, float]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Weighted (skills_query, description_query) for one resume"""
+        weights = weights or DEFAULT_WEIGHTS
+
+        skill_query = weights["skills"] * normalize_vector(skill_vec, self.dimension)
+        # Experience and education are both scored against the description,
+        # so their weighted queries fold into one product
+        description_query = (
+            weights["experience"] * normalize_vector(experience_vec, self.dimension)
+            + weights["education"] * normalize_vector(education_vec, self.dimension)
+        )
+        return skill_query, description_query
+
+    def score(
+        self,
+        skill_vec,
+        experience_vec,
+        education_vec,
+        weights: Optional[Dict[str, float]] = None,
+        rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Weighted similarity of one resume against every job, or only
+        against the given catalog rows.
+        """
+        skill_query, description_query = self.queries(
+            skill_vec, experience_vec, education_vec, weights
+        )
+
+        return (
+            _matvec(self.skills_matrix, skill_query, rows)
+            + _matvec(self.description_matrix, description_query, rows)
+        )
+
+    def rescore(
+        self,
+        job_ids: np.ndarray,
+        skill_vec,
+        experience_vec,
+        education_vec,
+        weights: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """Exact float32 scores for the given jobs, read from exact_source"""
+        skill_query, description_query = self.queries(
+            skill_vec, experience_vec, education_vec, weights
+        )
+        skills_rows, description_rows = self.exact_source(job_ids)
+        return (
+            normalize_rows(skills_rows) @ skill_query
+            + normalize_rows(description_rows) @ description_query
+        )
+
+    def top_matches(
+        self,
+        skill_vec,
+        experience_vec,
+        education_vec,
+        top_n: int = 5,
+        threshold: float = 0.6,
+        weights: Optional[Dict[str, float]] = None,
+        candidate_ids: Optional[Sequence[int]] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        [(job_id, score), ...] for the best jobs, highest score first.
+        With candidate_ids, only those jobs are scored (exact rescoring of
+        an approximate shortlist).
+        """
+        if len(self) == 0:
+            return []
+
+        rows = None if candidate_ids is None else np.sort(self.rows_for(candidate_ids))
+        scores = self.score(skill_vec, experience_vec, education_vec, weights, rows)
+        job_ids = self.job_ids if rows is None else self.job_ids[rows]
+
+        if self.rescoring and top_n > 0:
+            # Shortlist on approximate scores, ignoring the threshold, which
+            # is applied to the exact scores; sorted so ties keep catalog order
+            shortlist = np.sort(
+                select_top_n(scores, max(self.rescore_candidates, top_n), -np.inf)
+            )
+            job_ids = job_ids[shortlist]
+            scores = self.rescore(job_ids, skill_vec, experience_vec, education_vec, weights)
+
+        winners = select_top_n(scores, top_n, threshold)
+        return [(int(job_ids[i]), float(scores[i])) for i in winners]
+
+
+def build_job_catalog(
+    job_ids: Sequence[int],
+    skills_vectors: Sequence,
+    description_vectors: Sequence,
+    dimension: Optional[int] = None,
+    storage: str = "float32",
+    exact_source: Optional[ExactSource] = None,
+    rescore_candidates: int = 0
+) -> JobCatalog:
+    """Build a catalog from per-job vectors (None entries become zero rows)"""
+    if dimension is None:
+        dimension = next(
+            (len(v) for v in (*skills_vectors, *description_vectors) if v is not None),
+            0
+        )
+
+    return JobCatalog(
+        job_ids=np.asarray(job_ids, dtype=np.int64),
+        skills_matrix=stack_vectors(skills_vectors, dimension),
+        description_matrix=stack_vectors(description_vectors, dimension),
+        storage=storage,
+        exact_source=exact_source,
+        rescore_candidates=rescore_candidates
+    )
+
+
+# ---------- Storage Evaluation ----------
+def evaluate_storage(
+    reference: JobCatalog,
+    catalog: JobCatalog,
+    queries: Sequence[Sequence],
+    k: int = 10
+) -> Dict[str, float]:
+    """
+    Compare a (quantized) catalog against the float32 reference.
+
+    queries: iterable of (skill_vec, experience_vec, education_vec)
+    Returns recall@k, top-1 agreement, the worst score error of returned
+    matches, and mean full-scan / top-k latency of both in milliseconds.
+    """
+    hits, total, top1 = 0, 0, 0
+    max_error = 0.0
+    timings = {"reference_scan_ms": 0.0, "scan_ms": 0.0, "reference_ms": 0.0, "ms": 0.0}
+
+    for skill_vec, experience_vec, education_vec in queries:
+        for key, current in (("reference_scan_ms", reference), ("scan_ms", catalog)):
+            start = time.perf_counter()
+            current.score(skill_vec, experience_vec, education_vec)
+            timings[key] += (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        exact = reference.top_matches(
+            skill_vec, experience_vec, education_vec, top_n=k, threshold=-np.inf
+        )
+        timings["reference_ms"] += (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        approx = catalog.top_matches(
+            skill_vec, experience_vec, education_vec, top_n=k, threshold=-np.inf
+        )
+        timings["ms"] += (time.perf_counter() - start) * 1000
+
+        exact_ids = [job_id for job_id, _ in exact]
+        hits += len(set(exact_ids) & {job_id for job_id, _ in approx})
+        total += len(exact_ids)
+        top1 += bool(exact and approx and exact[0][0] == approx[0][0])
+
+        if approx:
+            exact_scores = reference.score(
+                skill_vec, experience_vec, education_vec,
+                rows=reference.rows_for([job_id for job_id, _ in approx])
+            )
+            max_error = max(
+                max_error,
+                float(np.max(np.abs(exact_scores - [score for _, score in approx])))
+            )
+
+    n = max(len(queries), 1)
+    return {
+        "recall_at_k": hits / total if total else 1.0,
+        "top1_agreement": top1 / n,
+        "max_score_error": max_error,
+        **{key: value / n for key, value in timings.items()}
+    }
@@ -0,0 +1,304 @@
+import hashlib
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.job_embedding import JobEmbedding
+from app.models.job_posting import JobPosting as Job
+from app.services.job_catalog import JobCatalog, build_job_catalog, stack_vectors
+from app.services.embedding_service import embed
+from app.services.catalog_version import get_catalog_version
+
+
+# SQL Server caps a statement at ~2100 parameters
+LOOKUP_CHUNK_SIZE = 1000
+
+JobVectors = Tuple[Optional[np.ndarray], Optional[np.ndarray]]
+
+
+# ---------- Vector Serialization ----------
+def encode_vector(vec) -> Optional[bytes]:
+    """Serialize an embedding as raw float32 bytes"""
+    if vec is None:
+        return None
+    return np.asarray(vec, dtype=np.float32).tobytes()
+
+
+def decode_vector(blob: Optional[bytes]) -> Optional[np.ndarray]:
+    """Restore an embedding stored by encode_vector"""
+    if blob is None:
+        return None
+    return np.frombuffer(blob, dtype=np.float32)
+
+
+def record_vectors(record: JobEmbedding) -> JobVectors:
+    """(skills_vector, description_vector) of a stored embedding row"""
+    return decode_vector(record.skills_vector), decode_vector(record.description_vector)
+
+
+def job_content_hash(job: Job) -> str:
+    """Hash of the job fields that feed the embeddings"""
+    content = f"{job.skills or ''}\x1f{job.description or ''}"
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def is_current(record: Optional[JobEmbedding], job: Job) -> bool:
+    """True when a stored embedding matches the active model and job content"""
+    return (
+        record is not None
+        and record.model_name == settings.EMBEDDING_MODEL_NAME
+        and record.content_hash == job_content_hash(job)
+    )
+
+
+# ---------- Write Path ----------
+def upsert_job_embedding(
+    db: Session,
+    job: Job,
+    record: Optional[JobEmbedding] = None,
+    commit: bool = True
+) -> JobEmbedding:
+    """
+    Compute skill and description vectors for a job and store them.
+    Existing rows for the active model are updated in place.
+    """
+    if record is None:
+        record = (
+            db.query(JobEmbedding)
+            .filter(
+                JobEmbedding.job_id == job.id,
+                JobEmbedding.model_name == settings.EMBEDDING_MODEL_NAME
+            )
+            .first()
+        )
+
+    return write_job_embedding(
+        db, job, (embed(job.skills), embed(job.description)), record, commit
+    )
+
+
+def write_job_embedding(
+    db: Session,
+    job: Job,
+    vectors: JobVectors,
+    record: Optional[JobEmbedding] = None,
+    commit: bool = False
+) -> JobEmbedding:
+    """
+    Store already computed (skills, description) vectors for a job.
+    record is the job's existing row for the active model, if any; no
+    lookup is made, so bulk writers can fetch existing rows in one query.
+    """
+    skills_vec, description_vec = vectors
+    dimension = next(
+        (len(v) for v in (skills_vec, description_vec) if v is not None), 0
+    )
+
+    if record is None:
+        record = JobEmbedding(
+            job_id=job.id,
+            model_name=settings.EMBEDDING_MODEL_NAME
+        )
+        db.add(record)
+
+    record.content_hash = job_content_hash(job)
+    record.dimension = dimension
+    record.skills_vector = encode_vector(skills_vec)
+    record.description_vector = encode_vector(description_vec)
+
+    if commit:
+        db.commit()
+
+    return record
+
+
+# ---------- Read Path ----------
+def fetch_embedding_records(db: Session, job_ids: List[int]) -> Dict[int, JobEmbedding]:
+    """{job_id: JobEmbedding} for the active model, in chunked IN queries"""
+    records = {}
+    for start in range(0, len(job_ids), LOOKUP_CHUNK_SIZE):
+        chunk = job_ids[start:start + LOOKUP_CHUNK_SIZE]
+        rows = (
+            db.query(JobEmbedding)
+            .filter(
+                JobEmbedding.job_id.in_(chunk),
+                JobEmbedding.model_name == settings.EMBEDDING_MODEL_NAME
+            )
+            .all()
+        )
+        records.update({r.job_id: r for r in rows})
+    return records
+
+
+def load_job_vectors(db: Session, jobs: List[Job]) -> Dict[int, JobVectors]:
+    """
+    Return {job_id: (skills_vector, description_vector)} for the given jobs.
+
+    Stored vectors are reused; jobs that were never embedded, or whose
+    content changed since, are encoded once and written back.
+    """
+    records = fetch_embedding_records(db, [job.id for job in jobs])
+
+    stale = False
+    vectors = {}
+    for job in jobs:
+        record = records.get(job.id)
+        if not is_current(record, job):
+            record = upsert_job_embedding(db, job, record=record, commit=False)
+            stale = True
+
+        vectors[job.id] = record_vectors(record)
+
+    if stale:
+        db.commit()
+
+    return vectors
+
+
+# ---------- Catalog Matrices ----------
+_catalog_lock = threading.Lock()
+_catalog_cache: Dict = {"key": None, "catalog": None}
+
+
+def _catalog_fingerprint(db: Session) -> Tuple:
+    """
+    Cheap summary that changes whenever jobs or their vectors are written:
+    the catalog version covers job edits, the counts cover backfills.
+    """
+    jobs = db.query(func.count(Job.id), func.max(Job.id)).one()
+    vectors = (
+        db.query(func.count(JobEmbedding.id), func.max(JobEmbedding.id))
+        .filter(JobEmbedding.model_name == settings.EMBEDDING_MODEL_NAME)
+        .one()
+    )
+    return (
+        settings.EMBEDDING_MODEL_NAME,
+        get_catalog_version(db),
+        tuple(jobs),
+        tuple(vectors)
+    )
+
+
+def embed_missing_jobs(db: Session) -> int:
+    """Embed jobs that have no stored vectors for the active model"""
+    missing = (
+        db.query(Job)
+        .outerjoin(
+            JobEmbedding,
+            and_(
+                JobEmbedding.job_id == Job.id,
+                JobEmbedding.model_name == settings.EMBEDDING_MODEL_NAME
+            )
+        )
+        .filter(JobEmbedding.id.is_(None))
+        .all()
+    )
+    for job in missing:
+        upsert_job_embedding(db, job, record=None, commit=False)
+    if missing:
+        db.commit()
+    return len(missing)
+
+
+def fetch_exact_vectors(job_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    float32 (skills, description) rows for the given jobs, in order, read
+    from JobEmbeddings; rescoring source for quantized catalogs. Uses its own
+    session since the catalog outlives the request that built it.
+    """
+    job_ids = [int(job_id) for job_id in job_ids]
+    db = SessionLocal()
+    try:
+        records = fetch_embedding_records(db, job_ids)
+    finally:
+        db.close()
+
+    vectors = [record_vectors(records[j]) if j in records else (None, None) for j in job_ids]
+    dimension = next(
+        (len(v) for pair in vectors for v in pair if v is not None), 0
+    )
+    return (
+        stack_vectors([skills for skills, _ in vectors], dimension),
+        stack_vectors([description for _, description in vectors], dimension)
+    )
+
+
+def load_job_catalog(db: Session) -> JobCatalog:
+    """
+    Return the whole job catalog as normalized NumPy matrices, stored as
+    settings.CATALOG_STORAGE. The catalog is kept per process and rebuilt
+    only when jobs change.
+    """
+    with _catalog_lock:
+        embed_missing_jobs(db)
+
+        key = _catalog_fingerprint(db)
+        if _catalog_cache["key"] == key:
+            return _catalog_cache["catalog"]
+
+        rows = (
+            db.query(
+                JobEmbedding.job_id,
+                JobEmbedding.skills_vector,
+                JobEmbedding.description_vector
+            )
+            .filter(JobEmbedding.model_name == settings.EMBEDDING_MODEL_NAME)
+            .order_by(JobEmbedding.job_id)
+            .all()
+        )
+
+        catalog = build_job_catalog(
+            job_ids=[r.job_id for r in rows],
+            skills_vectors=[decode_vector(r.skills_vector) for r in rows],
+            description_vectors=[decode_vector(r.description_vector) for r in rows],
+            storage=settings.CATALOG_STORAGE,
+            exact_source=fetch_exact_vectors,
+            rescore_candidates=settings.CATALOG_RESCORE_CANDIDATES
+        )
+
+        _catalog_cache["key"] = key
+        _catalog_cache["catalog"] = catalog
+        return catalog
+
+
+# ---------- Backfill ----------
+def backfill_job_embeddings(
+    db: Session,
+    batch_size: int = 200,
+    force: bool = False
+) -> Dict[str, int]:
+    """
+    Embed every job whose stored vectors are missing or out of date.
+    Commits once per batch so a long backfill can be resumed.
+    """
+    stats = {"scanned": 0, "embedded": 0}
+    last_id = 0
+
+    while True:
+        jobs = (
+            db.query(Job)
+            .filter(Job.id > last_id)
+            .order_by(Job.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not jobs:
+            break
+
+        records = fetch_embedding_records(db, [job.id for job in jobs])
+        for job in jobs:
+            record = records.get(job.id)
+            if force or not is_current(record, job):
+                upsert_job_embedding(db, job, record=record, commit=False)
+                stats["embedded"] += 1
+
+        db.commit()
+        stats["scanned"] += len(jobs)
+        last_id = jobs[-1].id
+
+    return stats
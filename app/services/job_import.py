@@ -0,0 +1,283 @@
+import csv
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, IO, Iterator, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.job_posting import JobPosting as Job
+from app.schemas.job import JobImportRow
+from app.services.ann_index import index_job
+from app.services.catalog_version import bump_catalog_version
+from app.services.embedding_service import embed_many
+from app.services.match_worker import enqueue_job_matching
+from app.services.job_embedding_store import (
+    LOOKUP_CHUNK_SIZE, fetch_embedding_records, is_current, write_job_embedding
+)
+
+
+IMPORT_FORMATS = ("jsonl", "csv")
+
+# CSV rows carry skills in one cell: "python; sql" or "python|sql" or "python,sql"
+_CSV_SKILL_SEPARATORS = re.compile(r"[;|,]")
+
+# Failures kept in a report; the count is always exact
+MAX_REPORTED_FAILURES = 1000
+
+
+# ---------- Report ----------
+@dataclass
+class JobImportReport:
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    failures: List[Dict] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def add_failure(self, line: int, error: str, external_key: Optional[str] = None):
+        self.failed += 1
+        if len(self.failures) < MAX_REPORTED_FAILURES:
+            self.failures.append({
+                "line": line,
+                "external_key": external_key,
+                "error": error
+            })
+
+    def as_dict(self) -> Dict:
+        return {
+            "rows": self.rows,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "failed": self.failed,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "rows_per_second": (
+                round(self.rows / self.elapsed_seconds, 1)
+                if self.elapsed_seconds else 0.0
+            ),
+            "failures": self.failures
+        }
+
+
+# ---------- Row Parsing ----------
+ParsedRow = Tuple[int, Union[JobImportRow, str], Optional[str]]
+
+
+def detect_format(filename: str) -> str:
+    name = filename.lower()
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if name.endswith(".csv"):
+        return "csv"
+    raise ValueError("Unsupported import file. Use .jsonl or .csv")
+
+
+def _raw_rows(stream: IO[str], fmt: str) -> Iterator[Tuple[int, Union[Dict, str]]]:
+    """(line number, raw dict or error message) for each record, streamed"""
+    if fmt == "jsonl":
+        for line_no, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError as exc:
+                yield line_no, f"Invalid JSON: {exc}"
+                continue
+            yield line_no, data if isinstance(data, dict) else "Expected a JSON object"
+
+    elif fmt == "csv":
+        reader = csv.DictReader(stream)
+        for data in reader:
+            data = dict(data)
+            if isinstance(data.get("skills"), str):
+                data["skills"] = [
+                    s.strip() for s in _CSV_SKILL_SEPARATORS.split(data["skills"]) if s.strip()
+                ]
+            yield reader.line_num, data
+
+    else:
+        raise ValueError(f"Unknown import format: {fmt}")
+
+
+def iter_job_rows(stream: IO[str], fmt: str) -> Iterator[ParsedRow]:
+    """Validate rows one at a time: (line, JobImportRow or error, external_key)"""
+    for line_no, data in _raw_rows(stream, fmt):
+        if isinstance(data, str):
+            yield line_no, data, None
+            continue
+
+        key = data.get("external_key")
+        try:
+            yield line_no, JobImportRow(**data), key
+        except ValidationError as exc:
+            errors = "; ".join(
+                f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in exc.errors()
+            )
+            yield line_no, errors, key
+
+
+# ---------- Upsert ----------
+def _existing_jobs(db: Session, keys: List[str]) -> Dict[str, Job]:
+    jobs = {}
+    for start in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+        chunk = keys[start:start + LOOKUP_CHUNK_SIZE]
+        jobs.update({
+            job.external_key: job
+            for job in db.query(Job).filter(Job.external_key.in_(chunk))
+        })
+    return jobs
+
+
+def _import_batch(
+    db: Session,
+    batch: List[Tuple[int, JobImportRow]],
+    report: JobImportReport
+) -> Tuple[List[int], List[Tuple[int, Tuple]]]:
+    """
+    Upsert one batch in a single transaction. Returns the ids of inserted
+    or updated jobs and (job_id, vectors) for every job whose embeddings
+    were written.
+    """
+    # A key repeated within the batch: the last row wins. Counted only once
+    # the batch succeeds, so a failed batch retried row by row is not
+    # counted twice
+    latest = {row.external_key: (line, row) for line, row in batch}
+    unchanged = len(batch) - len(latest)
+
+    existing = _existing_jobs(db, list(latest))
+
+    changed = []
+    for key, (line, row) in latest.items():
+        skills = ",".join(row.skills)
+        job = existing.get(key)
+        if job is None:
+            job = Job(
+                external_key=key,
+                job_title=row.job_title,
+                skills=skills,
+                description=row.description
+            )
+            db.add(job)
+            changed.append((job, True))
+        elif (job.job_title, job.skills, job.description) != (row.job_title, skills, row.description):
+            job.job_title = row.job_title
+            job.skills = skills
+            job.description = row.description
+            job.matched_at = None
+            changed.append((job, False))
+        else:
+            unchanged += 1
+
+    if not changed:
+        report.unchanged += unchanged
+        return [], []
+
+    db.flush()
+
+    # Embeddings only for jobs whose content actually changed
+    records = fetch_embedding_records(db, [job.id for job, _ in changed])
+    to_embed = [job for job, _ in changed if not is_current(records.get(job.id), job)]
+
+    # One encoder run for every skills and description text in the batch
+    texts = [text for job in to_embed for text in (job.skills, job.description)]
+    flat = embed_many(texts)
+
+    embedded = []
+    for i, job in enumerate(to_embed):
+        vectors = (flat[2 * i], flat[2 * i + 1])
+        write_job_embedding(db, job, vectors, records.get(job.id))
+        embedded.append((job.id, vectors))
+
+    # Read before commit expires the objects
+    changed_ids = [job.id for job, _ in changed]
+
+    bump_catalog_version(db)
+    db.commit()
+
+    report.unchanged += unchanged
+    report.inserted += sum(1 for _, is_new in changed if is_new)
+    report.updated += sum(1 for _, is_new in changed if not is_new)
+    return changed_ids, embedded
+
+
+def _import_rows(
+    db: Session,
+    batch: List[Tuple[int, JobImportRow]],
+    report: JobImportReport
+) -> Tuple[List[int], List[Tuple[int, Tuple]]]:
+    """
+    Fallback for a batch that failed to commit: one transaction per row,
+    so good rows still land and only the failing rows are reported.
+    """
+    latest = {row.external_key: (line, row) for line, row in batch}
+    report.unchanged += len(batch) - len(latest)
+
+    changed_ids, embedded = [], []
+    for line, row in latest.values():
+        try:
+            row_ids, row_embedded = _import_batch(db, [(line, row)], report)
+        except Exception as exc:
+            db.rollback()
+            report.add_failure(line, f"{type(exc).__name__}: {exc}", row.external_key)
+            continue
+        changed_ids += row_ids
+        embedded += row_embedded
+    return changed_ids, embedded
+
+
+def import_jobs(
+    db: Session,
+    stream: IO[str],
+    fmt: str,
+    batch_size: int = None,
+    progress=None
+) -> JobImportReport:
+    """
+    Stream-validate a JSON Lines / CSV feed and upsert it by external_key,
+    batch_size rows per transaction. Invalid rows are reported and skipped;
+    a batch that fails to commit is rolled back and retried row by row, so
+    only the rows that fail on their own are reported.
+    """
+    batch_size = batch_size or settings.JOB_IMPORT_BATCH_SIZE
+    report = JobImportReport()
+    started = time.perf_counter()
+
+    def flush(batch):
+        try:
+            changed_ids, embedded = _import_batch(db, batch, report)
+        except Exception:
+            db.rollback()
+            changed_ids, embedded = _import_rows(db, batch, report)
+
+        # Only after commit, so the ANN index never holds uncommitted jobs
+        for job_id, vectors in embedded:
+            index_job(job_id, *vectors)
+        enqueue_job_matching(changed_ids)
+
+        report.elapsed_seconds = time.perf_counter() - started
+        if progress:
+            progress(report)
+
+    batch = []
+    for line, row, key in iter_job_rows(stream, fmt):
+        report.rows += 1
+        if isinstance(row, str):
+            report.add_failure(line, row, key)
+            continue
+
+        batch.append((line, row))
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+
+    if batch:
+        flush(batch)
+
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
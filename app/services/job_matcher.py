@@ -1,26 +1,28 @@
 from typing import List, Dict
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 
+from app.core.config import settings
 from app.models.job_match import JobMatch
-from typing import List, Dict
+from app.models.job_match_history import JobMatchHistory
+from typing import List, Dict, Optional, Tuple
 from app.models.job_posting import JobPosting as Job  # import your Job model
 from app.models.resume import Resume
+from app.services.job_catalog import JobCatalog, build_job_catalog
+from app.services.ann_index import ann_enabled, get_ann_index
+from app.services.embedding_service import embed, embed_texts  # shared, batched encoder
+from app.services.job_embedding_store import (
+    fetch_embedding_records, is_current, load_job_catalog, record_vectors,
+    upsert_job_embedding
+)
+from app.services.resume_catalog import ResumeCatalog
+from app.services.match_store import upsert_job_matches
+from app.utils.metrics import JOBS_SCORED, MATCHER_SECONDS
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
-# ----- Load embedding model once -----
-model = SentenceTransformer("all-MiniLM-L6-v2")
-
-
-# ---------- Embedding & Similarity Utilities ----------
-def embed(text: str):
-    """Generate vector embedding for a given text"""
-    if not text:
-        return None
-    return model.encode([text])[0]
-
-
+# ---------- Similarity Utilities ----------
 def similarity(vec1, vec2):
     """Compute cosine similarity between two embeddings"""
     if vec1 is None or vec2 is None:
@@ -28,16 +30,213 @@ def similarity(vec1, vec2):
     return cosine_similarity([vec1], [vec2])[0][0]
 
 
+# ---------- Resume Sections ----------
+def resume_match_data(analysis_result: Dict) -> Dict:
+    """
+    Flatten a parsed resume (parse_resume output) into the text sections
+    the matcher embeds.
+    """
+    analysis_result = analysis_result or {}
+
+    experience = analysis_result.get("experience", [])
+    if isinstance(experience, list):
+        experience = " ".join(
+            f"{e.get('company', '')} {e.get('duration', '')}".strip()
+            if isinstance(e, dict) else str(e)
+            for e in experience
+        )
+
+    education = analysis_result.get("education", [])
+    if isinstance(education, list):
+        education = " ".join(education)
+
+    return {
+        "skills": analysis_result.get("skills", []),
+        "experience": experience or "",
+        "education": education or ""
+    }
+
+
 # ---------- Job Matching Logic ----------
+def resume_section_texts(resume_data: Dict) -> List[str]:
+    """[skills, experience, education] texts in the order they are embedded"""
+    return [
+        " ".join(resume_data.get("skills", [])),
+        resume_data.get("experience", ""),
+        resume_data.get("education", "")
+    ]
+
+
+def embed_resume_sections(resume_data: Dict) -> Tuple:
+    """Embed the skills, experience and education sections of a resume"""
+    return tuple(embed_texts(resume_section_texts(resume_data)))
+
+
+def _match_result(job: Job, score: float) -> Dict:
+    return {
+        "job_id": job.id,
+        "job_title": job.job_title,
+        "skills": job.skills.split(","),
+        "description": job.description,
+        "similarity_score": round(float(score), 4)
+    }
+
+
+def rank_catalog(
+    catalog: JobCatalog,
+    resume_vectors: Tuple,
+    top_n: int = 5,
+    threshold: float = 0.6,
+    weights: Optional[Dict[str, float]] = None
+) -> List[Tuple[int, float]]:
+    """
+    [(job_id, score), ...] for already-embedded resume sections
+    (skills, experience, education).
+
+    With MATCH_INDEX_MODE="hnsw" the ANN index supplies a shortlist that
+    is then rescored exactly.
+    """
+    with MATCHER_SECONDS.time(direction="resume_to_jobs", step="score"):
+        candidate_ids = None
+        if ann_enabled() and len(catalog) > 0:
+            skill_query, description_query = catalog.queries(*resume_vectors, weights)
+            candidate_ids = get_ann_index(catalog).candidates(
+                skill_query,
+                description_query,
+                max(settings.ANN_CANDIDATES, top_n)
+            )
+
+        winners = catalog.top_matches(
+            *resume_vectors,
+            top_n=top_n,
+            threshold=threshold,
+            weights=weights,
+            candidate_ids=candidate_ids
+        )
+
+    JOBS_SCORED.inc(
+        len(catalog) if candidate_ids is None else len(candidate_ids),
+        direction="resume_to_jobs"
+    )
+    return winners
+
+
+def match_resume_with_catalog(
+    db: Session,
+    resume_data: Dict,
+    catalog: JobCatalog,
+    top_n: int = 5,
+    threshold: float = 0.6,
+    weights: Optional[Dict[str, float]] = None,
+    resume_vectors: Optional[Tuple] = None
+) -> List[Dict]:
+    """
+    Score a resume against the whole job catalog (see
+    job_embedding_store.load_job_catalog) and return the top N matches.
+    Only the winning JobPosting rows are loaded from the DB.
+    Pass resume_vectors to reuse section embeddings computed earlier.
+    """
+    if resume_vectors is None:
+        resume_vectors = embed_resume_sections(resume_data)
+
+    winners = rank_catalog(
+        catalog,
+        resume_vectors,
+        top_n=top_n,
+        threshold=threshold,
+        weights=weights
+    )
+    if not winners:
+        return []
+
+    with MATCHER_SECONDS.time(direction="resume_to_jobs", step="load"):
+        jobs = {
+            job.id: job
+            for job in db.query(Job).filter(Job.id.in_([job_id for job_id, _ in winners]))
+        }
+
+    return [
+        _match_result(jobs[job_id], score)
+        for job_id, score in winners
+        if job_id in jobs
+    ]
+
+
+def match_job_with_catalog(
+    db: Session,
+    job: Job,
+    catalog: ResumeCatalog,
+    limit: int = 10,
+    offset: int = 0,
+    threshold: float = 0.6,
+    weights: Optional[Dict[str, float]] = None,
+    viewer_id: Optional[int] = None
+) -> Tuple[List[Dict], int]:
+    """
+    Reverse matching: one page of the best stored resumes for a job and
+    the total number of resumes at or above threshold. Uses the job's
+    stored vectors and the same weighted score as the forward direction.
+    Candidates carry only resume_id and score; upload date, skills and
+    experience are added for resumes owned by viewer_id.
+    """
+    record = fetch_embedding_records(db, [job.id]).get(job.id)
+    if not is_current(record, job):
+        record = upsert_job_embedding(db, job, record=record)
+
+    with MATCHER_SECONDS.time(direction="job_to_resumes", step="score"):
+        winners, total = catalog.top_candidates(
+            *record_vectors(record),
+            limit=limit,
+            offset=offset,
+            threshold=threshold,
+            weights=weights
+        )
+    JOBS_SCORED.inc(len(catalog), direction="job_to_resumes")
+    if not winners:
+        return [], total
+
+    with MATCHER_SECONDS.time(direction="job_to_resumes", step="load"):
+        resumes = {
+            row.id: row
+            for row in db.query(
+                Resume.id, Resume.user_id, Resume.upload_date, Resume.analysis_result
+            ).filter(Resume.id.in_([resume_id for resume_id, _ in winners]))
+        }
+
+    candidates = []
+    for resume_id, score in winners:
+        row = resumes.get(resume_id)
+        if row is None:
+            continue
+        candidate = {"resume_id": row.id, "similarity_score": round(score, 4)}
+        # Other users' personal data stays out until there are recruiter roles
+        if viewer_id is not None and row.user_id == viewer_id:
+            analysis = row.analysis_result or {}
+            candidate.update({
+                "upload_date": row.upload_date,
+                "skills": analysis.get("skills", []),
+                "total_experience_years": analysis.get("total_experience_years")
+            })
+        candidates.append(candidate)
+
+    return candidates, total
+
+
 def match_resume_with_jobs(
     resume_data: Dict,
     jobs: List[Job],  # now Python knows Job
     top_n: int = 5,
-    threshold: float = 0.6
+    threshold: float = 0.6,
+    job_vectors: Optional[Dict] = None,
+    weights: Optional[Dict[str, float]] = None
 ) -> List[Dict]:
     """
     Match a resume against available jobs and return top N matches above threshold.
 
+    job_vectors maps job_id -> (skills_vector, description_vector), as returned
+    by job_embedding_store.load_job_vectors. Jobs missing from it are embedded
+    on the fly.
+
     resume_data format:
     {
         "skills": [...],
@@ -45,68 +244,74 @@ def match_resume_with_jobs(
         "education": "..."
     }
     """
-    # Combine resume sections
-    resume_skills_text = " ".join(resume_data.get("skills", []))
-    resume_experience_text = resume_data.get("experience", "")
-    resume_education_text = resume_data.get("education", "")
-
-    # Create embeddings
-    resume_skill_emb = embed(resume_skills_text)
-    resume_exp_emb = embed(resume_experience_text)
-    resume_edu_emb = embed(resume_education_text)
-
-    matched_jobs = []
+    if not jobs:
+        return []
 
+    job_vectors = job_vectors or {}
+    skills_vectors, description_vectors = [], []
     for job in jobs:
-        job_skill_emb = embed(job.skills)
-        job_desc_emb = embed(job.description)
-
-        # Weighted similarity calculation
-        skill_score = similarity(resume_skill_emb, job_skill_emb)
-        experience_score = similarity(resume_exp_emb, job_desc_emb)
-        education_score = similarity(resume_edu_emb, job_desc_emb)
-
-        final_score = skill_score * 0.5 + experience_score * 0.3 + education_score * 0.2
-
-        if final_score >= threshold:
-            matched_jobs.append({
-                "job_id": job.id,
-                "job_title": job.job_title,
-                "skills": job.skills.split(","),
-                "description": job.description,
-                "similarity_score": round(float(final_score), 4)
-            })
+        if job.id in job_vectors:
+            job_skill_emb, job_desc_emb = job_vectors[job.id]
+        else:
+            job_skill_emb = embed(job.skills)
+            job_desc_emb = embed(job.description)
+        skills_vectors.append(job_skill_emb)
+        description_vectors.append(job_desc_emb)
 
-    # Sort matches by descending similarity
-    matched_jobs.sort(key=lambda x: x["similarity_score"], reverse=True)
+    resume_vectors = embed_resume_sections(resume_data)
+    dimension = next(
+        (
+            len(v)
+            for v in (*resume_vectors, *skills_vectors, *description_vectors)
+            if v is not None
+        ),
+        0
+    )
 
-    return matched_jobs[:top_n]
+    catalog = build_job_catalog(
+        job_ids=[job.id for job in jobs],
+        skills_vectors=skills_vectors,
+        description_vectors=description_vectors,
+        dimension=dimension
+    )
+    winners = catalog.top_matches(
+        *resume_vectors,
+        top_n=top_n,
+        threshold=threshold,
+        weights=weights
+    )
+
+    jobs_by_id = {job.id: job for job in jobs}
+    return [_match_result(jobs_by_id[job_id], score) for job_id, score in winners]
 
 
 # ---------- Save Matches to Database ----------
 def save_job_matches(
     db: Session,
     resume_id: int,
-    matched_jobs: List[Dict]
+    matched_jobs: List[Dict],
+    commit: bool = True
 ):
     """
-    Save top N job matches to JobMatch table
+    Save top N job matches to JobMatch table (one row per resume / job,
+    holding the latest score; see match_store.upsert_job_matches)
     matched_jobs = [
         {"job_id": 1, "similarity_score": 0.82},
         ...
     ]
     """
-    matches = []
-    for job in matched_jobs:
-        match = JobMatch(
-            resume_id=resume_id,
-            job_id=job["job_id"],
-            similarity_score=job["similarity_score"]
-        )
-        matches.append(match)
-
-    db.add_all(matches)
-    db.commit()
+    upsert_job_matches(
+        db,
+        [
+            {
+                "resume_id": resume_id,
+                "job_id": job["job_id"],
+                "similarity_score": job["similarity_score"]
+            }
+            for job in matched_jobs
+        ],
+        commit=commit
+    )
 
 
 # ---------- Full Pipeline Function ----------
@@ -121,11 +326,13 @@ def match_and_store(
     Match a resume to jobs and store top matches in DB
     Returns the list of matched jobs
     """
-    # Fetch all jobs from DB
-    jobs = db.query(Job).all()
+    # Stored job embeddings as one normalized matrix per section
+    catalog = load_job_catalog(db)
 
     # Step 1: Compute top matches
-    matched_jobs = match_resume_with_jobs(resume_data, jobs, top_n, threshold)
+    matched_jobs = match_resume_with_catalog(
+        db, resume_data, catalog, top_n, threshold
+    )
 
     # Step 2: Save matches to DB
     save_job_matches(db, resume_id, matched_jobs)
@@ -137,24 +344,70 @@ def match_and_store(
 #---------- Retrieve Match History ----------
 def get_match_history(
     db: Session,
-    resume_id: int
-) -> List[Dict]:
-    matches = (
-        db.query(JobMatch)
-        .filter(JobMatch.resume_id == resume_id)
-        .order_by(JobMatch.created_at.desc())
-        .all()
+    resume_id: int,
+    limit: int = 50,
+    before: Optional[str] = None,
+    latest_only: bool = False
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    One page of a resume's match history, newest first, and the cursor for
+    the next page (None on the last page).
+
+    With MATCH_HISTORY_ENABLED every past score comes from JobMatchHistory;
+    latest_only (or history disabled) returns only the current score per
+    job from JobMatches. Matches and job columns come from a single join;
+    pages are keyset paginated on (created_at, id) using the
+    (resume_id, created_at) index of either table.
+    """
+    source = JobMatch
+    if settings.MATCH_HISTORY_ENABLED and not latest_only:
+        source = JobMatchHistory
+
+    query = (
+        select(
+            source.id,
+            source.job_id,
+            source.similarity_score,
+            source.created_at,
+            Job.job_title,
+            Job.skills,
+            Job.description
+        )
+        .join(Job, Job.id == source.job_id)
+        .where(source.resume_id == resume_id)
     )
 
-    history = []
-    for m in matches:
-        history.append({
-            "job_id": m.job.id,
-            "job_title": m.job.job_title,
-            "skills": m.job.skills.split(","),
-            "description": m.job.description,
-            "similarity_score": m.similarity_score,
-            "matched_at": m.created_at
-        })
-
-    return history
+    if before:
+        created_at, match_id = decode_cursor(before)
+        query = query.where(
+            or_(
+                source.created_at < created_at,
+                and_(source.created_at == created_at, source.id < match_id)
+            )
+        )
+
+    # One extra row tells whether another page exists
+    rows = db.execute(
+        query
+        .order_by(source.created_at.desc(), source.id.desc())
+        .limit(limit + 1)
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    history = [
+        {
+            "job_id": row.job_id,
+            "job_title": row.job_title,
+            "skills": row.skills.split(","),
+            "description": row.description,
+            "similarity_score": row.similarity_score,
+            "matched_at": row.created_at
+        }
+        for row in rows
+    ]
+
+    return history, next_cursor
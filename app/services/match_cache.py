@@ -0,0 +1,169 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.services.job_catalog import DEFAULT_WEIGHTS
+
+try:
+    import redis
+except ImportError:  # optional dependency, only needed for MATCH_CACHE_REDIS_URL
+    redis = None
+
+
+def match_cache_key(
+    resume_id: int,
+    catalog_version: int,
+    top_n: int,
+    threshold: float,
+    weights: Optional[Dict[str, float]] = None
+) -> str:
+    """
+    Key of one match result. Entries are never invalidated explicitly:
+    any job write bumps catalog_version, so old keys simply stop being read.
+    """
+    weights = weights or DEFAULT_WEIGHTS
+    weights_part = ",".join(f"{name}={weights[name]:g}" for name in sorted(weights))
+    return (
+        f"match:{settings.EMBEDDING_MODEL_NAME}:{settings.MATCH_INDEX_MODE}:"
+        f"v{catalog_version}:r{resume_id}:n{top_n}:t{threshold:g}:{weights_part}"
+    )
+
+
+# ---------- Shared Tier ----------
+class SharedMatchBackend:
+    """
+    Interface for a cache shared between processes / hosts.
+    Values are JSON strings; implementations may drop entries at any time.
+    """
+
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: str, ttl_seconds: int):
+        raise NotImplementedError
+
+
+class RedisMatchBackend(SharedMatchBackend):
+    def __init__(self, url: str):
+        if redis is None:
+            raise RuntimeError(
+                "MATCH_CACHE_REDIS_URL requires the redis package "
+                "(pip install redis)"
+            )
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._client.get(key)
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str, ttl_seconds: int):
+        self._client.set(key, value, ex=ttl_seconds or None)
+
+
+# ---------- Two-tier Cache ----------
+class MatchCache:
+    """
+    In-process LRU of match results in front of an optional shared backend.
+    Shared-tier hits are promoted into the LRU; shared-tier errors count as
+    misses so a backend outage never fails a match request.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        shared: Optional[SharedMatchBackend] = None,
+        ttl_seconds: int = 0
+    ):
+        self.max_entries = max_entries
+        self.shared = shared
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, List[Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.shared_errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 or self.shared is not None
+
+    def _remember(self, key: str, value: List[Dict]):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        value = None
+        if self.shared is not None:
+            try:
+                raw = self.shared.get(key)
+                value = json.loads(raw) if raw is not None else None
+            except Exception:
+                with self._lock:
+                    self.shared_errors += 1
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.shared_hits += 1
+            self._remember(key, value)
+        return value
+
+    def set(self, key: str, value: List[Dict]):
+        with self._lock:
+            self._remember(key, value)
+
+        if self.shared is not None:
+            try:
+                self.shared.set(key, json.dumps(value, default=str), self.ttl_seconds)
+            except Exception:
+                with self._lock:
+                    self.shared_errors += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "shared_errors": self.shared_errors,
+                "hit_rate": round((self.hits + self.shared_hits) / lookups, 4) if lookups else 0.0,
+                "shared_backend": type(self.shared).__name__ if self.shared else None
+            }
+
+
+match_cache = MatchCache(
+    max_entries=settings.MATCH_CACHE_SIZE,
+    shared=RedisMatchBackend(settings.MATCH_CACHE_REDIS_URL) if settings.MATCH_CACHE_REDIS_URL else None,
+    ttl_seconds=settings.MATCH_CACHE_TTL_SECONDS
+)
+
+
+def set_shared_backend(backend: Optional[SharedMatchBackend]):
+    """Plug in (or remove) the shared tier, e.g. a memcached adapter"""
+    match_cache.shared = backend
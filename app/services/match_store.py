@@ -0,0 +1,122 @@
+from datetime import datetime
+from typing import Dict, List, Sequence
+
+from sqlalchemy import insert, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.job_match import JobMatch
+from app.models.job_match_history import JobMatchHistory
+
+
+# SQL Server caps a statement at ~2100 parameters; 4 per row
+UPSERT_CHUNK_SIZE = 500
+
+_MATCH_COLUMNS = ("resume_id", "job_id", "similarity_score", "created_at")
+
+
+# ---------- Dialect-specific Upserts ----------
+def _upsert_on_conflict(db: Session, rows: List[Dict], insert_fn):
+    statement = insert_fn(JobMatch).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=[JobMatch.resume_id, JobMatch.job_id],
+        set_={
+            "similarity_score": statement.excluded.similarity_score,
+            "created_at": statement.excluded.created_at
+        }
+    )
+    db.execute(statement)
+
+
+def _upsert_merge(db: Session, rows: List[Dict]):
+    """SQL Server: one MERGE per chunk, HOLDLOCK against concurrent inserts"""
+    values = ", ".join(
+        "(" + ", ".join(f":{column}_{i}" for column in _MATCH_COLUMNS) + ")"
+        for i in range(len(rows))
+    )
+    statement = text(
+        f"MERGE {JobMatch.__tablename__} WITH (HOLDLOCK) AS target "
+        f"USING (VALUES {values}) AS source ({', '.join(_MATCH_COLUMNS)}) "
+        "ON target.resume_id = source.resume_id AND target.job_id = source.job_id "
+        "WHEN MATCHED THEN UPDATE SET "
+        "similarity_score = source.similarity_score, created_at = source.created_at "
+        f"WHEN NOT MATCHED THEN INSERT ({', '.join(_MATCH_COLUMNS)}) "
+        f"VALUES ({', '.join('source.' + c for c in _MATCH_COLUMNS)});"
+    )
+    params = {
+        f"{column}_{i}": row[column]
+        for i, row in enumerate(rows)
+        for column in _MATCH_COLUMNS
+    }
+    db.execute(statement, params)
+
+
+def _upsert_generic(db: Session, rows: List[Dict]):
+    """Fallback for other dialects: one lookup, then bulk insert / update"""
+    keys = [(row["resume_id"], row["job_id"]) for row in rows]
+    existing = {
+        (match.resume_id, match.job_id): match
+        for match in db.query(JobMatch).filter(
+            tuple_(JobMatch.resume_id, JobMatch.job_id).in_(keys)
+        )
+    }
+
+    new_rows = []
+    for row in rows:
+        match = existing.get((row["resume_id"], row["job_id"]))
+        if match is None:
+            new_rows.append(row)
+        else:
+            match.similarity_score = row["similarity_score"]
+            match.created_at = row["created_at"]
+
+    if new_rows:
+        db.execute(insert(JobMatch), new_rows)
+    db.flush()
+
+
+# ---------- Public API ----------
+def upsert_job_matches(db: Session, rows: Sequence[Dict], commit: bool = True) -> int:
+    """
+    Write {resume_id, job_id, similarity_score} rows so each resume / job
+    pair keeps exactly one JobMatch holding its latest score. Each chunk of
+    UPSERT_CHUNK_SIZE rows is a single statement (ON CONFLICT on SQLite and
+    PostgreSQL, MERGE on SQL Server). With MATCH_HISTORY_ENABLED every
+    score is also appended to JobMatchHistory.
+    """
+    now = datetime.utcnow()
+
+    # A pair repeated in one statement would conflict with itself
+    latest = {}
+    for row in rows:
+        latest[(row["resume_id"], row["job_id"])] = {
+            "resume_id": row["resume_id"],
+            "job_id": row["job_id"],
+            "similarity_score": float(row["similarity_score"]),
+            "created_at": row.get("created_at") or now
+        }
+    rows = list(latest.values())
+    if not rows:
+        return 0
+
+    dialect = db.get_bind().dialect.name
+    for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        chunk = rows[start:start + UPSERT_CHUNK_SIZE]
+        if dialect == "sqlite":
+            _upsert_on_conflict(db, chunk, sqlite_insert)
+        elif dialect == "postgresql":
+            _upsert_on_conflict(db, chunk, pg_insert)
+        elif dialect == "mssql":
+            _upsert_merge(db, chunk)
+        else:
+            _upsert_generic(db, chunk)
+
+    if settings.MATCH_HISTORY_ENABLED:
+        db.execute(insert(JobMatchHistory), rows)
+
+    if commit:
+        db.commit()
+
+    return len(rows)
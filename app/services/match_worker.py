@@ -0,0 +1,250 @@
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Sequence
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.job_match import JobMatch
+from app.models.job_posting import JobPosting as Job
+from app.services.job_catalog import normalize_vector
+from app.services.job_embedding_store import (
+    fetch_embedding_records, is_current, record_vectors, upsert_job_embedding
+)
+from app.services.match_store import upsert_job_matches
+from app.services.resume_embedding_store import load_resume_catalog
+
+
+# ---------- Incremental Matching ----------
+def match_jobs(
+    db: Session,
+    job_ids: Sequence[int],
+    threshold: float = None
+) -> Dict[str, int]:
+    """
+    Score the given jobs against every stored resume in one batched
+    operation and upsert a JobMatch for each pair at or above threshold.
+    Earlier JobMatch rows of these jobs are removed in the same
+    transaction, so an edited job is fully re-scored. The jobs are then
+    stamped with matched_at.
+    Returns {"jobs": ..., "matches": ...}.
+    """
+    threshold = settings.MATCH_WORKER_THRESHOLD if threshold is None else threshold
+    stats = {"jobs": 0, "matches": 0}
+
+    jobs = db.query(Job).filter(Job.id.in_(list(job_ids))).all() if job_ids else []
+    if not jobs:
+        return stats
+
+    catalog = load_resume_catalog(db)
+
+    records = fetch_embedding_records(db, [job.id for job in jobs])
+    vectors = []
+    for job in jobs:
+        record = records.get(job.id)
+        if not is_current(record, job):
+            record = upsert_job_embedding(db, job, record=record, commit=False)
+        vectors.append(record_vectors(record))
+
+    now = datetime.utcnow()
+
+    # Pairs that fell below threshold must not keep their old score
+    db.query(JobMatch).filter(JobMatch.job_id.in_([job.id for job in jobs])).delete(
+        synchronize_session=False
+    )
+
+    if len(catalog) > 0:
+        dimension = catalog.dimension
+        skills = np.stack([normalize_vector(s, dimension) for s, _ in vectors])
+        descriptions = np.stack([normalize_vector(d, dimension) for _, d in vectors])
+
+        resume_ids, columns, scores = catalog.matches_for_jobs(
+            skills, descriptions, threshold=threshold
+        )
+
+        written = upsert_job_matches(
+            db,
+            [
+                {
+                    "resume_id": resume_id,
+                    "job_id": jobs[column].id,
+                    "similarity_score": round(score, 4),
+                    "created_at": now
+                }
+                for resume_id, column, score in zip(
+                    resume_ids.tolist(), columns.tolist(), scores.tolist()
+                )
+            ],
+            commit=False
+        )
+        stats["matches"] = written
+
+    for job in jobs:
+        job.matched_at = now
+
+    db.commit()
+    stats["jobs"] = len(jobs)
+    return stats
+
+
+def match_pending_jobs(
+    db: Session,
+    batch_size: int = None,
+    threshold: float = None
+) -> Dict[str, int]:
+    """Replay: match every job still waiting (matched_at IS NULL)"""
+    batch_size = batch_size or settings.MATCH_WORKER_BATCH_SIZE
+    totals = {"jobs": 0, "matches": 0}
+    last_id = 0
+
+    while True:
+        job_ids = [
+            job_id for (job_id,) in (
+                db.query(Job.id)
+                .filter(Job.matched_at.is_(None), Job.id > last_id)
+                .order_by(Job.id)
+                .limit(batch_size)
+            )
+        ]
+        if not job_ids:
+            break
+
+        stats = match_jobs(db, job_ids, threshold=threshold)
+        for key in totals:
+            totals[key] += stats[key]
+        last_id = job_ids[-1]
+
+    return totals
+
+
+# ---------- Background Worker ----------
+class MatchWorker:
+    """
+    Daemon thread that matches newly created or edited jobs off the
+    request path.
+
+    Job IDs go through a bounded queue and are processed in batches of up
+    to MATCH_WORKER_BATCH_SIZE. Enqueueing never blocks: when the queue is
+    full, a replay from the database (matched_at IS NULL) is scheduled
+    instead, which also runs once at startup to catch up after downtime.
+    """
+
+    def __init__(self, max_queue: int, batch_size: int):
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[int]" = queue.Queue(maxsize=max_queue)
+        self._replay = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+        self.batches = 0
+        self.jobs = 0
+        self.matches_written = 0
+        self.overflows = 0
+        self.replays = 0
+        self.errors = 0
+        self.last_error = None
+
+    def start(self, replay: bool = True):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            if replay:
+                self._replay.set()
+            self._thread = threading.Thread(target=self._run, name="match-worker", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def enqueue(self, job_ids: Sequence[int]):
+        for job_id in job_ids:
+            try:
+                self._queue.put_nowait(job_id)
+            except queue.Full:
+                # The job keeps matched_at = NULL; the replay will pick it up
+                with self._lock:
+                    self.overflows += 1
+                self._replay.set()
+                return
+
+    def _collect(self) -> List[int]:
+        try:
+            batch = [self._queue.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return list(dict.fromkeys(batch))
+
+    def _record(self, stats: Dict[str, int]):
+        with self._lock:
+            self.batches += 1
+            self.jobs += stats["jobs"]
+            self.matches_written += stats["matches"]
+
+    def _run(self):
+        while not self._stop.is_set():
+            replay = self._replay.is_set()
+            job_ids = [] if replay else self._collect()
+            if not replay and not job_ids:
+                continue
+
+            db = SessionLocal()
+            try:
+                if replay:
+                    self._replay.clear()
+                    stats = match_pending_jobs(db, self.batch_size)
+                    with self._lock:
+                        self.replays += 1
+                else:
+                    stats = match_jobs(db, job_ids)
+                self._record(stats)
+            except Exception as exc:
+                db.rollback()
+                with self._lock:
+                    self.errors += 1
+                    self.last_error = f"{type(exc).__name__}: {exc}"
+                # Unmatched jobs keep matched_at = NULL for the next replay
+                time.sleep(1.0)
+            finally:
+                db.close()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "enabled": settings.MATCH_WORKER_ENABLED,
+                "running": self._thread is not None and self._thread.is_alive(),
+                "queue_depth": self._queue.qsize(),
+                "max_queue": self._queue.maxsize,
+                "batches": self.batches,
+                "jobs": self.jobs,
+                "matches_written": self.matches_written,
+                "overflows": self.overflows,
+                "replays": self.replays,
+                "errors": self.errors,
+                "last_error": self.last_error
+            }
+
+
+match_worker = MatchWorker(
+    max_queue=settings.MATCH_WORKER_QUEUE_SIZE,
+    batch_size=settings.MATCH_WORKER_BATCH_SIZE
+)
+
+
+def enqueue_job_matching(job_ids: Sequence[int]):
+    """Hook for job writes: match these jobs against stored resumes soon"""
+    if settings.MATCH_WORKER_ENABLED:
+        match_worker.start()
+        match_worker.enqueue(job_ids)
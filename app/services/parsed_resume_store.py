@@ -0,0 +1,73 @@
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.parsed_resume import ParsedResume
+from app.services.job_embedding_store import decode_vector, encode_vector
+
+
+def _parser_version() -> str:
+    # resume_parser loads spaCy on import; only pool workers should pay that
+    from app.services.resume_parser import PARSER_VERSION
+    return PARSER_VERSION
+
+
+# ---------- Read Path ----------
+def find_parsed_resume(db: Session, content_hash: str) -> Optional[ParsedResume]:
+    """Stored parse of a file, if one exists for the current parser version"""
+    return (
+        db.query(ParsedResume)
+        .filter(
+            ParsedResume.content_hash == content_hash,
+            ParsedResume.parser_version == _parser_version()
+        )
+        .first()
+    )
+
+
+def parsed_vectors(record: ParsedResume) -> Optional[Tuple]:
+    """(skills, experience, education) vectors, or None if from another model"""
+    if record.model_name != settings.EMBEDDING_MODEL_NAME:
+        return None
+    return (
+        decode_vector(record.skills_vector),
+        decode_vector(record.experience_vector),
+        decode_vector(record.education_vector)
+    )
+
+
+# ---------- Write Path ----------
+def set_parsed_vectors(record: ParsedResume, vectors: Tuple):
+    skills_vec, experience_vec, education_vec = vectors
+    record.model_name = settings.EMBEDDING_MODEL_NAME
+    record.skills_vector = encode_vector(skills_vec)
+    record.experience_vector = encode_vector(experience_vec)
+    record.education_vector = encode_vector(education_vec)
+
+
+def save_parsed_resume(
+    db: Session,
+    content_hash: str,
+    analysis_result: Dict,
+    vectors: Tuple
+) -> Optional[ParsedResume]:
+    """
+    Store a file's parse and section vectors. A concurrent upload of the
+    same file may win the insert; that is not an error.
+    """
+    record = ParsedResume(
+        content_hash=content_hash,
+        parser_version=_parser_version(),
+        analysis_result=analysis_result
+    )
+    set_parsed_vectors(record, vectors)
+
+    db.add(record)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return None
+    return record
@@ -0,0 +1,116 @@
+import time
+from typing import BinaryIO, Iterator, Union
+
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LAParams, LTTextContainer
+
+from app.core.config import settings
+
+try:
+    import pymupdf
+except ImportError:  # optional dependency, only needed for PDF_BACKEND="pymupdf"
+    pymupdf = None
+
+
+PdfSource = Union[str, BinaryIO]
+
+
+def layout_params() -> LAParams:
+    """
+    pdfminer layout settings tuned for resumes: no vertical text detection,
+    no analysis of text inside figures, and optionally no boxes_flow
+    reading-order pass (the most expensive step on dense pages).
+    """
+    return LAParams(
+        detect_vertical=False,
+        all_texts=False,
+        boxes_flow=None if settings.PDF_FAST_LAYOUT else 0.5
+    )
+
+
+# ---------- Backends ----------
+def _pdfminer_pages(source: PdfSource, max_pages: int) -> Iterator[str]:
+    for page in extract_pages(source, laparams=layout_params(), maxpages=max_pages):
+        yield "".join(
+            element.get_text()
+            for element in page
+            if isinstance(element, LTTextContainer)
+        )
+
+
+def _pymupdf_pages(source: PdfSource, max_pages: int) -> Iterator[str]:
+    if pymupdf is None:
+        raise RuntimeError(
+            "PDF_BACKEND='pymupdf' requires the pymupdf package "
+            "(pip install pymupdf)"
+        )
+
+    if isinstance(source, str):
+        pdf = pymupdf.open(source)
+    else:
+        pdf = pymupdf.open(stream=source.read(), filetype="pdf")
+
+    with pdf:
+        for number, page in enumerate(pdf):
+            if max_pages and number >= max_pages:
+                break
+            yield page.get_text()
+
+
+PDF_BACKENDS = {
+    "pdfminer": _pdfminer_pages,
+    "pymupdf": _pymupdf_pages
+}
+
+
+# ---------- Page Stream ----------
+def iter_pdf_pages(
+    source: PdfSource,
+    max_pages: int = None,
+    max_chars: int = None,
+    time_budget_seconds: float = None,
+    backend: str = None
+) -> Iterator[str]:
+    """
+    Yield a PDF's text one page at a time.
+
+    Stops after max_pages pages, once max_chars characters have been
+    yielded (the last page is cut to fit) or when the time budget runs out
+    between pages. The budget cannot interrupt a page in progress; callers
+    in the worker pool are bounded by PARSER_TASK_TIMEOUT_SECONDS instead.
+    Callers may also stop iterating early themselves. A limit of 0
+    disables it.
+    """
+    max_pages = settings.PDF_MAX_PAGES if max_pages is None else max_pages
+    max_chars = settings.PDF_MAX_CHARS if max_chars is None else max_chars
+    if time_budget_seconds is None:
+        time_budget_seconds = settings.PDF_TIME_BUDGET_SECONDS
+
+    backend = backend or settings.PDF_BACKEND
+    if backend not in PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend: {backend}")
+
+    deadline = time.monotonic() + time_budget_seconds if time_budget_seconds else None
+    remaining = max_chars
+
+    for text in PDF_BACKENDS[backend](source, max_pages):
+        if max_chars:
+            text = text[:remaining]
+            remaining -= len(text)
+
+        yield text
+
+        if max_chars and remaining <= 0:
+            return
+        if deadline is not None and time.monotonic() > deadline:
+            return
+
+
+def extract_pdf_text(source: PdfSource, **limits) -> str:
+    """
+    Whole (limited) text of a PDF; see iter_pdf_pages for the limits.
+    Skills, education and experience can sit on any page, so the parser
+    takes the joined text; the page stream only lets the limits stop
+    extraction early, no stage starts before the last page.
+    """
+    return "\n".join(iter_pdf_pages(source, **limits))
@@ -0,0 +1,154 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.job_catalog import (
+    DEFAULT_WEIGHTS, normalize_rows, normalize_vector, select_top_n, stack_vectors
+)
+
+
+# ---------- Resume Catalog ----------
+class ResumeCatalog:
+    """
+    In-memory resume embedding catalog for job -> candidates matching.
+
+    Uses the forward matcher's scoring from the job's side:
+        skills * cos(resume skills, job skills)
+      + experience * cos(resume experience, job description)
+      + education * cos(resume education, job description)
+    with every row L2-normalized, so one job is scored against all
+    candidates with matrix-vector products.
+    """
+
+    def __init__(
+        self,
+        resume_ids: np.ndarray,
+        skills_matrix: np.ndarray,
+        experience_matrix: np.ndarray,
+        education_matrix: np.ndarray
+    ):
+        self.resume_ids = np.asarray(resume_ids, dtype=np.int64)
+        self.skills_matrix = normalize_rows(skills_matrix)
+        self.experience_matrix = normalize_rows(experience_matrix)
+        self.education_matrix = normalize_rows(education_matrix)
+        self.dimension = self.skills_matrix.shape[1]
+        self._folded: Dict[Tuple[float, float], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.resume_ids)
+
+    def _description_matrix(self, weights: Dict[str, float]) -> np.ndarray:
+        """
+        experience * E + education * R, built once per weight pair: both
+        sections score against the job description, so one product serves.
+        """
+        key = (weights["experience"], weights["education"])
+        matrix = self._folded.get(key)
+        if matrix is None:
+            matrix = key[0] * self.experience_matrix + key[1] * self.education_matrix
+            if len(self._folded) >= 4:
+                self._folded.clear()
+            self._folded[key] = matrix
+        return matrix
+
+    def score(
+        self,
+        job_skills_vec,
+        job_description_vec,
+        weights: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """Weighted similarity of one job against every resume"""
+        weights = weights or DEFAULT_WEIGHTS
+
+        skills_query = normalize_vector(job_skills_vec, self.dimension)
+        description_query = normalize_vector(job_description_vec, self.dimension)
+
+        return (
+            weights["skills"] * (self.skills_matrix @ skills_query)
+            + self._description_matrix(weights) @ description_query
+        )
+
+    def top_candidates(
+        self,
+        job_skills_vec,
+        job_description_vec,
+        limit: int = 10,
+        offset: int = 0,
+        threshold: float = 0.6,
+        weights: Optional[Dict[str, float]] = None
+    ) -> Tuple[List[Tuple[int, float]], int]:
+        """
+        One page of [(resume_id, score), ...], best first, and the number of
+        resumes at or above threshold. Only offset + limit rows are sorted.
+        """
+        if len(self) == 0:
+            return [], 0
+
+        scores = self.score(job_skills_vec, job_description_vec, weights)
+        total = int(np.count_nonzero(scores >= threshold))
+        winners = select_top_n(scores, offset + limit, threshold)[offset:]
+
+        return [(int(self.resume_ids[i]), float(scores[i])) for i in winners], total
+
+    def matches_for_jobs(
+        self,
+        job_skills_matrix: np.ndarray,
+        job_description_matrix: np.ndarray,
+        threshold: float = 0.6,
+        weights: Optional[Dict[str, float]] = None,
+        chunk_rows: int = 20000
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score several jobs against every resume at once.
+
+        Job rows must be L2-normalized. Returns (resume_ids, job_columns,
+        scores) for every pair at or above threshold. Resumes are processed
+        in chunks so the score matrix stays bounded for large catalogs.
+        """
+        weights = weights or DEFAULT_WEIGHTS
+        description_matrix = self._description_matrix(weights)
+        skills_t = (weights["skills"] * np.asarray(job_skills_matrix, dtype=np.float32)).T
+        description_t = np.asarray(job_description_matrix, dtype=np.float32).T
+
+        resume_ids, job_columns, scores = [], [], []
+        for start in range(0, len(self), chunk_rows):
+            stop = start + chunk_rows
+            chunk = (
+                self.skills_matrix[start:stop] @ skills_t
+                + description_matrix[start:stop] @ description_t
+            )
+            rows, cols = np.nonzero(chunk >= threshold)
+            resume_ids.append(self.resume_ids[start + rows])
+            job_columns.append(cols)
+            scores.append(chunk[rows, cols])
+
+        if not resume_ids:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0, dtype=np.float32)
+        return np.concatenate(resume_ids), np.concatenate(job_columns), np.concatenate(scores)
+
+
+def build_resume_catalog(
+    resume_ids: Sequence[int],
+    skills_vectors: Sequence,
+    experience_vectors: Sequence,
+    education_vectors: Sequence,
+    dimension: Optional[int] = None
+) -> ResumeCatalog:
+    """Build a catalog from per-resume vectors (None entries become zero rows)"""
+    if dimension is None:
+        dimension = next(
+            (
+                len(v)
+                for v in (*skills_vectors, *experience_vectors, *education_vectors)
+                if v is not None
+            ),
+            0
+        )
+
+    return ResumeCatalog(
+        resume_ids=np.asarray(resume_ids, dtype=np.int64),
+        skills_matrix=stack_vectors(skills_vectors, dimension),
+        experience_matrix=stack_vectors(experience_vectors, dimension),
+        education_matrix=stack_vectors(education_vectors, dimension)
+    )
@@ -0,0 +1,137 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.resume import Resume
+from app.models.resume_embedding import ResumeEmbedding
+from app.services.embedding_service import embed_many
+from app.services.job_embedding_store import decode_vector, encode_vector
+from app.services.job_matcher import resume_match_data, resume_section_texts
+from app.services.resume_catalog import ResumeCatalog, build_resume_catalog
+
+
+# (skills, experience, education), as produced by embed_resume_sections
+ResumeVectors = Tuple
+
+
+# ---------- Write Path ----------
+def add_resume_embedding(
+    db: Session,
+    resume_id: int,
+    vectors: ResumeVectors,
+    commit: bool = False
+) -> ResumeEmbedding:
+    """Store a resume's section vectors for the active model"""
+    skills_vec, experience_vec, education_vec = vectors
+    dimension = next((len(v) for v in vectors if v is not None), 0)
+
+    record = ResumeEmbedding(
+        resume_id=resume_id,
+        model_name=settings.EMBEDDING_MODEL_NAME,
+        dimension=dimension,
+        skills_vector=encode_vector(skills_vec),
+        experience_vector=encode_vector(experience_vec),
+        education_vector=encode_vector(education_vec)
+    )
+    db.add(record)
+
+    if commit:
+        db.commit()
+
+    return record
+
+
+def embed_missing_resumes(db: Session, batch_size: int = 500) -> int:
+    """
+    Embed resumes stored before vectors were kept at upload, or under
+    another model. Sections of a whole batch go through one encoder run.
+    """
+    embedded = 0
+    last_id = 0
+
+    while True:
+        missing = (
+            db.query(Resume.id, Resume.analysis_result)
+            .outerjoin(
+                ResumeEmbedding,
+                and_(
+                    ResumeEmbedding.resume_id == Resume.id,
+                    ResumeEmbedding.model_name == settings.EMBEDDING_MODEL_NAME
+                )
+            )
+            .filter(ResumeEmbedding.id.is_(None), Resume.id > last_id)
+            .order_by(Resume.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not missing:
+            break
+
+        texts = [
+            text
+            for row in missing
+            for text in resume_section_texts(resume_match_data(row.analysis_result))
+        ]
+        flat = embed_many(texts)
+        for i, row in enumerate(missing):
+            add_resume_embedding(db, row.id, tuple(flat[3 * i:3 * i + 3]))
+
+        db.commit()
+        embedded += len(missing)
+        last_id = missing[-1].id
+
+    return embedded
+
+
+# ---------- Catalog Matrices ----------
+_catalog_lock = threading.Lock()
+_catalog_cache: Dict = {"key": None, "catalog": None}
+
+
+def _catalog_fingerprint(db: Session) -> Tuple:
+    """Resume vectors are write-once, so count and max id detect changes"""
+    vectors = (
+        db.query(func.count(ResumeEmbedding.id), func.max(ResumeEmbedding.id))
+        .filter(ResumeEmbedding.model_name == settings.EMBEDDING_MODEL_NAME)
+        .one()
+    )
+    return settings.EMBEDDING_MODEL_NAME, tuple(vectors)
+
+
+def load_resume_catalog(db: Session) -> ResumeCatalog:
+    """
+    Return every stored resume as normalized NumPy matrices.
+    The catalog is kept per process and rebuilt only when resumes change.
+    """
+    with _catalog_lock:
+        embed_missing_resumes(db)
+
+        key = _catalog_fingerprint(db)
+        if _catalog_cache["key"] == key:
+            return _catalog_cache["catalog"]
+
+        rows = (
+            db.query(
+                ResumeEmbedding.resume_id,
+                ResumeEmbedding.skills_vector,
+                ResumeEmbedding.experience_vector,
+                ResumeEmbedding.education_vector
+            )
+            .filter(ResumeEmbedding.model_name == settings.EMBEDDING_MODEL_NAME)
+            .order_by(ResumeEmbedding.resume_id)
+            .all()
+        )
+
+        catalog = build_resume_catalog(
+            resume_ids=[r.resume_id for r in rows],
+            skills_vectors=[decode_vector(r.skills_vector) for r in rows],
+            experience_vectors=[decode_vector(r.experience_vector) for r in rows],
+            education_vectors=[decode_vector(r.education_vector) for r in rows]
+        )
+
+        _catalog_cache["key"] = key
+        _catalog_cache["catalog"] = catalog
+        return catalog
@@ -1,23 +1,30 @@
 import docx2txt
-from pdfminer.high_level import extract_text
 import spacy
 import re
-import tempfile
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, List, Optional, Union
 from fastapi import UploadFile
 from datetime import datetime
+from app.core.config import settings
+from app.services.skill_matcher import get_skill_matcher
+from app.services.pdf_extractor import extract_pdf_text
 
-# Load English NLP model
-nlp = spacy.load("en_core_web_sm")
+# Load English NLP model with only what NER needs: en_core_web_sm's "ner"
+# carries its own tok2vec, so the shared tok2vec, tagger, parser,
+# attribute ruler and lemmatizer are never run
+NER_EXCLUDE = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+nlp = spacy.load(settings.SPACY_MODEL, exclude=NER_EXCLUDE)
 
 
-# SKILL & EDUCATION KEYWORDS
+# Bump whenever a change to this module (or the skill taxonomy) alters the
+# parse output, so stored results keyed by file hash are re-parsed
+PARSER_VERSION = "1"
 
-SKILL_KEYWORDS = [
-    "python", "fastapi", "sql", "sql server", "c#", ".net",
-    "api", "rest", "microservices", "dto", "dal", "bal",
-    "html", "css", "javascript", "react", "angular",
-    "n-tier", "entity framework", "docker", "azure", "aws"
-]
+
+# SKILL & EDUCATION KEYWORDS
+# Skills (with aliases) live in the taxonomy file, see skill_matcher.py
 
 EDUCATION_KEYWORDS = [
     "bachelor", "master", "b.sc", "m.sc", "btech", "mtech",
@@ -28,6 +35,43 @@ EXPERIENCE_SECTION_KEYWORDS = [
     "experience", "employment", "work history"
 ]
 
+SECTION_HEADINGS = [
+    "summary", "profile", "objective", "skills", "technical skills",
+    "experience", "work experience", "professional experience", "employment",
+    "work history", "education", "projects", "certifications", "achievements",
+    "awards", "publications", "languages", "interests", "references"
+]
+
+
+
+# PARSED DOCUMENT
+
+@dataclass
+class ResumeDocument:
+    """
+    Extracted resume text plus the derived views every extractor needs,
+    computed once and shared across stages.
+    """
+    text: str
+    source: Optional[str] = None
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+
+    @cached_property
+    def text_lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return self.text.splitlines()
+
+    @cached_property
+    def content_lines(self) -> List[str]:
+        """Stripped, non-empty lines"""
+        return [l.strip() for l in self.lines if l.strip()]
+
+
+def _as_document(text: Union[str, ResumeDocument]) -> ResumeDocument:
+    return text if isinstance(text, ResumeDocument) else ResumeDocument(text=text)
 
 
 # TEXT EXTRACTION
@@ -35,22 +79,22 @@ EXPERIENCE_SECTION_KEYWORDS = [
 def extract_text_from_file(file) -> str:
     """
     Extract clean text from PDF or DOCX without destroying structure.
+    UploadFile objects are read straight from their spooled file.
+    PDFs are read page by page within the PDF_* limits (see pdf_extractor).
     """
 
     if isinstance(file, UploadFile):
-        suffix = "." + file.filename.split(".")[-1].lower()
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            tmp.write(file.file.read())
-            file_path = tmp.name
+        ext = file.filename.lower().split(".")[-1]
+        file.file.seek(0)
+        source = file.file
     else:
-        file_path = file
-
-    ext = file_path.lower().split(".")[-1]
+        ext = file.lower().split(".")[-1]
+        source = file
 
     if ext == "pdf":
-        text = extract_text(file_path)
+        text = extract_pdf_text(source)
     elif ext == "docx":
-        text = docx2txt.process(file_path)
+        text = docx2txt.process(source)
     else:
         raise ValueError("Unsupported file type. Use PDF or DOCX.")
 
@@ -74,23 +118,17 @@ def extract_text_from_file(file) -> str:
 
 # SKILLS EXTRACTION
 
-def extract_skills(text: str):
-    text_lower = text.lower()
-    skills = set()
-
-    for skill in SKILL_KEYWORDS:
-        pattern = rf"\b{re.escape(skill.lower())}\b"
-        if re.search(pattern, text_lower):
-            skills.add(skill.lower())
-
+def extract_skills(text: Union[str, ResumeDocument]):
+    # One linear pass over the text for the whole taxonomy
+    skills = get_skill_matcher().find(_as_document(text).text_lower)
     return sorted(skills)
 
 
 # EDUCATION EXTRACTION
 
-def extract_education(text: str):
+def extract_education(text: Union[str, ResumeDocument]):
     education_found = set()
-    lines = text.splitlines()
+    lines = _as_document(text).lines
 
     STOP_WORDS = ["experience", "professional"]
 
@@ -128,8 +166,8 @@ def extract_education(text: str):
 
 # EXPERIENCE DETAILS EXTRACTION
 
-def extract_experience(text: str):
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
+def extract_experience(text: Union[str, ResumeDocument]):
+    lines = _as_document(text).content_lines
     experience_entries = []
 
     year_pattern = r'(19\d{2}|20\d{2})\s*[-–]\s*(19\d{2}|20\d{2})'
@@ -166,18 +204,110 @@ def extract_experience(text: str):
 
 # JOB TITLES (NLP)
 
-def extract_job_titles(text: str):
-    doc = nlp(text)
-    titles = set()
-
-    for ent in doc.ents:
+def _is_heading(line: str) -> bool:
+    words = line.split()
+    if not words or len(words) > 4:
+        return False
+    key = line.lower().strip(" :")
+    return key in SECTION_HEADINGS or (line.isupper() and len(line) > 3)
+
+
+def split_sections(text: str) -> List[str]:
+    """Split resume text at section headings (EXPERIENCE, Education, ...)"""
+    sections, current = [], []
+    for line in text.splitlines():
+        if _is_heading(line.strip()) and current:
+            sections.append("\n".join(current))
+            current = []
+        if line.strip():
+            current.append(line)
+    if current:
+        sections.append("\n".join(current))
+    return sections
+
+
+def chunk_for_ner(text: str, max_chars: int = None) -> List[str]:
+    """
+    NER input chunks: whole sections packed up to max_chars, with
+    oversized sections split on line boundaries.
+    """
+    max_chars = max_chars or settings.NER_MAX_CHUNK_CHARS
+    chunks, current = [], ""
+
+    def flush():
+        nonlocal current
+        if current:
+            chunks.append(current)
+            current = ""
+
+    for section in split_sections(text):
+        pieces = [section]
+        if len(section) > max_chars:
+            pieces, piece = [], ""
+            lines = [
+                line[i:i + max_chars]
+                for line in section.splitlines()
+                for i in range(0, len(line), max_chars)
+            ]
+            for line in lines:
+                if piece and len(piece) + len(line) + 1 > max_chars:
+                    pieces.append(piece)
+                    piece = ""
+                piece = f"{piece}\n{line}" if piece else line
+            pieces.append(piece)
+
+        for piece in pieces:
+            if current and len(current) + len(piece) + 1 > max_chars:
+                flush()
+            current = f"{current}\n{piece}" if current else piece
+    flush()
+    return chunks
+
+
+def _collect_org_titles(ents, titles: set):
+    for ent in ents:
         if ent.label_ == "ORG":
             if len(ent.text.split()) <= 4:
                 titles.add(ent.text)
 
+
+def extract_job_titles(text: Union[str, ResumeDocument]):
+    titles = set()
+
+    chunks = chunk_for_ner(_as_document(text).text)
+    for doc in nlp.pipe(chunks, batch_size=settings.NER_BATCH_SIZE):
+        _collect_org_titles(doc.ents, titles)
+
     return list(titles)
 
 
+def extract_job_titles_batch(
+    texts: List[Union[str, ResumeDocument]],
+    batch_size: int = None,
+    n_process: int = None
+) -> List[List[str]]:
+    """
+    Bulk variant of extract_job_titles: every chunk of every document goes
+    through a single nlp.pipe call (optionally multi-process).
+    """
+    batch_size = batch_size or settings.NER_BATCH_SIZE
+    n_process = n_process or settings.NER_N_PROCESS
+
+    chunk_tuples = [
+        (chunk, i)
+        for i, text in enumerate(texts)
+        for chunk in chunk_for_ner(_as_document(text).text)
+    ]
+
+    titles = [set() for _ in texts]
+    for doc, i in nlp.pipe(
+        chunk_tuples, as_tuples=True, batch_size=batch_size, n_process=n_process
+    ):
+        _collect_org_titles(doc.ents, titles[i])
+
+    return [list(t) for t in titles]
+
+
 # EXPERIENCE YEARS CALCULATION
 
 def calculate_total_experience(experience_entries):
@@ -195,13 +325,34 @@ def calculate_total_experience(experience_entries):
 
 # MAIN PARSER (PHASE-2 READY)
 
-def parse_resume(file) -> dict:
+def load_document(file) -> ResumeDocument:
+    """Extract a file's text exactly once into a ResumeDocument"""
+    start = time.perf_counter()
     text = extract_text_from_file(file)
+    source = file.filename if isinstance(file, UploadFile) else file
+
+    document = ResumeDocument(text=text, source=source)
+    document.timings_ms["extract"] = round((time.perf_counter() - start) * 1000, 2)
+    return document
+
 
-    skills = extract_skills(text)
-    education = extract_education(text)
-    experience_entries = extract_experience(text)
-    job_titles = extract_job_titles(text)
+def parse_document(document: ResumeDocument, ner: bool = True) -> dict:
+    """
+    Run every extractor stage over one already-extracted document,
+    recording per-stage timings in document.timings_ms.
+    With ner=False job_titles is left empty for a later batched NER pass
+    (see extract_job_titles_batch).
+    """
+    def timed(stage, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        document.timings_ms[stage] = round((time.perf_counter() - start) * 1000, 2)
+        return result
+
+    skills = timed("skills", extract_skills, document)
+    education = timed("education", extract_education, document)
+    experience_entries = timed("experience", extract_experience, document)
+    job_titles = timed("job_titles", extract_job_titles, document) if ner else []
     total_experience_years = calculate_total_experience(experience_entries)
 
     return {
@@ -212,3 +363,7 @@ def parse_resume(file) -> dict:
         "total_experience_years": total_experience_years,
         "parsed_at": datetime.utcnow().isoformat()
     }
+
+
+def parse_resume(file) -> dict:
+    return parse_document(load_document(file))
@@ -0,0 +1,127 @@
+import json
+import os
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Tuple
+
+from app.core.config import settings
+
+
+DEFAULT_TAXONOMY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data",
+    "skill_taxonomy.json"
+)
+
+# Characters that continue a skill token: "c" must not match inside "c#",
+# "java" must not match inside "javascript"
+_TOKEN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_#+")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_skill_text(text: str) -> str:
+    """Lowercase and collapse whitespace so "SQL\n  Server" matches "sql server" """
+    return _WHITESPACE.sub(" ", text.lower()).strip()
+
+
+# ---------- Aho-Corasick Automaton ----------
+class SkillMatcher:
+    """
+    Multi-pattern matcher over a skill taxonomy.
+
+    All skill names and aliases are compiled into one Aho-Corasick automaton,
+    so a resume is scanned once regardless of taxonomy size. Matches are
+    reported as canonical skill names and must sit on token boundaries.
+    """
+
+    def __init__(self, taxonomy: Dict[str, Iterable[str]]):
+        # Node 0 is the root; each node: transitions, failure link, outputs
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, str]]] = [[]]
+        self.size = 0
+
+        for canonical, aliases in taxonomy.items():
+            canonical_key = normalize_skill_text(canonical)
+            for term in {canonical, *aliases}:
+                term = normalize_skill_text(term)
+                if term:
+                    self._add(term, canonical_key)
+                    self.size += 1
+
+        self._build_failure_links()
+
+    def _add(self, term: str, canonical: str):
+        node = 0
+        for ch in term:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(term), canonical))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                # Inherit matches that end at the same position
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find(self, text: str) -> Set[str]:
+        """Canonical names of every skill or alias present in text"""
+        text = normalize_skill_text(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        length = len(text)
+        found = set()
+
+        node = 0
+        for end, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            if not out[node]:
+                continue
+
+            after_ok = end + 1 >= length or text[end + 1] not in _TOKEN_CHARS
+            if not after_ok:
+                continue
+            for term_len, canonical in out[node]:
+                start = end - term_len + 1
+                if start == 0 or text[start - 1] not in _TOKEN_CHARS:
+                    found.add(canonical)
+
+        return found
+
+
+# ---------- Taxonomy Loading ----------
+def load_taxonomy(path: str) -> Dict[str, List[str]]:
+    """
+    Read a taxonomy file: {"skills": [{"name": ..., "aliases": [...]}, ...]}
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    return {
+        entry["name"]: entry.get("aliases", [])
+        for entry in data.get("skills", [])
+    }
+
+
+@lru_cache(maxsize=None)
+def get_skill_matcher(path: str = "") -> SkillMatcher:
+    """Process-wide matcher for the configured taxonomy file"""
+    return SkillMatcher(load_taxonomy(path or settings.SKILL_TAXONOMY_PATH or DEFAULT_TAXONOMY_PATH))
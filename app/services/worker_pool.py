@@ -0,0 +1,137 @@
+import asyncio
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from app.core.config import settings
+from app.utils.metrics import registry
+
+
+# ---------- Worker Process Setup ----------
+def _init_worker():
+    """Load spaCy and the sentence encoder once per worker process"""
+    from app.services import resume_parser  # noqa: F401  (loads spaCy on import)
+    from app.services.embedding_service import get_model
+
+    get_model()
+
+
+def _run_task(fn, args, kwargs):
+    """Runs in the worker: the result plus the metrics the task recorded"""
+    return fn(*args, **kwargs), registry.drain()
+
+
+# ---------- Process Pool ----------
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.PARSER_POOL_SIZE,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                max_tasks_per_child=settings.PARSER_MAX_TASKS_PER_CHILD or None
+            )
+        return _pool
+
+
+def _reset_pool(broken: ProcessPoolExecutor):
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_pool(fn, *args, **kwargs):
+    """
+    Run a CPU-bound function in the parser process pool and await it.
+
+    Raises asyncio.TimeoutError after PARSER_TASK_TIMEOUT_SECONDS; the worker
+    keeps running to completion but its result is discarded. With
+    PARSER_POOL_SIZE=0 the function runs in the default thread pool instead.
+    """
+    loop = asyncio.get_running_loop()
+
+    if settings.PARSER_POOL_SIZE <= 0:
+        future = loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+        return await asyncio.wait_for(future, settings.PARSER_TASK_TIMEOUT_SECONDS)
+
+    pool = get_pool()
+    try:
+        future = loop.run_in_executor(pool, _run_task, fn, args, kwargs)
+        result, metrics = await asyncio.wait_for(future, settings.PARSER_TASK_TIMEOUT_SECONDS)
+        registry.merge(metrics)
+        return result
+    except BrokenProcessPool:
+        # A worker died (OOM, segfault in a native lib); start a fresh pool
+        _reset_pool(pool)
+        raise
+
+
+def call_in_pool(fn, *args, **kwargs):
+    """
+    Blocking counterpart of run_in_pool for background threads. Raises
+    concurrent.futures.TimeoutError after PARSER_TASK_TIMEOUT_SECONDS.
+    """
+    if settings.PARSER_POOL_SIZE <= 0:
+        return fn(*args, **kwargs)
+
+    pool = get_pool()
+    try:
+        future = pool.submit(_run_task, fn, args, kwargs)
+        result, metrics = future.result(timeout=settings.PARSER_TASK_TIMEOUT_SECONDS)
+        registry.merge(metrics)
+        return result
+    except BrokenProcessPool:
+        _reset_pool(pool)
+        raise
+
+
+def submit_to_pool(fn, *args, **kwargs) -> Future:
+    """
+    Non-blocking counterpart of call_in_pool for callers that keep several
+    tasks in flight (bulk imports). The returned future resolves to fn's
+    result; the caller applies its own timeout.
+    """
+    future = Future()
+    if settings.PARSER_POOL_SIZE <= 0:
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    pool = get_pool()
+
+    def finish(task):
+        try:
+            result, metrics = task.result()
+        except BaseException as exc:
+            if isinstance(exc, BrokenProcessPool):
+                _reset_pool(pool)
+            future.set_exception(exc)
+            return
+        registry.merge(metrics)
+        future.set_result(result)
+
+    try:
+        pool.submit(_run_task, fn, args, kwargs).add_done_callback(finish)
+    except BrokenProcessPool:
+        _reset_pool(pool)
+        raise
+    return future
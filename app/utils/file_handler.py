@@ -1,14 +1,57 @@
+import hashlib
 import os
+import shutil
+import tempfile
+from typing import Optional, Tuple
 from fastapi import UploadFile
 
 UPLOAD_DIR = "uploads/resumes"                       #Directory to store uploaded resumes
+CHUNK_SIZE = 1024 * 1024                             #Stream uploads in 1 MiB chunks
 
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-def save_resume_file(file: UploadFile) -> str:
-    file_path = os.path.join(UPLOAD_DIR, file.filename)
+def save_resume_file(
+    file: UploadFile,
+    directory: str = UPLOAD_DIR,
+    filename: Optional[str] = None
+) -> str:
+    """Stream an upload to disk in one pass without buffering it in memory"""
+    os.makedirs(directory, exist_ok=True)
+    file_path = os.path.join(directory, filename or os.path.basename(file.filename))
 
+    file.file.seek(0)
     with open(file_path, "wb") as f:
-        f.write(file.file.read())
+        shutil.copyfileobj(file.file, f, CHUNK_SIZE)
 
     return file_path
+
+
+def store_resume_file(file: UploadFile, directory: str = UPLOAD_DIR) -> Tuple[str, str]:
+    """
+    Stream an upload to content-addressed storage, hashing it on the way.
+    Returns (file_path, sha256); identical bytes always land on one path,
+    so same-named uploads from different users never collide.
+    """
+    os.makedirs(directory, exist_ok=True)
+    ext = os.path.splitext(file.filename)[1].lower()
+    digest = hashlib.sha256()
+
+    file.file.seek(0)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while chunk := file.file.read(CHUNK_SIZE):
+                digest.update(chunk)
+                f.write(chunk)
+
+        content_hash = digest.hexdigest()
+        file_dir = os.path.join(directory, content_hash[:2])
+        os.makedirs(file_dir, exist_ok=True)
+        file_path = os.path.join(file_dir, content_hash + ext)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return file_path, content_hash
@@ -0,0 +1,289 @@
+"""
+Minimal in-process metrics served in the Prometheus text format
+(see GET /metrics). Values are per API process: with several API workers,
+scrape each one or aggregate in Prometheus. Parser pool workers are never
+scraped; worker_pool ships what each task recorded back to the API
+process (registry.drain() there, registry.merge() here).
+"""
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Seconds; spans sub-millisecond regex stages up to slow PDFs / NER
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+# ---------- Metric Types ----------
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, help_text, labelnames=()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def drain(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge(self, values: Dict[LabelValues, float]):
+        with self._lock:
+            for key, value in values.items():
+                self._values[key] = self._values.get(key, 0.0) + value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count], sum
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, seconds: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += seconds
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def drain(self) -> Dict[LabelValues, Tuple[List[int], List[float]]]:
+        with self._lock:
+            series, self._series = self._series, {}
+        return series
+
+    def merge(self, series: Dict[LabelValues, Tuple[List[int], List[float]]]):
+        with self._lock:
+            for key, (counts, total) in series.items():
+                mine = self._series.get(key)
+                if mine is None:
+                    mine = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+                for i, count in enumerate(counts):
+                    mine[0][i] += count
+                mine[1][0] += total[0]
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(counts), total[0])) for key, (counts, total) in self._series.items())
+
+        lines = self.header()
+        bucket_names = self.labelnames + ("le",)
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(bucket_names, key + (_format_value(bound),))} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+# ---------- Registry ----------
+# A collector returns (name, kind, help, [(labels dict, value), ...]) for
+# values owned elsewhere, e.g. cache stats read at scrape time
+Collector = Callable[[], Iterable[Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]]]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Collector] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def drain(self) -> Dict[str, Dict]:
+        """Take (and reset) everything recorded so far, e.g. in a pool worker"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        drained = {metric.name: metric.drain() for metric in metrics}
+        return {name: values for name, values in drained.items() if values}
+
+    def merge(self, drained: Dict[str, Dict]):
+        """Add values drained in another process"""
+        for name, values in drained.items():
+            metric = self._metrics.get(name)
+            if metric is not None:
+                metric.merge(values)
+
+    def add_collector(self, collector: Collector):
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus text exposition format, version 0.0.4"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        lines = []
+        for metric in metrics:
+            lines += metric.render()
+
+        for collector in collectors:
+            try:
+                families = list(collector())
+            except Exception:
+                # A broken stats source must not take the whole scrape down
+                continue
+            for name, kind, help_text, samples in families:
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+                for labels, value in samples:
+                    lines.append(
+                        f"{name}{_format_labels(tuple(labels), tuple(labels.values()))} {_format_value(value)}"
+                    )
+
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+# ---------- Application Metrics ----------
+STAGE_SECONDS = registry.histogram(
+    "skillsync_resume_stage_seconds",
+    "Resume analysis time per pipeline stage",
+    ["stage"]
+)
+DOCUMENTS = registry.counter(
+    "skillsync_documents_total",
+    "Resume documents analyzed",
+    ["source", "outcome"]
+)
+MATCHER_SECONDS = registry.histogram(
+    "skillsync_matcher_seconds",
+    "Job matcher time per step (score = similarity over the catalog, load = job rows)",
+    ["direction", "step"]
+)
+JOBS_SCORED = registry.counter(
+    "skillsync_jobs_scored_total",
+    "Resume / job pairs scored by the matcher",
+    ["direction"]
+)
+ENCODER_SECONDS = registry.histogram(
+    "skillsync_encoder_batch_seconds",
+    "Sentence encoder forward pass time per batch"
+)
+ENCODER_TEXTS = registry.counter(
+    "skillsync_encoder_texts_total",
+    "Texts run through the sentence encoder"
+)
+DB_QUERY_SECONDS = registry.histogram(
+    "skillsync_db_query_seconds",
+    "Database statement execution time",
+    ["operation"]
+)
+DB_COMMIT_SECONDS = registry.histogram(
+    "skillsync_db_commit_seconds",
+    "Database session commit time"
+)
+HTTP_REQUESTS = registry.counter(
+    "skillsync_http_requests_total",
+    "HTTP requests by route template and status",
+    ["method", "route", "status"]
+)
+HTTP_SECONDS = registry.histogram(
+    "skillsync_http_request_seconds",
+    "HTTP request latency by route template",
+    ["method", "route"]
+)
+
+# Stage keys in timings_ms -> stage label
+_STAGE_NAMES = {"job_titles": "ner"}
+
+
+def record_stage_timings(timings_ms: Dict[str, float]):
+    """
+    Record the per-stage timings_ms of one analysis, in the process that
+    returns or stores the result (persist and queue_wait happen there).
+    """
+    for stage, ms in (timings_ms or {}).items():
+        STAGE_SECONDS.observe(ms / 1000, stage=_STAGE_NAMES.get(stage, stage))